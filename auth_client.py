@@ -6,7 +6,9 @@ Calls auth-mcp.urbancanary.workers.dev with fallback to environment variables.
 import os
 import httpx
 
-AUTH_MCP_URL = "https://auth-mcp.urbancanary.workers.dev"
+from minerva_jess import metrics
+
+AUTH_MCP_URL = os.environ.get("AUTH_MCP_URL", "https://auth-mcp.urbancanary.workers.dev")
 
 
 def get_api_key(key_name: str, requester: str = "") -> str:
@@ -15,15 +17,17 @@ def get_api_key(key_name: str, requester: str = "") -> str:
 
     if auth_token:
         try:
-            response = httpx.get(
-                f"{AUTH_MCP_URL}/key/{key_name}",
-                params={"requester": requester} if requester else {},
-                headers={"Authorization": f"Bearer {auth_token}"},
-                timeout=5.0,
-            )
+            with metrics.track_upstream("auth_mcp", "get_key"):
+                response = httpx.get(
+                    f"{AUTH_MCP_URL}/key/{key_name}",
+                    params={"requester": requester} if requester else {},
+                    headers={"Authorization": f"Bearer {auth_token}"},
+                    timeout=5.0,
+                )
             if response.status_code == 200:
                 data = response.json()
                 return data.get("key", data.get("value", ""))
+            metrics.record_upstream_error("auth_mcp", "get_key", f"http_{response.status_code}")
         except Exception:
             pass  # Fall back to environment variable
 
@@ -0,0 +1 @@
+"""Benchmark suites for Minerva-Jess."""
@@ -0,0 +1,107 @@
+"""
+JSON codec benchmark over a synthetic transcript corpus.
+
+Compares the old stdlib paths with minerva_jess.codec on the payloads
+that dominate JSON time: the transcripts data file (1,000 transcripts by
+default), the /api/transcripts response body and an Orca search
+response. Every installed codec backend is measured.
+
+Usage:
+    python -m benchmarks.codec_bench
+    python -m benchmarks.codec_bench --transcripts 1000 --repeat 7
+"""
+
+import argparse
+import json
+import random
+import sys
+import time
+from typing import Any, Callable, Optional
+
+import httpx
+from starlette.responses import JSONResponse
+
+from benchmarks.fake_orca import make_search_results
+from benchmarks.stubs import TRANSCRIPT_WORDS
+from minerva_jess import codec
+
+
+def make_transcripts(count: int = 1000, words: int = 1500, seed: int = 0) -> dict[str, Any]:
+    """Deterministic transcripts.json contents (video id -> transcript record)."""
+    rng = random.Random(seed)
+    corpus = {}
+    for i in range(count):
+        video_id = f"vid{i:08d}"
+        text = " ".join(rng.choice(TRANSCRIPT_WORDS) for _ in range(words))
+        corpus[video_id] = {
+            "video_id": video_id,
+            "title": f"Investment outlook {i} — marchés émergents",
+            "source": "video_mcp",
+            "language": "en",
+            "transcript": text,
+            "fetched_at": "2026-01-01T00:00:00",
+            "word_count": words,
+        }
+    return corpus
+
+
+def best_of(fn: Callable[[], Any], repeat: int) -> float:
+    """Best wall time in ms over `repeat` runs."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return min(timings) * 1000
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="JSON codec benchmark")
+    parser.add_argument("--transcripts", type=int, default=1000)
+    parser.add_argument("--words", type=int, default=1500, help="Words per transcript")
+    parser.add_argument("--results", type=int, default=500, help="Hits in the Orca payload")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    transcripts = make_transcripts(args.transcripts, args.words)
+    response_body = {"transcripts": transcripts, "count": len(transcripts)}
+    indented = json.dumps(transcripts, indent=2).encode()
+    search = json.dumps({"results": make_search_results(args.results)}).encode()
+
+    # Baseline: what the code did before the codec layer
+    baseline = {
+        "file write": lambda: json.dumps(transcripts, indent=2),
+        "file read": lambda: json.loads(indented),
+        "/api/transcripts render": lambda: JSONResponse(response_body),
+        "orca search decode": lambda: httpx.Response(200, content=search).json(),
+    }
+    base_ms = {name: best_of(fn, args.repeat) for name, fn in baseline.items()}
+
+    print(
+        f"corpus: {args.transcripts} transcripts, {len(indented) / 1e6:.1f} MB as indented JSON"
+    )
+    print(f"\n{'case':<26}{'backend':<10}{'ms':>10}{'stdlib ms':>12}{'speedup':>10}")
+    print("-" * 68)
+    for name in codec.available():
+        backend = codec.use(name)
+        compact = backend.dumps(transcripts, False)
+        cases = {
+            "file write": lambda: backend.dumps(transcripts, False),
+            "file read": lambda: backend.loads(compact),
+            "/api/transcripts render": lambda: backend.dumps(response_body, False),
+            "orca search decode": lambda: backend.loads(
+                httpx.Response(200, content=search).content
+            ),
+        }
+        for case, fn in cases.items():
+            ms = best_of(fn, args.repeat)
+            speedup = base_ms[case] / ms
+            print(f"{case:<26}{name:<10}{ms:>10.1f}{base_ms[case]:>12.1f}{speedup:>9.1f}x")
+        compact_mb, indented_mb = len(compact) / 1e6, len(indented) / 1e6
+        print(f"{'file size':<26}{name:<10}{compact_mb:>9.1f}M{indented_mb:>11.1f}M")
+    codec.use()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,104 @@
+"""
+In-process fake Orca gateway for SDK benchmarks and tests.
+
+Serves /video/search, /video/synthesize and /video/list from an
+httpx.MockTransport, so OrcaMCPClient runs its real request/decoding
+path with no network.
+
+Example:
+    orca = FakeOrca(results=200)
+    client = OrcaMCPClient(Settings(orca_url=FAKE_ORCA_URL))
+    orca.install(client)
+"""
+
+import json
+import random
+from typing import Any
+
+import httpx
+
+from minerva_jess.config import VIDEO_CATALOG
+
+FAKE_ORCA_URL = "http://orca.fake"
+
+WORDS = (
+    "the market outlook for emerging economies depends on rates inflation and "
+    "earnings growth while AI capex and semiconductor demand drive valuations"
+).split()
+
+
+def make_search_results(count: int, seed: int = 0, text_words: int = 80) -> list[dict[str, Any]]:
+    """Build a deterministic /video/search payload of `count` hits."""
+    rng = random.Random(seed)
+    catalog_ids = list(VIDEO_CATALOG)
+    results = []
+    for i in range(count):
+        # Mix catalogued ids (enriched) with unknown ones
+        video_id = catalog_ids[i % len(catalog_ids)] if i % 3 else f"vid{i:05d}"
+        start = rng.uniform(0, 1800)
+        results.append({
+            "video_id": video_id,
+            "title": "" if i % 2 else f"Video {video_id}",
+            "text": " ".join(rng.choice(WORDS) for _ in range(text_words)),
+            "start_time": start,
+            "end_time": start + rng.uniform(5, 60),
+            "score": round(1.0 - i / max(count, 1), 4),
+        })
+    return results
+
+
+def make_video_list(count: int = 40) -> list[dict[str, Any]]:
+    """Build a /video/list payload."""
+    catalog_ids = list(VIDEO_CATALOG)
+    videos = []
+    for i in range(count):
+        video_id = catalog_ids[i] if i < len(catalog_ids) else f"vid{i:05d}"
+        videos.append({
+            "video_id": video_id,
+            "title": f"Video {video_id}",
+            "duration": 300 + i,
+            "duration_formatted": f"{(300 + i) // 60}:{(300 + i) % 60:02d}",
+            "chapters": i % 5,
+        })
+    return videos
+
+
+class FakeOrca:
+    """Canned Orca responses served through httpx.MockTransport."""
+
+    def __init__(self, results: int = 50, videos: int = 40, answer_words: int = 200):
+        self.results = make_search_results(results)
+        self._search_bodies: dict[int, bytes] = {}
+        self.list_body = json.dumps({"videos": make_video_list(videos)}).encode()
+        self.answer = " ".join(WORDS[i % len(WORDS)] for i in range(answer_words))
+        self.calls: dict[str, int] = {}
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        path = request.url.path
+        self.calls[path] = self.calls.get(path, 0) + 1
+        headers = {"Content-Type": "application/json"}
+        if path == "/video/search":
+            limit = json.loads(request.content).get("max_results") or len(self.results)
+            return httpx.Response(200, content=self._search_body(limit), headers=headers)
+        if path == "/video/synthesize":
+            return httpx.Response(200, json={"answer": self.answer})
+        if path == "/video/list":
+            return httpx.Response(200, content=self.list_body, headers=headers)
+        if path == "/health":
+            return httpx.Response(200, json={"status": "ok"})
+        return httpx.Response(404, json={"error": "not found"})
+
+    def _search_body(self, limit: int) -> bytes:
+        """Encoded search payload truncated to `limit` hits (cached per limit)."""
+        body = self._search_bodies.get(limit)
+        if body is None:
+            body = json.dumps({"results": self.results[:limit]}).encode()
+            self._search_bodies[limit] = body
+        return body
+
+    def transport(self) -> httpx.MockTransport:
+        return httpx.MockTransport(self.handler)
+
+    def install(self, client: Any) -> None:
+        """Point an OrcaMCPClient at this fake."""
+        client._client = httpx.AsyncClient(base_url=FAKE_ORCA_URL, transport=self.transport())
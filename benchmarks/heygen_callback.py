@@ -0,0 +1,74 @@
+"""
+Local HeyGen callback sender.
+
+Sends signed video_translate webhooks to a running web.py, the way
+HeyGen would, so the webhook path can be exercised without a real
+translation. Pass --job-id (the video_translate_id stored in
+translations.json) or --callback-id ("video_id:language").
+
+Usage:
+    HEYGEN_WEBHOOK_SECRET=dev uvicorn web:app --port 8000
+    python -m benchmarks.heygen_callback --secret dev --job-id abc123 \\
+        --output-url https://example.com/translated.mp4
+    python -m benchmarks.heygen_callback --secret dev --callback-id VIDEO:French --fail "Bad audio"
+"""
+
+import argparse
+from typing import Any, Optional
+
+import httpx
+
+from minerva_jess import codec
+from minerva_jess.webhooks import sign
+
+
+def make_event(
+    job_id: Optional[str] = None,
+    callback_id: Optional[str] = None,
+    output_url: Optional[str] = None,
+    error: Optional[str] = None,
+) -> dict[str, Any]:
+    """A video_translate.success (or .fail, when `error` is given) event."""
+    data: dict[str, Any] = {}
+    if job_id:
+        data["video_translate_id"] = job_id
+    if callback_id:
+        data["callback_id"] = callback_id
+    if error is not None:
+        return {"event_type": "video_translate.fail", "event_data": {**data, "msg": error}}
+    return {"event_type": "video_translate.success", "event_data": {**data, "url": output_url}}
+
+
+def send_event(url: str, secret: str, event: dict[str, Any]) -> httpx.Response:
+    """POST an event signed with `secret`."""
+    body = codec.dumps(event)
+    return httpx.post(
+        url,
+        content=body,
+        headers={"Content-Type": "application/json", "Signature": sign(secret, body)},
+        timeout=10,
+    )
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Send a signed HeyGen translation callback")
+    parser.add_argument("--url", default="http://127.0.0.1:8000/api/webhooks/heygen")
+    parser.add_argument("--secret", required=True, help="HEYGEN_WEBHOOK_SECRET of the server")
+    parser.add_argument("--job-id", help="video_translate_id of the job")
+    parser.add_argument("--callback-id", help="video_id:language the job was submitted for")
+    parser.add_argument("--output-url", default="https://example.com/translated.mp4")
+    parser.add_argument("--fail", metavar="MESSAGE", help="Send a failure with this message")
+    parser.add_argument("--repeat", type=int, default=1, help="Deliveries (to check idempotency)")
+    args = parser.parse_args(argv)
+    if not args.job_id and not args.callback_id:
+        parser.error("--job-id or --callback-id is required")
+
+    event = make_event(args.job_id, args.callback_id, args.output_url, args.fail)
+    for _ in range(args.repeat):
+        response = send_event(args.url, args.secret, event)
+        print(response.status_code, response.text)
+    return 0 if response.is_success else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
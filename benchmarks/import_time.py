@@ -0,0 +1,99 @@
+"""
+Cold import-time benchmark with regression budgets.
+
+Each target is imported in a fresh interpreter several times; the median
+wall time is compared against its budget and the run fails if any
+target is over. Also checks that importing the bare package stays free
+of heavy dependencies.
+
+Usage:
+    python -m benchmarks.import_time
+    python -m benchmarks.import_time --runs 9 --scale 1.5
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+from typing import Optional
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# (statement, budget in ms)
+TARGETS = [
+    ("import minerva_jess", 50),
+    ("from minerva_jess import JessAgent", 400),
+    ("from minerva_jess.orca_client import OrcaMCPClient", 600),
+    ("import web", 1500),
+]
+
+# Modules `import minerva_jess` must not load
+HEAVY_MODULES = ("pydantic", "pydantic_settings", "httpx", "yaml", "anthropic")
+
+_PROBE = """
+import json, sys, time
+start = time.perf_counter()
+{statement}
+elapsed = time.perf_counter() - start
+print(json.dumps({{"ms": elapsed * 1000, "modules": sorted(sys.modules)}}))
+"""
+
+
+def measure(statement: str) -> tuple[float, list[str]]:
+    """Import time (ms) and loaded modules for one fresh interpreter."""
+    out = subprocess.run(
+        [sys.executable, "-c", _PROBE.format(statement=statement)],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    data = json.loads(out.strip().splitlines()[-1])
+    return data["ms"], data["modules"]
+
+
+def heavy_modules_loaded(statement: str = "import minerva_jess") -> list[str]:
+    """Heavy dependencies loaded by `statement`."""
+    _, modules = measure(statement)
+    return [m for m in HEAVY_MODULES if m in modules]
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Cold import-time budgets")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--scale", type=float, default=1.0, help="Multiply every budget")
+    args = parser.parse_args(argv)
+
+    failures = []
+    print(f"{'statement':<52}{'median ms':>12}{'budget ms':>12}")
+    print("-" * 76)
+    for statement, budget in TARGETS:
+        try:
+            timings = [measure(statement)[0] for _ in range(args.runs)]
+        except subprocess.CalledProcessError as e:
+            print(f"{statement:<52}{'error':>12}")
+            failures.append(f"{statement}: {e.stderr.strip().splitlines()[-1]}")
+            continue
+        median = statistics.median(timings)
+        limit = budget * args.scale
+        print(f"{statement:<52}{median:>12.1f}{limit:>12.0f}")
+        if median > limit:
+            failures.append(f"{statement}: {median:.1f} ms > {limit:.0f} ms")
+
+    heavy = heavy_modules_loaded()
+    if heavy:
+        failures.append(f"import minerva_jess loads {', '.join(heavy)}")
+
+    if failures:
+        print("\nOver budget:")
+        for line in failures:
+            print(f"  {line}")
+        return 1
+    print("\nAll imports within budget")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
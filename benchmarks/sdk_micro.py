@@ -0,0 +1,266 @@
+"""
+Micro-benchmarks for minerva_jess CPU-side hot paths.
+
+Measures ops/sec (best of several repeats) and peak allocation per op
+(tracemalloc) for model parsing, Orca response decoding, query routing
+and an end-to-end JessAgent.query against an in-process fake Orca.
+
+Usage:
+    python -m benchmarks.sdk_micro
+    python -m benchmarks.sdk_micro --only search --repeat 7
+    python -m benchmarks.sdk_micro --compare benchmarks/results/sdk_micro-abc1234.json
+"""
+
+import argparse
+import asyncio
+import gc
+import json
+import platform
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Optional, Union
+
+from benchmarks.fake_orca import FAKE_ORCA_URL, FakeOrca, make_search_results
+from benchmarks.web_load import git_commit
+from minerva_jess.agent import JessAgent
+from minerva_jess.config import AgentConfig, Settings
+from minerva_jess.intents import DEFAULT_INTENTS, IntentRouter
+from minerva_jess.models import VideoSegment
+from minerva_jess.orca_client import OrcaMCPClient
+from minerva_jess.segments import SegmentTable
+
+RESULTS_DIR = Path(__file__).resolve().parent / "results"
+
+Op = Callable[[], Union[Any, Awaitable[Any]]]
+
+
+def query_corpus(size: int = 1000, seed: int = 0) -> list[str]:
+    """Deterministic mix of help-style and search queries."""
+    rng = random.Random(seed)
+    searches = [
+        "What did Andy say about AI?", "market outlook", "Tell me about ASEAN markets",
+        "China R&D and EVs", "inflation and real assets", "tariffs impact on Asia",
+        "semiconductor supply chain risks", "is the magnificent seven overvalued",
+    ]
+    helps = [
+        "help", "what should i watch", "most popular videos", "latest videos",
+        "what videos do you have", "list videos", "featured", "where to start",
+    ]
+    corpus = []
+    for _ in range(size):
+        query = rng.choice(helps if rng.random() < 0.3 else searches)
+        if rng.random() < 0.5:
+            query = f"@{rng.choice(['jess', 'Jess', 'JESS'])} {query}"
+        corpus.append(query)
+    return corpus
+
+
+class Benchmark:
+    """A named operation measured in batches of `number` calls."""
+
+    def __init__(self, name: str, op: Op, number: int, is_async: bool = False):
+        self.name = name
+        self.op = op
+        self.number = number
+        self.is_async = is_async
+
+    def _run_batch(self, loop: asyncio.AbstractEventLoop, number: int) -> float:
+        op = self.op
+        if self.is_async:
+            async def batch() -> float:
+                start = time.perf_counter()
+                for _ in range(number):
+                    await op()
+                return time.perf_counter() - start
+            return loop.run_until_complete(batch())
+        start = time.perf_counter()
+        for _ in range(number):
+            op()
+        return time.perf_counter() - start
+
+    def run(self, loop: asyncio.AbstractEventLoop, repeat: int) -> dict[str, Any]:
+        self._run_batch(loop, max(1, self.number // 10))  # warm-up
+
+        gc.collect()
+        gc.disable()
+        try:
+            timings = [self._run_batch(loop, self.number) for _ in range(repeat)]
+        finally:
+            gc.enable()
+
+        # Peak allocation for a single call, median over a few calls
+        peaks = []
+        tracemalloc.start()
+        try:
+            for _ in range(5):
+                tracemalloc.reset_peak()
+                baseline = tracemalloc.get_traced_memory()[0]
+                self._run_batch(loop, 1)
+                peaks.append(tracemalloc.get_traced_memory()[1] - baseline)
+        finally:
+            tracemalloc.stop()
+
+        best = min(timings)
+        return {
+            "number": self.number,
+            "repeat": repeat,
+            "ops_per_sec": round(self.number / best, 2),
+            "best_us_per_op": round(1e6 * best / self.number, 3),
+            "median_us_per_op": round(1e6 * statistics.median(timings) / self.number, 3),
+            "peak_alloc_kib_per_op": round(statistics.median(peaks) / 1024, 2),
+        }
+
+
+def build_benchmarks(results: int) -> list[Benchmark]:
+    """Set up every benchmark case."""
+    # Raw code paths are measured with response caching off
+    settings = Settings(orca_url=FAKE_ORCA_URL, orca_cache_enabled=False)
+    config = AgentConfig(config_path=Path("/nonexistent/config.yaml"))
+    payload = make_search_results(results)
+    corpus = query_corpus()
+    orca = FakeOrca(results=results)
+
+    client = OrcaMCPClient(settings)
+    orca.install(client)
+
+    agent = JessAgent(settings, config)
+    orca.install(agent.client)
+
+    cached_agent = JessAgent(Settings(orca_url=FAKE_ORCA_URL), config)
+    orca.install(cached_agent.client)
+
+    batch = [f"topic {i}" for i in range(50)]
+
+    async def query_batch() -> int:
+        return sum([1 async for _ in agent.query_many(batch, concurrency=8)])
+
+    def parse_segments() -> list[VideoSegment]:
+        return [VideoSegment.from_search_result(item) for item in payload]
+
+    def parse_table() -> SegmentTable:
+        return SegmentTable.from_results(payload)
+
+    def parse_table_top5() -> list[VideoSegment]:
+        return SegmentTable.from_results(payload).to_segments(limit=5)
+
+    def route_queries() -> int:
+        return sum(agent._is_help_query(agent._clean_query(q)) for q in corpus)
+
+    def clean_queries() -> list[str]:
+        return [agent._clean_query(q) for q in corpus]
+
+    # Same corpus against ~3,000 extra phrases: routing cost should stay flat
+    big_router = IntentRouter({
+        **DEFAULT_INTENTS,
+        "topics": {"phrases": [f"subject {i} briefing" for i in range(3000)]},
+    })
+    cleaned = [agent._clean_query(q) for q in corpus]
+
+    def route_big() -> int:
+        return sum(big_router.route(q) is not None for q in cleaned)
+
+    # The substring scan the router replaced, over the same default phrases
+    phrases = [p.lower() for spec in DEFAULT_INTENTS.values() for p in spec["phrases"]]
+
+    def substring_scan() -> int:
+        return sum(any(p in q.lower() for p in phrases) for q in cleaned)
+
+    def help_queries() -> int:
+        return sum(agent._is_help_query(q) for q in corpus)
+
+    return [
+        Benchmark(f"from_search_result[{results}]", parse_segments, number=20),
+        Benchmark(f"segment_table[{results}]", parse_table, number=20),
+        Benchmark(f"segment_table_top5[{results}]", parse_table_top5, number=20),
+        Benchmark(f"orca_search_decode[{results}]", lambda: client.search("AI bubble", results),
+                  number=20, is_async=True),
+        Benchmark(f"orca_search_table[{results}]",
+                  lambda: client.search_table("AI bubble", results), number=20, is_async=True),
+        Benchmark(f"clean_query[{len(corpus)}]", clean_queries, number=50),
+        Benchmark(f"is_help_query[{len(corpus)}]", help_queries, number=50),
+        Benchmark(f"route_query[{len(corpus)}]", route_queries, number=50),
+        Benchmark(f"route_query_3k_phrases[{len(corpus)}]", route_big, number=50),
+        Benchmark(f"substring_scan[{len(corpus)}]", substring_scan, number=50),
+        Benchmark("agent_query_search", lambda: agent.query("What did Andy say about AI?"),
+                  number=50, is_async=True),
+        Benchmark("agent_query_help", lambda: agent.query("most popular videos"),
+                  number=50, is_async=True),
+        Benchmark("agent_query_many[50,c=8]", query_batch, number=5, is_async=True),
+        Benchmark("agent_query_search_cached",
+                  lambda: cached_agent.query("What did Andy say about AI?"),
+                  number=200, is_async=True),
+    ]
+
+
+def compare(current: dict[str, Any], baseline: dict[str, Any], threshold: float) -> list[str]:
+    """Return benchmarks whose ops/sec fell by more than `threshold`."""
+    regressions = []
+    for name, result in current["results"].items():
+        base = baseline.get("results", {}).get(name)
+        if base and result["ops_per_sec"] < base["ops_per_sec"] * (1 - threshold):
+            regressions.append(f"{name}: {base['ops_per_sec']} -> {result['ops_per_sec']} ops/s")
+    return regressions
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Micro-benchmarks for minerva_jess hot paths")
+    parser.add_argument("--results", type=int, default=500, help="Search hits per payload")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--only", nargs="*", help="Run benchmarks whose name contains any of these")
+    parser.add_argument("--output", type=Path, help="Result JSON path")
+    parser.add_argument("--compare", type=Path, help="Baseline result JSON to compare against")
+    parser.add_argument("--threshold", type=float, default=0.15, help="Allowed regression fraction")
+    args = parser.parse_args(argv)
+
+    benchmarks = build_benchmarks(args.results)
+    if args.only:
+        benchmarks = [b for b in benchmarks if any(o in b.name for o in args.only)]
+
+    loop = asyncio.new_event_loop()
+    results = {}
+    try:
+        print(f"{'benchmark':<32}{'ops/sec':>14}{'us/op':>12}{'peak KiB/op':>14}")
+        print("-" * 72)
+        for bench in benchmarks:
+            r = results[bench.name] = bench.run(loop, args.repeat)
+            print(
+                f"{bench.name:<32}{r['ops_per_sec']:>14}{r['best_us_per_op']:>12}"
+                f"{r['peak_alloc_kib_per_op']:>14}"
+            )
+    finally:
+        loop.close()
+
+    report = {
+        "meta": {
+            "commit": git_commit(),
+            "timestamp": datetime.now().isoformat(),
+            "python": platform.python_version(),
+            "results_per_payload": args.results,
+        },
+        "results": results,
+    }
+    output = args.output or RESULTS_DIR / f"sdk_micro-{report['meta']['commit']}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    with open(output, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"\nSaved {output}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            regressions = compare(report, json.load(f), args.threshold)
+        if regressions:
+            print("\nRegressions:")
+            for line in regressions:
+                print(f"  {line}")
+            return 1
+        print(f"\nNo regressions against {args.compare}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,230 @@
+"""
+Local stand-in servers for the services web.py depends on.
+
+Each stub is a threaded stdlib HTTP server on an ephemeral port with
+configurable latency and error injection, so benchmarks never touch
+Video MCP, HeyGen, Anthropic or auth-mcp.
+
+Example:
+    with UpstreamStubs(StubConfig(latency=0.05, error_rate=0.01)) as stubs:
+        env = stubs.env()   # VIDEO_MCP_URL, HEYGEN_API_URL, ...
+"""
+
+import json
+import random
+import re
+import threading
+import time
+import uuid
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Optional
+
+# Synthetic transcript used for every video
+TRANSCRIPT_WORDS = (
+    "markets valuations earnings growth inflation rates china technology "
+    "semiconductors energy dividends outlook risk portfolio"
+).split()
+
+
+@dataclass
+class StubConfig:
+    """Latency and failure behaviour for a stub."""
+
+    latency: float = 0.0          # Mean added latency (seconds)
+    jitter: float = 0.0           # Uniform +/- jitter (seconds)
+    error_rate: float = 0.0       # Fraction of requests that fail
+    error_status: int = 503       # Status code for injected failures
+    transcript_segments: int = 200
+
+    def delay(self) -> None:
+        """Sleep for the configured latency."""
+        wait = self.latency + random.uniform(-self.jitter, self.jitter)
+        if wait > 0:
+            time.sleep(wait)
+
+    def should_fail(self) -> bool:
+        return self.error_rate > 0 and random.random() < self.error_rate
+
+
+Route = Callable[["StubHandler", dict[str, Any]], tuple[int, dict[str, Any]]]
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """Dispatches requests to the owning server's route table."""
+
+    server: "StubServer"
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass  # Keep benchmark output clean
+
+    def _handle(self, method: str) -> None:
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length) if length else b""
+        try:
+            payload = json.loads(body) if body else {}
+        except ValueError:
+            payload = {}
+
+        config = self.server.config
+        config.delay()
+        self.server.requests += 1
+
+        if config.should_fail():
+            status, data = config.error_status, {"error": "injected failure"}
+        else:
+            status, data = self.server.dispatch(self, method, payload)
+
+        encoded = json.dumps(data).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(encoded)))
+        self.end_headers()
+        self.wfile.write(encoded)
+
+    def do_GET(self) -> None:
+        self._handle("GET")
+
+    def do_POST(self) -> None:
+        self._handle("POST")
+
+
+class StubServer(ThreadingHTTPServer):
+    """HTTP server with a (method, path regex) route table."""
+
+    daemon_threads = True
+
+    def __init__(
+        self,
+        name: str,
+        routes: dict[tuple[str, str], Route],
+        config: StubConfig,
+        port: int = 0,
+    ):
+        super().__init__(("127.0.0.1", port), StubHandler)
+        self.name = name
+        self.config = config
+        self.requests = 0
+        self._routes = [(m, re.compile(p), fn) for (m, p), fn in routes.items()]
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def dispatch(
+        self, handler: StubHandler, method: str, payload: dict[str, Any]
+    ) -> tuple[int, dict[str, Any]]:
+        path = handler.path.split("?", 1)[0]
+        for route_method, pattern, fn in self._routes:
+            match = pattern.fullmatch(path)
+            if route_method == method and match:
+                return fn(handler, {**payload, **match.groupdict()})
+        return 404, {"error": f"no stub route for {method} {path}"}
+
+    def start(self) -> "StubServer":
+        self._thread = threading.Thread(target=self.serve_forever, name=self.name, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self.shutdown()
+        self.server_close()
+
+
+# =============================================================================
+# Route handlers
+# =============================================================================
+
+def _video_mcp_transcript(handler: StubHandler, payload: dict[str, Any]) -> tuple[int, dict]:
+    video_id = payload.get("arguments", {}).get("video_id", "unknown")
+    rng = random.Random(video_id)
+    segments = []
+    for i in range(handler.server.config.transcript_segments):
+        text = " ".join(rng.choice(TRANSCRIPT_WORDS) for _ in range(12))
+        segments.append({
+            "text": text,
+            "start_time": i * 5.0,
+            "end_time": i * 5.0 + 5.0,
+            "speaker": "A" if i % 7 else "B",
+        })
+    return 200, {"video_id": video_id, "title": f"Video {video_id}", "segments": segments}
+
+
+def _heygen_submit(handler: StubHandler, payload: dict[str, Any]) -> tuple[int, dict]:
+    return 200, {"data": {"video_translate_id": uuid.uuid4().hex}}
+
+
+def _heygen_status(handler: StubHandler, payload: dict[str, Any]) -> tuple[int, dict]:
+    job_id = payload["job_id"]
+    return 200, {"data": {"status": "completed", "url": f"https://cdn.test/{job_id}.mp4"}}
+
+
+def _anthropic_messages(handler: StubHandler, payload: dict[str, Any]) -> tuple[int, dict]:
+    prompt = payload.get("messages", [{}])[0].get("content", "")
+    return 200, {
+        "id": f"msg_{uuid.uuid4().hex[:24]}",
+        "type": "message",
+        "role": "assistant",
+        "model": payload.get("model", "stub"),
+        "content": [{"type": "text", "text": "Stub answer. " * 40}],
+        "stop_reason": "end_turn",
+        "stop_sequence": None,
+        "usage": {"input_tokens": len(str(prompt).split()), "output_tokens": 80},
+    }
+
+
+def _auth_key(handler: StubHandler, payload: dict[str, Any]) -> tuple[int, dict]:
+    return 200, {"key": f"stub-{payload['key_name'].lower()}"}
+
+
+STUB_ROUTES: dict[str, dict[tuple[str, str], Route]] = {
+    "video_mcp": {("POST", r"/mcp/tools/call"): _video_mcp_transcript},
+    "heygen": {
+        ("POST", r"/v2/video_translate"): _heygen_submit,
+        ("GET", r"/v2/video_translate/(?P<job_id>[^/]+)"): _heygen_status,
+    },
+    "anthropic": {("POST", r"/v1/messages"): _anthropic_messages},
+    "auth_mcp": {("GET", r"/key/(?P<key_name>[^/]+)"): _auth_key},
+}
+
+
+@dataclass
+class UpstreamStubs:
+    """Starts one stub server per upstream service."""
+
+    default: StubConfig = field(default_factory=StubConfig)
+    overrides: dict[str, StubConfig] = field(default_factory=dict)
+    servers: dict[str, StubServer] = field(default_factory=dict)
+
+    def start(self) -> "UpstreamStubs":
+        for name, routes in STUB_ROUTES.items():
+            config = self.overrides.get(name, self.default)
+            self.servers[name] = StubServer(name, routes, config).start()
+        return self
+
+    def stop(self) -> None:
+        for server in self.servers.values():
+            server.stop()
+        self.servers.clear()
+
+    def env(self) -> dict[str, str]:
+        """Environment variables pointing web.py at the stubs."""
+        return {
+            "VIDEO_MCP_URL": self.servers["video_mcp"].url,
+            "HEYGEN_API_URL": self.servers["heygen"].url,
+            "ANTHROPIC_BASE_URL": self.servers["anthropic"].url,
+            "AUTH_MCP_URL": self.servers["auth_mcp"].url,
+            "AUTH_MCP_TOKEN": "bench-token",
+        }
+
+    def request_counts(self) -> dict[str, int]:
+        return {name: server.requests for name, server in self.servers.items()}
+
+    def __enter__(self) -> "UpstreamStubs":
+        return self.start()
+
+    def __exit__(self, *exc: Any) -> None:
+        self.stop()
@@ -0,0 +1,119 @@
+"""
+Local stand-in for an OpenTelemetry collector.
+
+Accepts OTLP/HTTP JSON on POST /v1/traces (what tracing.OtlpHttpExporter
+sends), keeps the spans in memory, optionally appends them to a JSONL
+file, and prints a per-stage latency breakdown on exit, so a slow
+answer can be attributed without running a real tracing backend.
+
+Usage:
+    python -m benchmarks.trace_collector --port 4318 --out data/collected_spans.jsonl
+    JESS_TRACE_SAMPLE_RATE=1 JESS_TRACE_OTLP_ENDPOINT=http://127.0.0.1:4318/v1/traces \\
+        uvicorn web:app --port 8000
+"""
+
+import argparse
+import json
+import statistics
+import threading
+from pathlib import Path
+from typing import Any, Optional
+
+from benchmarks.stubs import StubConfig, StubHandler, StubServer
+
+
+def _attribute(value: dict[str, Any]) -> Any:
+    """Decode an OTLP/JSON AnyValue."""
+    for key in ("stringValue", "boolValue", "doubleValue"):
+        if key in value:
+            return value[key]
+    if "intValue" in value:
+        return int(value["intValue"])
+    return None
+
+
+def flatten(body: dict[str, Any]) -> list[dict[str, Any]]:
+    """Spans of an ExportTraceServiceRequest, in the JSONL export shape."""
+    spans = []
+    for resource_spans in body.get("resourceSpans", []):
+        for scope_spans in resource_spans.get("scopeSpans", []):
+            for s in scope_spans.get("spans", []):
+                start, end = int(s["startTimeUnixNano"]), int(s["endTimeUnixNano"])
+                status = s.get("status", {})
+                spans.append({
+                    "trace_id": s["traceId"],
+                    "span_id": s["spanId"],
+                    "parent_id": s.get("parentSpanId") or None,
+                    "name": s["name"],
+                    "start_ns": start,
+                    "end_ns": end,
+                    "duration_ms": round((end - start) / 1e6, 3),
+                    "status": "error" if status.get("code") == 2 else "ok",
+                    "error": status.get("message") or None,
+                    "attributes": {
+                        a["key"]: _attribute(a.get("value", {})) for a in s.get("attributes", [])
+                    },
+                })
+    return spans
+
+
+class TraceCollector(StubServer):
+    """OTLP/HTTP JSON receiver on an ephemeral (or given) port."""
+
+    def __init__(self, out: Optional[Path] = None, port: int = 0):
+        routes = {("POST", r"/v1/traces"): self._receive}
+        super().__init__("trace_collector", routes, StubConfig(), port=port)
+        self.out = out
+        self.spans: list[dict[str, Any]] = []
+        self._lock = threading.Lock()
+
+    @property
+    def endpoint(self) -> str:
+        return f"{self.url}/v1/traces"
+
+    def _receive(self, handler: StubHandler, payload: dict[str, Any]) -> tuple[int, dict]:
+        spans = flatten(payload)
+        with self._lock:
+            self.spans.extend(spans)
+            if self.out is not None:
+                with open(self.out, "a") as f:
+                    f.writelines(json.dumps(s) + "\n" for s in spans)
+        return 200, {"partialSuccess": {}}
+
+    def breakdown(self) -> list[tuple[str, int, float, float]]:
+        """(span name, count, median ms, max ms) sorted by total time."""
+        by_name: dict[str, list[float]] = {}
+        with self._lock:
+            for s in self.spans:
+                by_name.setdefault(s["name"], []).append(s["duration_ms"])
+        rows = [
+            (name, len(values), statistics.median(values), max(values))
+            for name, values in by_name.items()
+        ]
+        return sorted(rows, key=lambda r: r[1] * r[2], reverse=True)
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="OTLP/HTTP JSON collector stand-in")
+    parser.add_argument("--port", type=int, default=4318)
+    parser.add_argument("--out", type=Path, default=None, help="Append spans to this JSONL file")
+    args = parser.parse_args(argv)
+
+    collector = TraceCollector(out=args.out, port=args.port).start()
+    print(f"Collecting spans at {collector.endpoint} (Ctrl-C to stop)")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        collector.stop()
+
+    print(f"\n{'span':<44}{'count':>8}{'median ms':>12}{'max ms':>12}")
+    print("-" * 76)
+    for name, count, median, worst in collector.breakdown():
+        print(f"{name:<44}{count:>8}{median:>12.1f}{worst:>12.1f}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,280 @@
+"""
+Load-test benchmark for web.py.
+
+Starts local stubs for every upstream (see stubs.py), runs web.py under
+uvicorn against a throwaway data directory, drives each endpoint with a
+concurrent load generator and reports req/s and latency percentiles.
+Results are written as JSON so runs can be compared across commits.
+
+Usage:
+    python -m benchmarks.web_load --concurrency 16 --duration 10
+    python -m benchmarks.web_load --latency 0.05 --error-rate 0.02
+    python -m benchmarks.web_load --compare benchmarks/results/web_load-abc1234.json
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import shutil
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from dataclasses import asdict
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Optional
+
+import httpx
+
+from benchmarks.stubs import StubConfig, UpstreamStubs
+
+ROOT = Path(__file__).resolve().parent.parent
+RESULTS_DIR = Path(__file__).resolve().parent / "results"
+
+# name -> (method, path template, json body template)
+SCENARIOS: dict[str, tuple[str, str, Optional[dict[str, Any]]]] = {
+    "health": ("GET", "/health", None),
+    "videos": ("GET", "/api/videos", None),
+    "translations": ("GET", "/api/translations", None),
+    "transcript": ("GET", "/api/transcript/{video_id}?refresh=true", None),
+    "summary": ("GET", "/api/video/summary/{video_id}", None),
+    "ask": ("POST", "/api/video/ask", {
+        "video_id": "{video_id}",
+        "question": "What is the outlook?",
+    }),
+    "translate": ("POST", "/api/translate", {
+        "video_id": "{video_id}",
+        "video_url": "https://www.youtube.com/watch?v={video_id}",
+        "title": "Benchmark",
+        "language": "Spanish",
+    }),
+    "translations_check": ("POST", "/api/translations/check", None),
+}
+
+
+def percentile(sorted_values: list[float], pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(0, min(len(sorted_values) - 1, int(round(pct / 100 * len(sorted_values))) - 1))
+    return sorted_values[rank]
+
+
+def git_commit() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=ROOT, capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except Exception:
+        return "unknown"
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _fill(template: Any, video_id: str) -> Any:
+    """Substitute {video_id} in a path or JSON body template."""
+    if isinstance(template, str):
+        return template.replace("{video_id}", video_id)
+    if isinstance(template, dict):
+        return {k: _fill(v, video_id) for k, v in template.items()}
+    return template
+
+
+def prepare_data_dir() -> tuple[Path, list[str]]:
+    """Seed a temp data dir with the video cache; return it and the video ids."""
+    data_dir = Path(tempfile.mkdtemp(prefix="jess-bench-"))
+    source = ROOT / "data" / "videos_cache.json"
+    shutil.copy(source, data_dir / "videos_cache.json")
+    with open(source) as f:
+        video_ids = [v["video_id"] for v in json.load(f).get("videos", [])]
+    return data_dir, video_ids
+
+
+def start_web(
+    env: dict[str, str], port: int, workers: int, verbose: bool = False
+) -> subprocess.Popen:
+    """Launch web.py under uvicorn and wait for /health."""
+    cmd = [
+        sys.executable, "-m", "uvicorn", "web:app",
+        "--host", "127.0.0.1", "--port", str(port),
+        "--workers", str(workers), "--log-level", "warning",
+    ]
+    output = None if verbose else subprocess.DEVNULL
+    proc = subprocess.Popen(
+        cmd, cwd=ROOT, env={**os.environ, **env}, stdout=output, stderr=output
+    )
+    deadline = time.monotonic() + 30
+    while time.monotonic() < deadline:
+        try:
+            if httpx.get(f"http://127.0.0.1:{port}/health", timeout=1).status_code == 200:
+                return proc
+        except httpx.HTTPError:
+            pass
+        if proc.poll() is not None:
+            raise RuntimeError("web.py exited during startup")
+        time.sleep(0.2)
+    proc.terminate()
+    raise RuntimeError("web.py did not become healthy within 30s")
+
+
+async def run_scenario(
+    base_url: str,
+    name: str,
+    video_ids: list[str],
+    concurrency: int,
+    duration: float,
+) -> dict[str, Any]:
+    """Drive one endpoint with `concurrency` workers for `duration` seconds."""
+    method, path, body = SCENARIOS[name]
+    latencies: list[float] = []
+    errors: dict[str, int] = {}
+    deadline = time.perf_counter() + duration
+
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(base_url=base_url, timeout=60, limits=limits) as client:
+
+        async def worker(offset: int) -> None:
+            i = offset
+            while time.perf_counter() < deadline:
+                video_id = video_ids[i % len(video_ids)]
+                i += concurrency
+                start = time.perf_counter()
+                try:
+                    response = await client.request(
+                        method, _fill(path, video_id), json=_fill(body, video_id)
+                    )
+                    if response.status_code >= 400:
+                        key = str(response.status_code)
+                        errors[key] = errors.get(key, 0) + 1
+                except httpx.HTTPError as e:
+                    errors[type(e).__name__] = errors.get(type(e).__name__, 0) + 1
+                latencies.append(time.perf_counter() - start)
+
+        started = time.perf_counter()
+        await asyncio.gather(*(worker(i) for i in range(concurrency)))
+        elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        "requests": len(latencies),
+        "errors": sum(errors.values()),
+        "error_breakdown": errors,
+        "rps": round(len(latencies) / elapsed, 2) if elapsed else 0.0,
+        "mean_ms": round(1000 * sum(latencies) / len(latencies), 3) if latencies else 0.0,
+        "p50_ms": round(1000 * percentile(latencies, 50), 3),
+        "p95_ms": round(1000 * percentile(latencies, 95), 3),
+        "p99_ms": round(1000 * percentile(latencies, 99), 3),
+        "max_ms": round(1000 * latencies[-1], 3) if latencies else 0.0,
+    }
+
+
+def compare(current: dict[str, Any], baseline: dict[str, Any], threshold: float) -> list[str]:
+    """Return regressions where p95 grew or req/s fell by more than `threshold`."""
+    regressions = []
+    for name, result in current["results"].items():
+        base = baseline.get("results", {}).get(name)
+        if not base:
+            continue
+        if base["p95_ms"] and result["p95_ms"] > base["p95_ms"] * (1 + threshold):
+            regressions.append(f"{name}: p95 {base['p95_ms']}ms -> {result['p95_ms']}ms")
+        if base["rps"] and result["rps"] < base["rps"] * (1 - threshold):
+            regressions.append(f"{name}: req/s {base['rps']} -> {result['rps']}")
+    return regressions
+
+
+def print_table(results: dict[str, dict[str, Any]]) -> None:
+    header = f"{'endpoint':<20}{'req/s':>10}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'errors':>8}"
+    print(header)
+    print("-" * len(header))
+    for name, r in results.items():
+        print(
+            f"{name:<20}{r['rps']:>10}{r['p50_ms']:>10}{r['p95_ms']:>10}"
+            f"{r['p99_ms']:>10}{r['errors']:>8}"
+        )
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Load-test web.py against local upstream stubs")
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--duration", type=float, default=5.0, help="Seconds per endpoint")
+    parser.add_argument("--workers", type=int, default=1, help="uvicorn worker processes")
+    parser.add_argument("--endpoints", nargs="*", default=list(SCENARIOS), choices=list(SCENARIOS))
+    parser.add_argument("--latency", type=float, default=0.0, help="Stub latency (seconds)")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Stub latency jitter (seconds)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Stub failure fraction")
+    parser.add_argument("--error-status", type=int, default=503)
+    parser.add_argument("--output", type=Path, help="Result JSON path")
+    parser.add_argument("--compare", type=Path, help="Baseline result JSON to compare against")
+    parser.add_argument("--threshold", type=float, default=0.2, help="Allowed regression fraction")
+    parser.add_argument("--verbose", action="store_true", help="Show web.py logs")
+    args = parser.parse_args(argv)
+
+    stub_config = StubConfig(
+        latency=args.latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+        error_status=args.error_status,
+    )
+    data_dir, video_ids = prepare_data_dir()
+    port = free_port()
+
+    with UpstreamStubs(default=stub_config) as stubs:
+        env = {**stubs.env(), "JESS_DATA_DIR": str(data_dir)}
+        proc = start_web(env, port, args.workers, args.verbose)
+        try:
+            results = {}
+            for name in args.endpoints:
+                results[name] = asyncio.run(run_scenario(
+                    f"http://127.0.0.1:{port}", name, video_ids, args.concurrency, args.duration
+                ))
+                print(f"  {name}: {results[name]['rps']} req/s", file=sys.stderr)
+        finally:
+            proc.terminate()
+            proc.wait(timeout=10)
+            shutil.rmtree(data_dir, ignore_errors=True)
+        upstream_requests = stubs.request_counts()
+
+    report = {
+        "meta": {
+            "commit": git_commit(),
+            "timestamp": datetime.now().isoformat(),
+            "python": platform.python_version(),
+            "concurrency": args.concurrency,
+            "duration": args.duration,
+            "workers": args.workers,
+            "stub_config": asdict(stub_config),
+            "upstream_requests": upstream_requests,
+        },
+        "results": results,
+    }
+
+    print_table(results)
+    output = args.output or RESULTS_DIR / f"web_load-{report['meta']['commit']}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    with open(output, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"\nSaved {output}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            regressions = compare(report, json.load(f), args.threshold)
+        if regressions:
+            print("\nRegressions:")
+            for line in regressions:
+                print(f"  {line}")
+            return 1
+        print(f"\nNo regressions against {args.compare}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
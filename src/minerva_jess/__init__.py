@@ -11,19 +11,70 @@ Example:
     settings = Settings()
     agent = JessAgent(settings)
     result = await agent.query("What are the key risks in emerging markets?")
+
+Attributes are imported lazily on first access, so ``import minerva_jess``
+doesn't pull in pydantic, httpx or yaml until something needs them.
 """
 
-from minerva_jess.agent import JessAgent, JessAgentSync
-from minerva_jess.config import Settings, AgentConfig
-from minerva_jess.models import AgentResponse, VideoInfo, VideoSegment
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from minerva_jess.agent import JessAgent, JessAgentSync
+    from minerva_jess.config import AgentConfig, Settings
+    from minerva_jess.models import (
+        AgentResponse,
+        AnswerChunkEvent,
+        BatchResult,
+        ResponseEvent,
+        SearchEvent,
+        StreamEvent,
+        VideoInfo,
+        VideoSegment,
+    )
 
 __version__ = "1.0.0"
+
+# Public name -> module that defines it
+_LAZY_ATTRS = {
+    "JessAgent": "minerva_jess.agent",
+    "JessAgentSync": "minerva_jess.agent",
+    "Settings": "minerva_jess.config",
+    "AgentConfig": "minerva_jess.config",
+    "AgentResponse": "minerva_jess.models",
+    "BatchResult": "minerva_jess.models",
+    "SearchEvent": "minerva_jess.models",
+    "AnswerChunkEvent": "minerva_jess.models",
+    "ResponseEvent": "minerva_jess.models",
+    "StreamEvent": "minerva_jess.models",
+    "VideoInfo": "minerva_jess.models",
+    "VideoSegment": "minerva_jess.models",
+}
+
 __all__ = [
     "JessAgent",
     "JessAgentSync",
     "Settings",
     "AgentConfig",
     "AgentResponse",
+    "BatchResult",
+    "SearchEvent",
+    "AnswerChunkEvent",
+    "ResponseEvent",
+    "StreamEvent",
     "VideoInfo",
     "VideoSegment",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_ATTRS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value  # Cache so later lookups skip __getattr__
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(list(globals()) + __all__)
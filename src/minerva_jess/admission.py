@@ -0,0 +1,245 @@
+"""
+Admission control for expensive upstream calls.
+
+An AdmissionController caps how many calls run at once, overall and per
+client, so a burst of users queues in front of the upstream (Anthropic)
+instead of all hitting its rate limits together. Callers over the cap
+wait in a bounded FIFO queue. A caller is turned away with
+AdmissionRejectedError (web.py answers 503 with Retry-After) when the
+queue is already full, or when it has waited longer than the deadline, so
+the latency of admitted requests stays predictable under overload.
+
+Slots are handed directly to the next eligible waiter on release, so
+new arrivals can't overtake the queue. A waiter whose client is at its
+per-client cap is skipped until one of that client's calls finishes.
+Limits are per process: with N workers the upstream sees up to N times
+``max_concurrent``.
+
+LLM_ADMISSION guards web.py's Claude calls; its limits come from
+JESS_LLM_MAX_CONCURRENT, JESS_LLM_MAX_PER_CLIENT, JESS_LLM_MAX_QUEUE and
+JESS_LLM_QUEUE_TIMEOUT.
+
+Example:
+    async with LLM_ADMISSION.admit(client_id):
+        answer = await asyncio.to_thread(call_claude, prompt)
+"""
+
+import asyncio
+import logging
+import math
+import os
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator
+
+from minerva_jess import metrics
+
+logger = logging.getLogger(__name__)
+
+ADMISSION_ACTIVE = metrics.REGISTRY.gauge(
+    "jess_admission_active",
+    "Admitted calls currently running.",
+    ("endpoint",),
+)
+ADMISSION_QUEUE_DEPTH = metrics.REGISTRY.gauge(
+    "jess_admission_queue_depth",
+    "Calls waiting for admission.",
+    ("endpoint",),
+)
+ADMISSION_WAIT = metrics.REGISTRY.histogram(
+    "jess_admission_wait_seconds",
+    "Time spent queued before admission (admitted calls only).",
+    ("endpoint",),
+)
+ADMISSION_REJECTED = metrics.REGISTRY.counter(
+    "jess_admission_rejected_total",
+    "Calls turned away, by reason (queue_full/timeout).",
+    ("endpoint", "reason"),
+)
+
+
+class AdmissionRejectedError(Exception):
+    """No slot available; retry after ``retry_after`` seconds."""
+
+    def __init__(self, name: str, reason: str, retry_after: int):
+        super().__init__(f"{name} is at capacity ({reason}); retry in {retry_after}s")
+        self.name = name
+        self.reason = reason
+        self.retry_after = retry_after
+
+
+class _Waiter:
+    __slots__ = ("client", "future")
+
+    def __init__(self, client: str, future: asyncio.Future):
+        self.client = client
+        self.future = future
+
+
+class AdmissionController:
+    """
+    Global and per-client concurrency caps with a bounded wait queue.
+
+    Args:
+        name: Endpoint label for metrics and errors
+        max_concurrent: Calls running at once across all clients
+        max_per_client: Calls running at once for one client
+        max_queue: Callers allowed to wait; further ones are rejected at once
+        queue_timeout: Seconds a caller may wait before being rejected
+    """
+
+    def __init__(
+        self,
+        name: str,
+        max_concurrent: int = 8,
+        max_per_client: int = 2,
+        max_queue: int = 32,
+        queue_timeout: float = 10.0,
+    ):
+        self.name = name
+        self.max_concurrent = max_concurrent
+        self.max_per_client = max_per_client
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self._active = 0
+        self._per_client: dict[str, int] = {}
+        self._queue: deque[_Waiter] = deque()
+        # Smoothed call duration, used to suggest Retry-After
+        self._service_time = 1.0
+        self.admitted = 0
+        self.rejected = 0
+
+    @asynccontextmanager
+    async def admit(self, client: str = "") -> AsyncIterator[None]:
+        """
+        Hold a slot for the duration of the block.
+
+        Args:
+            client: Caller identity for the per-client cap (e.g. client IP)
+
+        Raises:
+            AdmissionRejectedError: Queue full, or no slot within queue_timeout
+        """
+        await self._acquire(client)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            self._service_time = 0.8 * self._service_time + 0.2 * elapsed
+            self._release(client)
+
+    def retry_after(self) -> int:
+        """Seconds until a new caller would likely get a slot."""
+        backlog = len(self._queue) + 1
+        return max(1, math.ceil(self._service_time * backlog / max(self.max_concurrent, 1)))
+
+    def stats(self) -> dict[str, Any]:
+        """Current load and lifetime counters."""
+        return {
+            "name": self.name,
+            "active": self._active,
+            "queued": len(self._queue),
+            "max_concurrent": self.max_concurrent,
+            "max_per_client": self.max_per_client,
+            "max_queue": self.max_queue,
+            "admitted": self.admitted,
+            "rejected": self.rejected,
+        }
+
+    def _can_run(self, client: str) -> bool:
+        return (
+            self._active < self.max_concurrent
+            and self._per_client.get(client, 0) < self.max_per_client
+        )
+
+    def _grant(self, client: str) -> None:
+        self._active += 1
+        self._per_client[client] = self._per_client.get(client, 0) + 1
+        self.admitted += 1
+        ADMISSION_ACTIVE.set(self._active, endpoint=self.name)
+
+    def _reject(self, reason: str) -> AdmissionRejectedError:
+        self.rejected += 1
+        ADMISSION_REJECTED.inc(endpoint=self.name, reason=reason)
+        return AdmissionRejectedError(self.name, reason, self.retry_after())
+
+    async def _acquire(self, client: str) -> None:
+        # Waiters left in the queue are all blocked (see _wake), so a caller
+        # that can run now doesn't overtake anyone eligible
+        if self._can_run(client):
+            self._grant(client)
+            ADMISSION_WAIT.observe(0.0, endpoint=self.name)
+            return
+        if len(self._queue) >= self.max_queue:
+            logger.warning(f"Admission queue for {self.name} is full ({self.max_queue})")
+            raise self._reject("queue_full")
+
+        waiter = _Waiter(client, asyncio.get_running_loop().create_future())
+        self._queue.append(waiter)
+        ADMISSION_QUEUE_DEPTH.set(len(self._queue), endpoint=self.name)
+        start = time.perf_counter()
+        try:
+            await asyncio.wait_for(asyncio.shield(waiter.future), self.queue_timeout)
+        except asyncio.TimeoutError:
+            if not waiter.future.done():
+                self._remove(waiter)
+                raise self._reject("timeout")
+            # Granted just as the deadline passed: keep the slot
+        except BaseException:
+            # Cancelled while waiting; hand back a slot granted in the meantime
+            if waiter.future.done():
+                self._release(client)
+            else:
+                self._remove(waiter)
+            raise
+        ADMISSION_WAIT.observe(time.perf_counter() - start, endpoint=self.name)
+
+    def _remove(self, waiter: _Waiter) -> None:
+        waiter.future.cancel()
+        try:
+            self._queue.remove(waiter)
+        except ValueError:
+            pass
+        ADMISSION_QUEUE_DEPTH.set(len(self._queue), endpoint=self.name)
+
+    def _release(self, client: str) -> None:
+        self._active -= 1
+        remaining = self._per_client.get(client, 1) - 1
+        if remaining:
+            self._per_client[client] = remaining
+        else:
+            self._per_client.pop(client, None)
+        ADMISSION_ACTIVE.set(self._active, endpoint=self.name)
+        self._wake()
+
+    def _wake(self) -> None:
+        """Hand free slots to the oldest waiters whose client is under its cap."""
+        if not self._queue:
+            return
+        for waiter in list(self._queue):
+            if self._active >= self.max_concurrent:
+                break
+            if self._can_run(waiter.client):
+                self._queue.remove(waiter)
+                self._grant(waiter.client)
+                waiter.future.set_result(None)
+        ADMISSION_QUEUE_DEPTH.set(len(self._queue), endpoint=self.name)
+
+
+def _env_float(name: str, default: float) -> float:
+    try:
+        return float(os.environ.get(name, default))
+    except ValueError:
+        return default
+
+
+# Shared by web.py's Claude-backed endpoints (one Anthropic rate limit)
+LLM_ADMISSION = AdmissionController(
+    "anthropic",
+    max_concurrent=int(_env_float("JESS_LLM_MAX_CONCURRENT", 8)),
+    max_per_client=int(_env_float("JESS_LLM_MAX_PER_CLIENT", 2)),
+    max_queue=int(_env_float("JESS_LLM_MAX_QUEUE", 32)),
+    queue_timeout=_env_float("JESS_LLM_QUEUE_TIMEOUT", 10.0),
+)
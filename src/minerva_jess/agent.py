@@ -15,16 +15,41 @@ Example:
     print(result.content)
 """
 
+import asyncio
+import concurrent.futures
 import logging
 import re
-from typing import Optional
-
+import threading
+import time
+from typing import TYPE_CHECKING, AsyncIterator, Awaitable, Iterable, Optional, TypeVar
+
+from minerva_jess.cache import normalize_query
+from minerva_jess.catalog import VideoCatalog, get_video_catalog
+from minerva_jess.intents import DEFAULT_INTENTS, IntentMatch, IntentRouter
+from minerva_jess.profiling import profiled
+from minerva_jess.tracing import span, traced
 from minerva_jess.config import Settings, AgentConfig, get_settings, get_agent_config
-from minerva_jess.orca_client import OrcaMCPClient, get_orca_client
-from minerva_jess.models import AgentResponse, VideoSegment
+from minerva_jess.models import (
+    AgentResponse,
+    AnswerChunkEvent,
+    BatchResult,
+    ResponseEvent,
+    SearchEvent,
+    StreamEvent,
+    VideoSegment,
+)
+
+# The Orca client (and httpx) load on first use of JessAgent.client
+if TYPE_CHECKING:
+    from minerva_jess.orca_client import OrcaMCPClient
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+# Rankings whose intro reads naturally with "about <topic>" appended
+TOPIC_SORTS = ("popular", "latest", "featured")
+
 
 class JessAgent:
     """
@@ -34,29 +59,14 @@ class JessAgent:
     using the Orca gateway.
     """
 
-    # Patterns indicating help/recommendation requests
+    # Deprecated: routing uses IntentRouter (add phrases under ``intents:`` in
+    # config.yaml). Kept as the built-in recommendation phrases; phrases added
+    # here still route to the "recommend" intent.
     HELP_PATTERNS = [
-        "help",
-        "what should i watch",
-        "recommend",
-        "suggestion",
-        "popular",
-        "most viewed",
-        "best video",
-        "what do you have",
-        "what videos",
-        "latest",
-        "newest",
-        "recent",
-        "featured",
-        "top video",
-        "where to start",
-        "what can you show",
-        "what topics",
-        "what content",
-        "list videos",
-        "available videos",
-        "show videos",
+        phrase
+        for spec in DEFAULT_INTENTS.values()
+        if not spec["params"].get("requires_topic")
+        for phrase in spec["phrases"]
     ]
 
     def __init__(
@@ -74,14 +84,30 @@ class JessAgent:
         self.settings = settings or get_settings()
         self.config = config or get_agent_config()
         self._client: Optional[OrcaMCPClient] = None
+        self._router: Optional[IntentRouter] = None
 
     @property
-    def client(self) -> OrcaMCPClient:
+    def client(self) -> "OrcaMCPClient":
         """Get or create the Orca client."""
         if self._client is None:
+            from minerva_jess.orca_client import get_orca_client
             self._client = get_orca_client(self.settings)
         return self._client
 
+    @property
+    def router(self) -> IntentRouter:
+        """Intent router built from the defaults and config.yaml."""
+        if self._router is None:
+            router = IntentRouter.from_config(self.config)
+            known = {p.lower() for spec in router.intents.values() for p in spec.get("phrases", [])}
+            extra = [p for p in self.HELP_PATTERNS if p.lower() not in known]
+            if extra:
+                intents = router.intents
+                intents["recommend"]["phrases"] = list(intents["recommend"]["phrases"]) + extra
+                router = IntentRouter(intents)
+            self._router = router
+        return self._router
+
     @property
     def name(self) -> str:
         """Agent display name."""
@@ -92,10 +118,16 @@ class JessAgent:
         """Agent icon."""
         return self.config.agent_icon
 
+    @profiled("JessAgent.query")
+    @traced("agent.query")
     async def query(self, user_query: str) -> AgentResponse:
         """
         Process a user query and return a response.
 
+        Sampled calls are profiled (see minerva_jess.profiling); pass
+        ``_profile=True`` to profile a single call. Each stage is a
+        trace span (see minerva_jess.tracing).
+
         Args:
             user_query: The user's question or request
 
@@ -103,56 +135,213 @@ class JessAgent:
             AgentResponse with content and optional video embed
         """
         # Clean the query
-        query = self._clean_query(user_query)
+        with span("agent.clean_query"):
+            query = self._clean_query(user_query)
 
         # Check if this is a help request
-        if self._is_help_query(query):
-            return await self.get_recommendations(query)
+        intent = self._traced_route(query)
+        if intent is not None:
+            return await self.get_recommendations(query, sort=intent.params.get("sort"))
 
         # Perform video search
         return await self._search_and_respond(query)
 
-    async def get_recommendations(self, query: str = "") -> AgentResponse:
+    async def query_stream(self, user_query: str) -> AsyncIterator[StreamEvent]:
+        """
+        Process a query, streaming events as the answer is produced.
+
+        Emits a SearchEvent (with the top video) as soon as search returns,
+        then AnswerChunkEvents as synthesis streams, and finally a
+        ResponseEvent with the complete AgentResponse. If the stream breaks
+        midway, that response has success=False and an error, so a partial
+        answer isn't mistaken for a complete one.
+
+        Args:
+            user_query: The user's question or request
+
+        Yields:
+            SearchEvent, AnswerChunkEvent(s), then one ResponseEvent
+        """
+        with span("agent.clean_query"):
+            query = self._clean_query(user_query)
+
+        intent = self._traced_route(query)
+        if intent is not None:
+            response = await self.get_recommendations(query, sort=intent.params.get("sort"))
+            yield SearchEvent(video_info=response.video_info)
+            yield AnswerChunkEvent(text=response.content)
+            yield ResponseEvent(response=response)
+            return
+
+        try:
+            with span("agent.search") as search_span:
+                segments = await self.client.search(query)
+                search_span.set_attribute("results", len(segments))
+
+            if not segments:
+                content = self._no_results_message(query)
+                yield SearchEvent()
+                yield AnswerChunkEvent(text=content)
+                yield ResponseEvent(response=AgentResponse(
+                    content=content,
+                    success=True,
+                    clickable_examples=self._get_example_queries(),
+                ))
+                return
+
+            video_info = self._video_info(segments[0])
+            yield SearchEvent(segments=segments, video_info=video_info)
+
+            from minerva_jess.orca_client import SynthesisInterruptedError
+
+            parts = []
+            try:
+                async for chunk in self.client.synthesize_stream(query, segments):
+                    parts.append(chunk)
+                    yield AnswerChunkEvent(text=chunk)
+            except SynthesisInterruptedError as e:
+                # Chunks already went out; flag the answer as incomplete
+                logger.warning(f"Streamed answer cut short: {e}")
+                yield ResponseEvent(response=AgentResponse(
+                    content="".join(parts),
+                    success=False,
+                    video_info=video_info,
+                    error=str(e),
+                ))
+                return
+
+            yield ResponseEvent(response=AgentResponse(
+                content="".join(parts),
+                success=True,
+                video_info=video_info,
+            ))
+
+        except Exception as e:
+            logger.error(f"Streaming search failed: {e}", exc_info=True)
+            yield ResponseEvent(response=AgentResponse(
+                content=f"I encountered an error searching the video library: {e}",
+                success=False,
+            ))
+
+    async def query_many(
+        self,
+        queries: Iterable[str],
+        concurrency: int = 8,
+    ) -> AsyncIterator[BatchResult]:
+        """
+        Answer a batch of queries concurrently, yielding results as they finish.
+
+        Identical queries (ignoring case, whitespace and @mentions) are
+        answered once; every copy gets its own BatchResult, flagged as a
+        duplicate after the first.
+
+        Args:
+            queries: Queries to answer
+            concurrency: Maximum queries in flight at once
+
+        Yields:
+            BatchResult per input query, in completion order
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+
+        groups: dict[str, list[tuple[int, str]]] = {}
+        for index, user_query in enumerate(queries):
+            key = normalize_query(self._clean_query(user_query))
+            groups.setdefault(key, []).append((index, user_query))
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def run(items: list[tuple[int, str]]):
+            async with semaphore:
+                start = time.perf_counter()
+                try:
+                    response, error = await self.query(items[0][1]), None
+                except Exception as e:
+                    logger.error(f"Batch query failed: {e}")
+                    response, error = None, str(e)
+                return items, response, error, time.perf_counter() - start
+
+        tasks = [asyncio.ensure_future(run(items)) for items in groups.values()]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                items, response, error, duration = await next_done
+                for n, (index, user_query) in enumerate(items):
+                    yield BatchResult(
+                        index=index,
+                        query=user_query,
+                        response=response,
+                        error=error,
+                        duration=duration,
+                        duplicate=n > 0,
+                    )
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    @traced("agent.recommendations")
+    async def get_recommendations(
+        self,
+        query: str = "",
+        sort: Optional[str] = None,
+        topic: Optional[str] = None,
+    ) -> AgentResponse:
         """
         Get video recommendations.
 
         Args:
-            query: Optional filter (e.g., "popular", "recent")
+            query: Optional filter (e.g., "popular", "recent", "about China")
+            sort: Ranking ("popular", "latest", "featured" or "default");
+                routed from the query when omitted
+            topic: Only videos tagged with this topic; taken from the query
+                when omitted
 
         Returns:
             AgentResponse with recommendations
         """
-        videos = await self.client.list_videos()
+        catalog = await self.client.get_catalog()
 
-        if not videos:
+        if not catalog.videos:
             return AgentResponse(
                 content="No videos are currently available in the library.",
                 success=True,
                 clickable_examples=self._get_example_queries(),
             )
 
-        query_lower = query.lower()
+        if sort is None:
+            intent = self._route(query)
+            sort = intent.params.get("sort") if intent else None
+        if topic is None:
+            topic = self._video_catalog().find_topic(query)
 
-        # Sort based on query
-        if "popular" in query_lower or "most viewed" in query_lower:
-            sorted_videos = sorted(videos, key=lambda v: v.view_count, reverse=True)
+        # Pick a precomputed ranking
+        if sort == "popular":
+            sorted_videos = catalog.popular
             intro = "Here are the most popular videos:"
-        elif "latest" in query_lower or "newest" in query_lower:
-            sorted_videos = sorted(videos, key=lambda v: v.publish_date or "", reverse=True)
+        elif sort == "latest":
+            sorted_videos = catalog.latest
             intro = "Here are the latest videos:"
-        elif "featured" in query_lower:
-            sorted_videos = [v for v in videos if v.featured] or videos
+        elif sort == "featured":
+            sorted_videos = catalog.featured or catalog.videos
             intro = "Here are the featured videos:"
         else:
-            featured = [v for v in videos if v.featured]
-            non_featured = sorted(
-                [v for v in videos if not v.featured],
-                key=lambda v: v.view_count,
-                reverse=True,
-            )
-            sorted_videos = featured + non_featured
+            sorted_videos = catalog.default
             intro = "Here's what's available in the video library:"
 
+        if topic:
+            tagged = set(self._video_catalog().ids_for_topic(topic))
+            sorted_videos = [v for v in sorted_videos if v.video_id in tagged]
+            if sort in TOPIC_SORTS:
+                intro = f"{intro[:-1]} about {topic}:"
+            else:
+                intro = f"Here are the videos about {topic}:"
+            if not sorted_videos:
+                return AgentResponse(
+                    content=f"I don't have any videos about {topic} right now.",
+                    success=True,
+                    clickable_examples=self._get_example_queries(),
+                )
+
         # Build response
         content_parts = [intro, ""]
 
@@ -197,7 +386,9 @@ class JessAgent:
         """
         try:
             # Search via Orca
-            segments = await self.client.search(query)
+            with span("agent.search") as search_span:
+                segments = await self.client.search(query)
+                search_span.set_attribute("results", len(segments))
 
             if not segments:
                 return AgentResponse(
@@ -207,17 +398,11 @@ class JessAgent:
                 )
 
             # Get top result for video embed
-            top_segment = segments[0]
-            video_info = {
-                "video_id": top_segment.video_id,
-                "start_time": int(top_segment.start_time),
-                "title": top_segment.title,
-                "timestamp": top_segment.timestamp,
-                "url": top_segment.url,
-            }
+            video_info = self._video_info(segments[0])
 
             # Synthesize answer via Orca
-            answer = await self.client.synthesize(query, segments)
+            with span("agent.synthesize", segments=len(segments)):
+                answer = await self.client.synthesize(query, segments)
 
             return AgentResponse(
                 content=answer,
@@ -232,6 +417,17 @@ class JessAgent:
                 success=False,
             )
 
+    @staticmethod
+    def _video_info(segment: VideoSegment) -> dict:
+        """Embed information for a segment."""
+        return {
+            "video_id": segment.video_id,
+            "start_time": int(segment.start_time),
+            "title": segment.title,
+            "timestamp": segment.timestamp,
+            "url": segment.url,
+        }
+
     def _no_results_message(self, query: str) -> str:
         """Message when no results found."""
         return (
@@ -244,10 +440,31 @@ class JessAgent:
         cleaned = re.sub(r"@jess\s*", "", query, flags=re.IGNORECASE)
         return cleaned.strip()
 
+    def _route(self, query: str) -> Optional[IntentMatch]:
+        """Intent a query routes to, if any."""
+        intent = self.router.route(query)
+        if (
+            intent is not None
+            and intent.params.get("requires_topic")
+            and self._video_catalog().find_topic(query) is None
+        ):
+            return None  # "videos about <unknown>" is a content question: search
+        return intent
+
+    def _traced_route(self, query: str) -> Optional[IntentMatch]:
+        """_route inside an "agent.route" span tagged with the intent."""
+        with span("agent.route") as route_span:
+            intent = self._route(query)
+            route_span.set_attribute("intent", intent.intent if intent else "search")
+        return intent
+
+    def _video_catalog(self) -> VideoCatalog:
+        """Local video metadata (topics, rankings)."""
+        return get_video_catalog(self.settings.catalog_cache_path)
+
     def _is_help_query(self, query: str) -> bool:
         """Check if query is asking for help."""
-        query_lower = query.lower()
-        return any(pattern in query_lower for pattern in self.HELP_PATTERNS)
+        return self._route(query) is not None
 
     def _get_example_queries(self) -> list[str]:
         """Example queries for suggestions."""
@@ -264,7 +481,14 @@ class JessAgentSync:
     """
     Synchronous wrapper for JessAgent.
 
-    Use when calling from synchronous code.
+    Use when calling from synchronous code. Calls run on a background
+    event loop owned by the wrapper, so Orca connections are kept alive
+    across calls. Safe to call from several threads at once; call
+    ``close()`` (or use it as a context manager) when done.
+
+    Example:
+        with JessAgentSync() as agent:
+            print(agent.query("market outlook").content)
     """
 
     def __init__(
@@ -274,13 +498,93 @@ class JessAgentSync:
     ):
         """Initialize the sync wrapper."""
         self._agent = JessAgent(settings, config)
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def __enter__(self) -> "JessAgentSync":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _submit(self, coro: Awaitable[T]) -> "concurrent.futures.Future[T]":
+        """
+        Schedule a coroutine on the background loop, starting it on first use.
+
+        Checking for close() and scheduling happen under one lock, so no
+        call lands on a loop that close() is already stopping.
+        """
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("JessAgentSync is closed")
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                thread = threading.Thread(
+                    target=loop.run_forever, name="jess-agent-loop", daemon=True
+                )
+                thread.start()
+                self._loop, self._thread = loop, thread
+            return asyncio.run_coroutine_threadsafe(coro, self._loop)
+
+    def _run(self, coro: Awaitable[T]) -> T:
+        """
+        Run a coroutine on the background loop and wait for its result.
+
+        Raises:
+            RuntimeError: The wrapper is closed (or called from its own loop)
+            concurrent.futures.CancelledError: close() ran while it was waiting
+        """
+        try:
+            if threading.current_thread() is self._thread:
+                raise RuntimeError("JessAgentSync can't be called from its own event loop")
+            future = self._submit(coro)
+        except RuntimeError:
+            coro.close()
+            raise
+        return future.result()
 
     def query(self, user_query: str) -> AgentResponse:
         """Process a query synchronously."""
-        import asyncio
-        return asyncio.run(self._agent.query(user_query))
+        return self._run(self._agent.query(user_query))
+
+    def query_many(self, queries: Iterable[str], concurrency: int = 8) -> list[BatchResult]:
+        """Answer a batch of queries concurrently; results are in input order."""
+        async def collect() -> list[BatchResult]:
+            return [result async for result in self._agent.query_many(queries, concurrency)]
+
+        return sorted(self._run(collect()), key=lambda r: r.index)
 
     def get_recommendations(self, query: str = "") -> AgentResponse:
         """Get recommendations synchronously."""
-        import asyncio
-        return asyncio.run(self._agent.get_recommendations(query))
+        return self._run(self._agent.get_recommendations(query))
+
+    def close(self) -> None:
+        """Cancel calls still running, close Orca connections and stop the loop."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            loop, thread = self._loop, self._thread
+        if loop is None:
+            return
+
+        from minerva_jess import orca_pool
+
+        async def shutdown() -> None:
+            # Cancel calls still running so their callers don't wait forever
+            current = asyncio.current_task()
+            pending = [task for task in asyncio.all_tasks() if task is not current]
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+            await self._agent.client.close()
+            await orca_pool.shutdown()
+
+        try:
+            asyncio.run_coroutine_threadsafe(shutdown(), loop).result()
+        finally:
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join()
+            loop.close()
@@ -0,0 +1,335 @@
+"""
+In-memory response caches for Orca calls.
+
+TTLCache is a bounded LRU cache with per-entry TTL. Concurrent misses
+for the same key are coalesced: the first caller loads the value and
+everyone else awaits the same result. Failed loads are never cached.
+
+StaleWhileRevalidate holds a single slow-changing value (the video
+catalog): once loaded it is always served immediately, and a stale
+value is refreshed in the background.
+
+Caches are shared per (orca_url, token) and name, so every client in
+the process benefits from the same entries.
+
+Example:
+    cache = get_cache(settings, "search", maxsize=1024, ttl=300)
+    segments = await cache.get_or_load(key, lambda: fetch(query))
+    print(cache.stats())
+
+    catalog = get_swr(settings, "catalog", ttl=3600)
+    snapshot = await catalog.get(fetch_catalog)
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Generic, Hashable, Optional, TypeVar
+
+from minerva_jess import metrics
+from minerva_jess.config import Settings
+
+logger = logging.getLogger(__name__)
+
+V = TypeVar("V")
+
+_MISSING = object()
+
+CACHE_COALESCED = metrics.REGISTRY.counter(
+    "jess_cache_coalesced_total",
+    "Cache misses that waited on an identical in-flight load.",
+    ("cache",),
+)
+
+
+def normalize_query(query: str) -> str:
+    """Case- and whitespace-insensitive form of a query for cache keys."""
+    return " ".join(query.lower().split())
+
+
+def _retrieve(task: asyncio.Task) -> None:
+    """Mark a load's exception retrieved, so a load whose callers all left doesn't warn."""
+    if not task.cancelled():
+        task.exception()
+
+
+class TTLCache(Generic[V]):
+    """
+    LRU cache with TTL expiry and in-flight load coalescing.
+
+    Args:
+        name: Cache name (used in metrics)
+        maxsize: Maximum number of entries
+        ttl: Seconds an entry stays fresh
+        clock: Time source (monotonic seconds)
+    """
+
+    def __init__(
+        self,
+        name: str,
+        maxsize: int = 1024,
+        ttl: float = 300.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.name = name
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._clock = clock
+        self._data: OrderedDict[Hashable, tuple[float, V]] = OrderedDict()
+        self._inflight: dict[Hashable, asyncio.Task] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Fresh value for `key`, or `default` (counts as a hit or miss)."""
+        value = self._lookup(key)
+        if value is _MISSING:
+            self._record(hit=False)
+            return default
+        self._record(hit=True)
+        return value
+
+    def set(self, key: Hashable, value: V) -> None:
+        """Store a value, evicting the least recently used entry if full."""
+        with self._lock:
+            self._data[key] = (self._clock() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def invalidate(self, key: Hashable) -> None:
+        """Drop one entry."""
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        """Drop all entries and reset statistics."""
+        with self._lock:
+            self._data.clear()
+        self.hits = self.misses = self.coalesced = 0
+
+    async def get_or_load(
+        self,
+        key: Hashable,
+        loader: Callable[[], Awaitable[V]],
+        bypass: bool = False,
+    ) -> V:
+        """
+        Return the cached value or load it, coalescing concurrent misses.
+
+        Args:
+            key: Cache key
+            loader: Zero-argument callable producing the value
+            bypass: Skip the lookup (the fresh result is still stored)
+        """
+        if not bypass:
+            value = self._lookup(key)
+            if value is not _MISSING:
+                self._record(hit=True)
+                return value
+
+            pending = self._inflight.get(key)
+            if pending is not None and pending.get_loop() is asyncio.get_running_loop():
+                self.coalesced += 1
+                CACHE_COALESCED.inc(cache=self.name)
+                return await asyncio.shield(pending)
+
+        self._record(hit=False)
+        # The load runs in its own task so a cancelled caller doesn't abort it for the waiters
+        task = asyncio.get_running_loop().create_task(self._load(key, loader))
+        self._inflight[key] = task
+        task.add_done_callback(_retrieve)
+        return await asyncio.shield(task)
+
+    async def _load(self, key: Hashable, loader: Callable[[], Awaitable[V]]) -> V:
+        """Run the loader and store its result."""
+        try:
+            value = await loader()
+            self.set(key, value)
+            return value
+        finally:
+            if self._inflight.get(key) is asyncio.current_task():
+                del self._inflight[key]
+
+    def _lookup(self, key: Hashable) -> Any:
+        """Fresh value or _MISSING (expired entries are dropped)."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return _MISSING
+            expires_at, value = entry
+            if expires_at <= self._clock():
+                del self._data[key]
+                return _MISSING
+            self._data.move_to_end(key)
+            return value
+
+    def _record(self, hit: bool) -> None:
+        if hit:
+            self.hits += 1
+        else:
+            self.misses += 1
+        metrics.record_cache(self.name, hit)
+
+    def stats(self) -> dict[str, Any]:
+        """Size and hit-rate statistics."""
+        lookups = self.hits + self.misses
+        return {
+            "name": self.name,
+            "size": len(self._data),
+            "maxsize": self.maxsize,
+            "ttl": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+        }
+
+
+class StaleWhileRevalidate(Generic[V]):
+    """
+    Single cached value served stale while a background refresh runs.
+
+    Only the first load (or a forced refresh) waits on the loader; after
+    that callers always get the last good value. A failed background
+    refresh keeps the old value and is retried after `retry_after`.
+
+    Args:
+        name: Cache name (used in metrics)
+        ttl: Seconds before the value is considered stale
+        retry_after: Seconds to wait after a failed refresh
+        clock: Time source (monotonic seconds)
+    """
+
+    def __init__(
+        self,
+        name: str,
+        ttl: float = 3600.0,
+        retry_after: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.name = name
+        self.ttl = ttl
+        self.retry_after = retry_after
+        self._clock = clock
+        self._value: Any = _MISSING
+        self._fetched_at = 0.0
+        self._retry_at = 0.0
+        self._inflight: Optional[asyncio.Task] = None
+        self._refresh_task: Optional[asyncio.Task] = None
+        self.hits = 0
+        self.misses = 0
+        self.refreshes = 0
+
+    @property
+    def value(self) -> Optional[V]:
+        """Last good value, if any."""
+        return None if self._value is _MISSING else self._value
+
+    @property
+    def is_stale(self) -> bool:
+        return self._value is _MISSING or self._clock() >= self._fetched_at + self.ttl
+
+    async def get(self, loader: Callable[[], Awaitable[V]], refresh: bool = False) -> V:
+        """
+        Return the cached value, loading it on first use.
+
+        Args:
+            loader: Zero-argument callable producing a fresh value
+            refresh: Wait for a fresh value instead of serving the cached one
+        """
+        if self._value is _MISSING or refresh:
+            self.misses += 1
+            metrics.record_cache(self.name, hit=False)
+            return await self._load(loader)
+
+        if self.is_stale and self._clock() >= self._retry_at:
+            self._schedule_refresh(loader)
+        self.hits += 1
+        metrics.record_cache(self.name, hit=True)
+        return self._value
+
+    def clear(self) -> None:
+        """Forget the cached value."""
+        self._value = _MISSING
+        self._fetched_at = 0.0
+
+    async def _load(self, loader: Callable[[], Awaitable[V]]) -> V:
+        """Run the loader, sharing one in-flight load between callers."""
+        pending = self._inflight
+        if pending is not None and pending.get_loop() is asyncio.get_running_loop():
+            return await asyncio.shield(pending)
+
+        task = asyncio.get_running_loop().create_task(self._run(loader))
+        self._inflight = task
+        task.add_done_callback(_retrieve)
+        return await asyncio.shield(task)
+
+    async def _run(self, loader: Callable[[], Awaitable[V]]) -> V:
+        """Run the loader and keep its result (a failure schedules the retry)."""
+        try:
+            value = await loader()
+        except Exception:
+            self._retry_at = self._clock() + self.retry_after
+            raise
+        else:
+            self._value = value
+            self._fetched_at = self._clock()
+            self.refreshes += 1
+            return value
+        finally:
+            if self._inflight is asyncio.current_task():
+                self._inflight = None
+
+    def _schedule_refresh(self, loader: Callable[[], Awaitable[V]]) -> None:
+        """Start a background refresh unless one is already running."""
+        if self._inflight is not None:
+            return
+        self._refresh_task = asyncio.get_running_loop().create_task(self._background(loader))
+
+    async def _background(self, loader: Callable[[], Awaitable[V]]) -> None:
+        try:
+            await self._load(loader)
+        except Exception as e:
+            logger.warning(f"Background refresh of {self.name} failed; serving stale value: {e}")
+
+    def stats(self) -> dict[str, Any]:
+        """Freshness and hit statistics."""
+        age = self._clock() - self._fetched_at if self._value is not _MISSING else None
+        return {
+            "name": self.name,
+            "loaded": self._value is not _MISSING,
+            "age": round(age, 3) if age is not None else None,
+            "stale": self.is_stale,
+            "hits": self.hits,
+            "misses": self.misses,
+            "refreshes": self.refreshes,
+        }
+
+
+_caches: dict[tuple[str, Optional[str], str], Any] = {}
+
+
+def get_cache(settings: Settings, name: str, maxsize: int, ttl: float) -> TTLCache:
+    """Get the process-wide cache `name` for an Orca URL and token."""
+    key = (settings.orca_url, settings.orca_token, name)
+    cache = _caches.get(key)
+    if cache is None:
+        cache = _caches[key] = TTLCache(f"orca_{name}", maxsize=maxsize, ttl=ttl)
+    return cache
+
+
+def get_swr(settings: Settings, name: str, ttl: float) -> StaleWhileRevalidate:
+    """Get the process-wide stale-while-revalidate holder `name` for an Orca URL and token."""
+    key = (settings.orca_url, settings.orca_token, name)
+    holder = _caches.get(key)
+    if holder is None:
+        holder = _caches[key] = StaleWhileRevalidate(f"orca_{name}", ttl=ttl)
+    return holder
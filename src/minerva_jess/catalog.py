@@ -0,0 +1,244 @@
+"""
+Indexed video catalog.
+
+Video metadata is loaded lazily from two files: the channel listing
+that web.py keeps in ``$JESS_DATA_DIR/videos_cache.json`` and the curated
+enrichment shipped with the package (``data/catalog_enrichment.json``:
+titles, topics, dates, view counts, featured flags). Enrichment wins
+where both define a field.
+
+The catalog is indexed once on load: id lookup, a topic -> videos
+inverted index and date / view-count ordered views, so enrichment and
+topic filters are dictionary lookups rather than scans. The shared
+catalog is rebuilt when the channel listing on disk changes.
+
+Example:
+    catalog = get_video_catalog()
+    catalog.get("SKfMmH9Bk4o")["title"]
+    catalog.ids_for_topic("china")
+    catalog.find_topic("popular videos about china")  # -> "China"
+"""
+
+import logging
+import os
+import re
+import threading
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Any, Iterator, Optional, Union
+
+from minerva_jess import codec
+
+logger = logging.getLogger(__name__)
+
+ENRICHMENT_PATH = Path(__file__).resolve().parent / "data" / "catalog_enrichment.json"
+# Same default as web.py's DATA_DIR (data/ next to web.py at the repo root)
+DEFAULT_DATA_DIR = Path(__file__).resolve().parents[2] / "data"
+
+PathLike = Union[str, Path]
+
+
+def _publish_date(value: Any) -> Optional[str]:
+    """Normalize YYYYMMDD / ISO timestamps to YYYY-MM-DD."""
+    if not value:
+        return None
+    value = str(value)
+    if len(value) == 8 and value.isdigit():
+        return f"{value[:4]}-{value[4:6]}-{value[6:]}"
+    return value[:10]
+
+
+def default_cache_path() -> Path:
+    """web.py's videos_cache.json, under JESS_DATA_DIR when that is set."""
+    return Path(os.environ.get("JESS_DATA_DIR", DEFAULT_DATA_DIR)) / "videos_cache.json"
+
+
+def _read_json(path: Path) -> Any:
+    try:
+        return codec.read_file(path)
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        logger.warning(f"Could not read catalog file {path}: {e}")
+        return None
+
+
+class VideoCatalog(Mapping):
+    """
+    Read-only video metadata keyed by video id, with topic and ranking indexes.
+
+    Entries are dicts with ``title``, ``topics``, ``publish_date``,
+    ``view_count``, ``featured`` and ``description`` (plus ``duration``
+    when known).
+
+    Args:
+        videos: Video id -> metadata
+    """
+
+    def __init__(self, videos: Mapping[str, Mapping[str, Any]]):
+        self._videos: dict[str, dict[str, Any]] = {}
+        self._by_topic: dict[str, list[str]] = {}
+        self._topic_names: dict[str, str] = {}
+
+        for video_id, meta in videos.items():
+            entry = {
+                "title": meta.get("title") or "",
+                "topics": list(meta.get("topics") or []),
+                "publish_date": _publish_date(meta.get("publish_date")),
+                "view_count": int(meta.get("view_count") or 0),
+                "featured": bool(meta.get("featured", False)),
+                "description": meta.get("description") or "",
+            }
+            if meta.get("duration"):
+                entry["duration"] = meta["duration"]
+            self._videos[video_id] = entry
+            for topic in entry["topics"]:
+                key = topic.lower()
+                self._topic_names.setdefault(key, topic)
+                self._by_topic.setdefault(key, []).append(video_id)
+
+        self.latest: list[str] = sorted(
+            self._videos, key=lambda v: self._videos[v]["publish_date"] or "", reverse=True
+        )
+        self.popular: list[str] = sorted(
+            self._videos, key=lambda v: self._videos[v]["view_count"], reverse=True
+        )
+        self.featured: list[str] = [v for v in self._videos if self._videos[v]["featured"]]
+        self._topic_pattern: Optional[re.Pattern] = None
+
+    @classmethod
+    def load(
+        cls,
+        cache_path: Optional[PathLike] = None,
+        enrichment_path: Optional[PathLike] = None,
+    ) -> "VideoCatalog":
+        """
+        Build the catalog from the channel cache and the enrichment file.
+
+        Args:
+            cache_path: web.py's videos_cache.json (missing is fine)
+            enrichment_path: Curated metadata (defaults to the packaged file)
+        """
+        videos: dict[str, dict[str, Any]] = {}
+
+        cached = _read_json(Path(cache_path or default_cache_path())) or {}
+        for item in cached.get("videos", []) if isinstance(cached, dict) else []:
+            video_id = item.get("video_id")
+            if video_id:
+                videos[video_id] = {
+                    "title": item.get("title"),
+                    "description": item.get("description"),
+                    "publish_date": item.get("published_at") or item.get("upload_date"),
+                    "view_count": item.get("view_count"),
+                    "duration": item.get("duration"),
+                }
+
+        enrichment = _read_json(Path(enrichment_path or ENRICHMENT_PATH)) or {}
+        for video_id, meta in enrichment.get("videos", {}).items():
+            base = videos.setdefault(video_id, {})
+            base.update({k: v for k, v in meta.items() if v not in (None, "", [])})
+
+        return cls(videos)
+
+    # Mapping interface (video id -> metadata)
+    def __getitem__(self, video_id: str) -> dict[str, Any]:
+        return self._videos[video_id]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._videos)
+
+    def __len__(self) -> int:
+        return len(self._videos)
+
+    def __contains__(self, video_id: object) -> bool:
+        return video_id in self._videos
+
+    def topics(self) -> list[str]:
+        """All topics (original casing)."""
+        return sorted(self._topic_names.values(), key=str.lower)
+
+    def ids_for_topic(self, topic: str) -> list[str]:
+        """Video ids tagged with a topic (case-insensitive)."""
+        return list(self._by_topic.get(topic.lower(), []))
+
+    def find_topic(self, text: str) -> Optional[str]:
+        """
+        Longest known topic mentioned in `text`, if any (in its catalog casing).
+
+        Matching ignores case, except for all-caps topics such as "AI".
+
+        Args:
+            text: Free text such as a user query
+        """
+        if not self._by_topic:
+            return None
+        if self._topic_pattern is None:
+            # Acronyms ("US", "AI") match case-sensitively so "us" doesn't hit "US"
+            names = sorted(self._topic_names.values(), key=len, reverse=True)
+            alternatives = [
+                re.escape(name) if name.isupper() else f"(?i:{re.escape(name)})"
+                for name in names
+            ]
+            self._topic_pattern = re.compile(r"(?<!\w)(?:" + "|".join(alternatives) + r")(?!\w)")
+        found = [m.group().lower() for m in self._topic_pattern.finditer(text)]
+        return self._topic_names[max(found, key=len)] if found else None
+
+
+_lock = threading.Lock()
+# Cache path -> (file signature when loaded, catalog)
+_catalogs: dict[str, tuple[Optional[tuple[int, int, int]], VideoCatalog]] = {}
+
+
+def _signature(path: Path) -> Optional[tuple[int, int, int]]:
+    """Changes whenever the file is rewritten (None if it doesn't exist)."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_ino, st.st_mtime_ns, st.st_size
+
+
+def get_video_catalog(cache_path: Optional[PathLike] = None) -> VideoCatalog:
+    """
+    Get the process-wide catalog, reloading it when the cache file changes.
+
+    Args:
+        cache_path: videos_cache.json to merge in (defaults to default_cache_path())
+    """
+    path = Path(cache_path) if cache_path else default_cache_path()
+    key = str(path)
+    signature = _signature(path)
+    entry = _catalogs.get(key)
+    if entry is None or entry[0] != signature:
+        with _lock:
+            entry = _catalogs.get(key)
+            if entry is None or entry[0] != signature:
+                catalog = VideoCatalog.load(path)
+                entry = _catalogs[key] = (signature, catalog)
+                logger.debug(f"Loaded video catalog with {len(catalog)} videos from {path}")
+    return entry[1]
+
+
+def reload_video_catalog() -> None:
+    """Drop loaded catalogs so the next access re-reads the files."""
+    with _lock:
+        _catalogs.clear()
+
+
+class CatalogView(Mapping):
+    """Lazy mapping over the default catalog (backs config.VIDEO_CATALOG)."""
+
+    def __getitem__(self, video_id: str) -> dict[str, Any]:
+        return get_video_catalog()[video_id]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(get_video_catalog())
+
+    def __len__(self) -> int:
+        return len(get_video_catalog())
+
+    def __contains__(self, video_id: object) -> bool:
+        return video_id in get_video_catalog()
+
+    def __repr__(self) -> str:
+        return f"CatalogView({len(self)} videos)"
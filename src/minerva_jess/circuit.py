@@ -0,0 +1,247 @@
+"""
+Circuit breakers for Orca endpoints.
+
+Each (orca_url, operation) gets a breaker that watches a sliding window
+of recent calls. When too many fail (or are too slow) it opens and
+calls fail fast without touching the network; after a cool-down it
+lets a probe through (half-open) and closes again if the probe works.
+
+Example:
+    breaker = get_breaker(settings, "search")
+    if not breaker.allow():
+        raise CircuitOpenError(breaker.name)
+
+    breaker.add_listener(lambda name, old, new: print(name, old, "->", new))
+"""
+
+import logging
+import threading
+import time
+from collections import deque
+from datetime import datetime
+from enum import Enum
+from typing import Any, Callable, Optional
+
+from minerva_jess import metrics
+from minerva_jess.config import Settings
+
+logger = logging.getLogger(__name__)
+
+CIRCUIT_STATE = metrics.REGISTRY.gauge(
+    "jess_circuit_state",
+    "Circuit breaker state per endpoint (0=closed, 1=half_open, 2=open).",
+    ("endpoint",),
+)
+CIRCUIT_TRANSITIONS = metrics.REGISTRY.counter(
+    "jess_circuit_transitions_total",
+    "Circuit breaker state transitions.",
+    ("endpoint", "state"),
+)
+CIRCUIT_REJECTED = metrics.REGISTRY.counter(
+    "jess_circuit_rejected_total",
+    "Calls rejected because the circuit was open.",
+    ("endpoint",),
+)
+
+
+class CircuitState(str, Enum):
+    """Breaker states."""
+
+    CLOSED = "closed"
+    HALF_OPEN = "half_open"
+    OPEN = "open"
+
+
+_STATE_VALUES = {CircuitState.CLOSED: 0, CircuitState.HALF_OPEN: 1, CircuitState.OPEN: 2}
+
+Listener = Callable[[str, CircuitState, CircuitState], None]
+
+
+class CircuitOpenError(Exception):
+    """Raised when a call is rejected by an open circuit."""
+
+    def __init__(self, name: str):
+        super().__init__(f"Circuit '{name}' is open")
+        self.name = name
+
+
+class CircuitBreaker:
+    """
+    Closed/open/half-open breaker driven by error rate and slow-call rate.
+
+    Args:
+        name: Breaker name (used in metrics and errors)
+        failure_rate: Failure fraction in the window that opens the circuit
+        slow_call_seconds: Calls slower than this count as slow
+        slow_call_rate: Slow fraction in the window that opens the circuit
+        window: Number of recent calls considered
+        min_calls: Calls needed in the window before the circuit can open
+        open_seconds: Time to stay open before allowing a probe
+        half_open_calls: Concurrent probes allowed while half-open
+        clock: Time source (monotonic seconds)
+    """
+
+    def __init__(
+        self,
+        name: str,
+        failure_rate: float = 0.5,
+        slow_call_seconds: float = 10.0,
+        slow_call_rate: float = 0.8,
+        window: int = 20,
+        min_calls: int = 10,
+        open_seconds: float = 30.0,
+        half_open_calls: int = 1,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.name = name
+        self.failure_rate = failure_rate
+        self.slow_call_seconds = slow_call_seconds
+        self.slow_call_rate = slow_call_rate
+        self.min_calls = min_calls
+        self.open_seconds = open_seconds
+        self.half_open_calls = half_open_calls
+        self._clock = clock
+        self._calls: deque[tuple[bool, bool]] = deque(maxlen=window)  # (failed, slow)
+        self._state = CircuitState.CLOSED
+        self._opened_at = 0.0
+        self._probes = 0
+        self._lock = threading.Lock()
+        self._listeners: list[Listener] = []
+        self.transitions: deque[dict[str, Any]] = deque(maxlen=50)
+        CIRCUIT_STATE.set(0, endpoint=name)
+
+    @property
+    def state(self) -> CircuitState:
+        """Current state (an expired open circuit reports half-open)."""
+        with self._lock:
+            self._maybe_half_open()
+            return self._state
+
+    def add_listener(self, listener: Listener) -> None:
+        """Call `listener(name, old_state, new_state)` on every transition."""
+        self._listeners.append(listener)
+
+    def allow(self) -> bool:
+        """Whether a call may proceed now."""
+        with self._lock:
+            self._maybe_half_open()
+            if self._state == CircuitState.CLOSED:
+                return True
+            if self._state == CircuitState.HALF_OPEN and self._probes < self.half_open_calls:
+                self._probes += 1
+                return True
+        CIRCUIT_REJECTED.inc(endpoint=self.name)
+        return False
+
+    def record_success(self, duration: float = 0.0) -> None:
+        """Record a completed call."""
+        self._record(failed=False, slow=duration >= self.slow_call_seconds)
+
+    def record_failure(self, duration: float = 0.0) -> None:
+        """Record a failed call."""
+        self._record(failed=True, slow=duration >= self.slow_call_seconds)
+
+    def release(self) -> None:
+        """Give back a half-open probe slot without recording (e.g. cancelled call)."""
+        with self._lock:
+            self._probes = max(0, self._probes - 1)
+
+    def _record(self, failed: bool, slow: bool) -> None:
+        with self._lock:
+            if self._state == CircuitState.HALF_OPEN:
+                self._probes = max(0, self._probes - 1)
+                if failed or slow:
+                    self._transition(CircuitState.OPEN)
+                else:
+                    self._calls.clear()
+                    self._transition(CircuitState.CLOSED)
+                return
+            if self._state == CircuitState.OPEN:
+                return  # Late result from before the circuit opened
+
+            self._calls.append((failed, slow))
+            if len(self._calls) < self.min_calls:
+                return
+            failures = sum(1 for f, _ in self._calls if f)
+            slows = sum(1 for _, s in self._calls if s)
+            if (
+                failures / len(self._calls) >= self.failure_rate
+                or slows / len(self._calls) >= self.slow_call_rate
+            ):
+                self._transition(CircuitState.OPEN)
+
+    def _maybe_half_open(self) -> None:
+        """Move open -> half-open once the cool-down has passed (lock held)."""
+        if (
+            self._state == CircuitState.OPEN
+            and self._clock() - self._opened_at >= self.open_seconds
+        ):
+            self._transition(CircuitState.HALF_OPEN)
+
+    def _transition(self, new: CircuitState) -> None:
+        """Change state and notify listeners (lock held)."""
+        old = self._state
+        if old == new:
+            return
+        self._state = new
+        if new == CircuitState.OPEN:
+            self._opened_at = self._clock()
+        if new != CircuitState.HALF_OPEN:
+            self._probes = 0
+        self.transitions.append({
+            "from": old.value,
+            "to": new.value,
+            "at": datetime.now().isoformat(),
+        })
+        CIRCUIT_STATE.set(_STATE_VALUES[new], endpoint=self.name)
+        CIRCUIT_TRANSITIONS.inc(endpoint=self.name, state=new.value)
+        log = logger.warning if new == CircuitState.OPEN else logger.info
+        log(f"Circuit '{self.name}' {old.value} -> {new.value}")
+        for listener in self._listeners:
+            try:
+                listener(self.name, old, new)
+            except Exception as e:
+                logger.error(f"Circuit listener failed: {e}")
+
+    def snapshot(self) -> dict[str, Any]:
+        """State and recent window statistics for monitoring."""
+        state = self.state
+        with self._lock:
+            calls = list(self._calls)
+        return {
+            "name": self.name,
+            "state": state.value,
+            "calls": len(calls),
+            "failures": sum(1 for f, _ in calls if f),
+            "slow_calls": sum(1 for _, s in calls if s),
+            "transitions": list(self.transitions),
+        }
+
+
+_breakers: dict[tuple[str, str], CircuitBreaker] = {}
+
+
+def get_breaker(settings: Settings, operation: str) -> CircuitBreaker:
+    """Get the process-wide breaker for an Orca URL and operation."""
+    key = (settings.orca_url, operation)
+    breaker = _breakers.get(key)
+    if breaker is None:
+        breaker = _breakers[key] = CircuitBreaker(
+            f"orca.{operation}",
+            failure_rate=settings.orca_circuit_failure_rate,
+            slow_call_seconds=settings.orca_circuit_slow_call_seconds,
+            slow_call_rate=settings.orca_circuit_slow_call_rate,
+            window=settings.orca_circuit_window,
+            min_calls=settings.orca_circuit_min_calls,
+            open_seconds=settings.orca_circuit_open_seconds,
+        )
+    return breaker
+
+
+def snapshot_all(orca_url: Optional[str] = None) -> list[dict[str, Any]]:
+    """Snapshots of every breaker (optionally for one Orca URL)."""
+    return [
+        {"orca_url": url, **breaker.snapshot()}
+        for (url, _), breaker in list(_breakers.items())
+        if orca_url is None or url == orca_url
+    ]
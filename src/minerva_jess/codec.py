@@ -0,0 +1,165 @@
+"""
+JSON codec for Minerva-Jess.
+
+One place to encode and decode JSON: Orca responses, web.py responses
+and the data files. The fastest installed backend is used (orjson, then
+msgspec, then the stdlib ``json``); set JESS_JSON_CODEC to force one,
+or register another with register_codec().
+
+Encoding always produces compact UTF-8 bytes unless ``indent=True``.
+Objects JSON doesn't know (datetimes, paths, ...) are encoded with str().
+
+Example:
+    from minerva_jess import codec
+
+    data = codec.loads(response.content)     # bytes straight from the socket
+    codec.write_file(path, {"videos": videos})
+    codec.BACKEND.name                        # "orjson", "msgspec" or "json"
+"""
+
+import json
+import logging
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+JSONInput = Union[bytes, bytearray, memoryview, str]
+
+
+@dataclass(frozen=True)
+class Codec:
+    """An encode/decode pair. ``dumps`` returns UTF-8 bytes; ``loads`` raises ValueError."""
+
+    name: str
+    dumps: Callable[[Any, bool], bytes]
+    loads: Callable[[JSONInput], Any]
+
+
+def _stdlib() -> Codec:
+    # ASCII-escaped output: the stdlib encodes and decodes it fastest
+    def dumps(obj: Any, indent: bool = False) -> bytes:
+        if indent:
+            return json.dumps(obj, indent=2, default=str).encode()
+        return json.dumps(obj, separators=(",", ":"), default=str).encode()
+
+    return Codec("json", dumps, json.loads)
+
+
+def _orjson() -> Codec:
+    import orjson
+
+    compact = orjson.OPT_NON_STR_KEYS
+    indented = compact | orjson.OPT_INDENT_2
+
+    def dumps(obj: Any, indent: bool = False) -> bytes:
+        return orjson.dumps(obj, default=str, option=indented if indent else compact)
+
+    return Codec("orjson", dumps, orjson.loads)
+
+
+def _msgspec() -> Codec:
+    import msgspec
+
+    encoder = msgspec.json.Encoder(enc_hook=str)
+    decoder = msgspec.json.Decoder()
+
+    def dumps(obj: Any, indent: bool = False) -> bytes:
+        data = encoder.encode(obj)
+        return msgspec.json.format(data, indent=2) if indent else data
+
+    def loads(data: JSONInput) -> Any:
+        try:
+            return decoder.decode(data.encode() if isinstance(data, str) else data)
+        except msgspec.DecodeError as e:
+            raise ValueError(str(e)) from e  # Same contract as json/orjson
+
+    return Codec("msgspec", dumps, loads)
+
+
+# Factories in order of preference; each raises ImportError if unavailable
+CODECS: dict[str, Callable[[], Codec]] = {
+    "orjson": _orjson,
+    "msgspec": _msgspec,
+    "json": _stdlib,
+}
+
+
+def register_codec(name: str, factory: Callable[[], Codec]) -> None:
+    """Make another backend selectable by name (via use() or JESS_JSON_CODEC)."""
+    CODECS[name] = factory
+
+
+def available() -> list[str]:
+    """Backends that can be loaded in this environment."""
+    names = []
+    for name, factory in CODECS.items():
+        try:
+            factory()
+        except ImportError:
+            continue
+        names.append(name)
+    return names
+
+
+def use(name: Optional[str] = None) -> Codec:
+    """
+    Switch the process-wide backend.
+
+    Args:
+        name: Backend name; the fastest available when omitted
+
+    Returns:
+        The active codec
+    """
+    global BACKEND
+    candidates = [name] if name else list(CODECS)
+    for candidate in candidates:
+        factory = CODECS.get(candidate)
+        if factory is None:
+            raise ValueError(f"Unknown JSON codec: {candidate}")
+        try:
+            BACKEND = factory()
+            return BACKEND
+        except ImportError:
+            if name:
+                logger.warning(f"JSON codec {name} is not installed; using the stdlib")
+    BACKEND = _stdlib()
+    return BACKEND
+
+
+BACKEND: Codec = _stdlib()
+try:
+    use(os.environ.get("JESS_JSON_CODEC") or None)
+except ValueError as e:
+    logger.warning(f"{e}; using the stdlib")
+
+
+def dumps(obj: Any, indent: bool = False) -> bytes:
+    """Encode to UTF-8 JSON bytes (compact unless `indent`)."""
+    return BACKEND.dumps(obj, indent)
+
+
+def dumps_str(obj: Any, indent: bool = False) -> str:
+    """Encode to a JSON string."""
+    return BACKEND.dumps(obj, indent).decode()
+
+
+def loads(data: JSONInput) -> Any:
+    """Decode JSON from bytes or str."""
+    return BACKEND.loads(data)
+
+
+def read_file(path: Union[str, Path]) -> Any:
+    """Decode a JSON file (raises FileNotFoundError / ValueError)."""
+    with open(path, "rb") as f:
+        return BACKEND.loads(f.read())
+
+
+def write_file(path: Union[str, Path], obj: Any, indent: bool = False) -> None:
+    """Encode `obj` to a JSON file, compact unless `indent`."""
+    data = BACKEND.dumps(obj, indent)
+    with open(path, "wb") as f:
+        f.write(data)
@@ -7,12 +7,13 @@ Settings are loaded from environment variables and optional config.yaml file.
 import logging
 from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Mapping, Optional
 
-import yaml
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+from minerva_jess.catalog import CatalogView
+
 
 class Settings(BaseSettings):
     """Application settings from environment variables."""
@@ -34,6 +35,146 @@ class Settings(BaseSettings):
         description="Authentication token for Orca",
     )
 
+    # Orca connection pool (shared per orca_url/token, see orca_pool.py)
+    orca_shared_pool: bool = Field(
+        default=True,
+        description="Share one HTTP connection pool across all Orca clients",
+    )
+    orca_max_connections: int = Field(
+        default=100,
+        description="Maximum concurrent connections to Orca",
+    )
+    orca_max_keepalive_connections: int = Field(
+        default=20,
+        description="Maximum idle keep-alive connections to Orca",
+    )
+    orca_keepalive_expiry: float = Field(
+        default=30.0,
+        description="Seconds an idle keep-alive connection is kept",
+    )
+    orca_http2: bool = Field(
+        default=False,
+        description="Use HTTP/2 for Orca (requires the 'h2' package)",
+    )
+    orca_connect_timeout: float = Field(
+        default=5.0,
+        description="Connect timeout for Orca requests (seconds)",
+    )
+    orca_search_timeout: float = Field(
+        default=30.0,
+        description="Timeout for Orca search requests (seconds)",
+    )
+    orca_synthesize_timeout: float = Field(
+        default=60.0,
+        description="Timeout for Orca synthesis requests (seconds)",
+    )
+    orca_list_timeout: float = Field(
+        default=30.0,
+        description="Timeout for Orca list/transcript requests (seconds)",
+    )
+
+    # Request hedging for search/list (see hedging.py)
+    orca_hedge_enabled: bool = Field(
+        default=False,
+        description="Send a duplicate search/list request when the first is slow",
+    )
+    orca_hedge_percentile: float = Field(
+        default=0.95,
+        description="Latency percentile (0-1) after which a hedge is fired",
+    )
+    orca_hedge_min_delay: float = Field(
+        default=0.05,
+        description="Minimum seconds to wait before hedging",
+    )
+    orca_hedge_budget: float = Field(
+        default=0.1,
+        description="Maximum fraction of extra requests spent on hedges",
+    )
+    orca_hedge_min_samples: int = Field(
+        default=20,
+        description="Recent latencies required before hedging starts",
+    )
+
+    # Circuit breakers per Orca endpoint (see circuit.py)
+    orca_circuit_enabled: bool = Field(
+        default=True,
+        description="Fail fast while an Orca endpoint is failing",
+    )
+    orca_circuit_failure_rate: float = Field(
+        default=0.5,
+        description="Failure fraction of recent calls that opens the circuit",
+    )
+    orca_circuit_slow_call_seconds: float = Field(
+        default=10.0,
+        description="Calls slower than this count as slow",
+    )
+    orca_circuit_slow_call_rate: float = Field(
+        default=0.8,
+        description="Slow fraction of recent calls that opens the circuit",
+    )
+    orca_circuit_window: int = Field(
+        default=20,
+        description="Number of recent calls the breaker considers",
+    )
+    orca_circuit_min_calls: int = Field(
+        default=10,
+        description="Calls required before the circuit can open",
+    )
+    orca_circuit_open_seconds: float = Field(
+        default=30.0,
+        description="Seconds the circuit stays open before a probe is allowed",
+    )
+
+    # Response caches (see cache.py)
+    orca_cache_enabled: bool = Field(
+        default=True,
+        description="Cache search results and synthesized answers in memory",
+    )
+    orca_search_cache_size: int = Field(
+        default=1024,
+        description="Maximum cached search results",
+    )
+    orca_search_cache_ttl: float = Field(
+        default=300.0,
+        description="Seconds a cached search result stays fresh",
+    )
+    orca_synthesis_cache_size: int = Field(
+        default=512,
+        description="Maximum cached synthesized answers",
+    )
+    orca_synthesis_cache_ttl: float = Field(
+        default=900.0,
+        description="Seconds a cached synthesized answer stays fresh",
+    )
+    orca_catalog_ttl: float = Field(
+        default=3600.0,
+        description="Seconds before the video catalog is refreshed in the background",
+    )
+
+    # Shared on-disk cache behind the in-memory ones (see disk_cache.py)
+    orca_disk_cache_path: Optional[str] = Field(
+        default=None,
+        description="SQLite file shared by workers on this host (disabled when unset)",
+    )
+    orca_disk_cache_max_mb: float = Field(
+        default=256.0,
+        description="Cached payload megabytes kept before least recently used entries go",
+    )
+    orca_disk_cache_sweep_seconds: float = Field(
+        default=60.0,
+        description="Seconds between sweeps for expired and over-budget entries",
+    )
+    orca_transcript_cache_ttl: float = Field(
+        default=86400.0,
+        description="Seconds a transcript stays fresh in the disk cache",
+    )
+
+    # Video catalog (see catalog.py)
+    catalog_cache_path: Optional[str] = Field(
+        default=None,
+        description="videos_cache.json merged into the catalog (default: in JESS_DATA_DIR)",
+    )
+
     # Search settings
     max_search_results: int = Field(
         default=10,
@@ -49,6 +190,18 @@ class Settings(BaseSettings):
         default=1024,
         description="Maximum tokens for synthesized answers",
     )
+    max_synthesis_input_tokens: int = Field(
+        default=3000,
+        description="Approximate token budget for segments sent to synthesis",
+    )
+    max_synthesis_segments: int = Field(
+        default=5,
+        description="Maximum segments sent to synthesis",
+    )
+    synthesis_merge_gap: float = Field(
+        default=2.0,
+        description="Seconds between same-video segments that are merged before synthesis",
+    )
 
     # Logging
     log_level: str = Field(
@@ -85,6 +238,8 @@ class AgentConfig:
             config_path = Path("config.yaml")
 
         if config_path.exists():
+            import yaml  # Only needed when a config file exists
+
             with open(config_path) as f:
                 self._config = yaml.safe_load(f) or {}
 
@@ -126,6 +281,12 @@ class AgentConfig:
         """Minimum relevance threshold."""
         return self._config.get("search", {}).get("min_relevance", 0.0)
 
+    # Intent routing
+    @property
+    def intents(self) -> dict:
+        """Extra intents and phrases (merged with the defaults in intents.py)."""
+        return self._config.get("intents", {}) or {}
+
 
 @lru_cache
 def get_settings() -> Settings:
@@ -139,47 +300,6 @@ def get_agent_config() -> AgentConfig:
     return AgentConfig()
 
 
-# Video catalog - metadata for known videos
-VIDEO_CATALOG: dict[str, dict] = {
-    "SKfMmH9Bk4o": {
-        "title": "Are we in an AI bubble?",
-        "topics": ["AI", "technology", "market bubble", "valuations", "Nvidia"],
-        "publish_date": "2024-06-15",
-        "view_count": 15420,
-        "featured": True,
-        "description": "Discussion of AI market dynamics and valuation concerns.",
-    },
-    "AOVpTvMW6ro": {
-        "title": "Governance, Growth and Volatility: Navigating ASEAN",
-        "topics": ["ASEAN", "emerging markets", "governance", "Southeast Asia"],
-        "publish_date": "2024-05-22",
-        "view_count": 8750,
-        "featured": True,
-        "description": "Analysis of Southeast Asian markets and opportunities.",
-    },
-    "biVXxcjM4ws": {
-        "title": "China R&D Surge: From fast follower to innovation powerhouse",
-        "topics": ["China", "R&D", "innovation", "technology", "EVs"],
-        "publish_date": "2024-04-10",
-        "view_count": 12300,
-        "featured": False,
-        "description": "How China became a global innovation leader.",
-    },
-    "J9izUotQ6Ls": {"title": "China's two-part strategy and the shifting global landscape"},
-    "L5P2q3Ffazg": {"title": "Apple's dependence on China and the 'Catfish effect'"},
-    "pLHDv--lr4U": {"title": "Fighting inflation with real assets"},
-    "Khp3B8cXKbk": {"title": "Building the backbone of the AI revolution"},
-    "WLXPgQUS4UI": {"title": "AI After the Magnificent Seven"},
-    "d6-oSabOAEI": {"title": "Real Assets in an Unstable World"},
-    "A9kV-HZjinQ": {"title": "What investors should know about the current US Budget Deficit"},
-    "p3eHt8PiN_I": {"title": "A Quick Take on Tariffs"},
-    "NXpheKdhwwc": {"title": "Revisiting the case for the Magnificent Seven"},
-    "gmWLTbzVtp8": {"title": "Asia's manufacturing resilience"},
-    "e4rJqlZZ_RI": {"title": "Asia's growth story revived"},
-    "2CbZXBn4QlM": {"title": "Understanding China's Economic Transition"},
-    "kkpz7Z1ut38": {"title": "Global Equity Income - 2025 Outlook"},
-    "sKUAKjRk-2Q": {"title": "Global Innovators - 2025 Outlook"},
-    "XpLfQzLGn2U": {"title": "Global Energy - 2025 Outlook"},
-    "d2WY9i1E1mw": {"title": "The Magnificent Seven"},
-    "S4KGXIY2AGw": {"title": "Opportunities across the Semiconductor industry"},
-}
+# Video catalog - metadata for known videos, loaded lazily from
+# data/videos_cache.json and the packaged enrichment file (see catalog.py)
+VIDEO_CATALOG: Mapping[str, dict] = CatalogView()
@@ -0,0 +1,305 @@
+"""
+Shared on-disk cache for Orca responses.
+
+A second cache level behind the in-memory caches (cache.py), stored in
+SQLite so every uvicorn worker and batch process on a host shares the
+same entries instead of each warming its own from Orca. The database
+runs in WAL mode, so readers never block each other or a writer.
+
+Entries expire after a per-entry TTL. A background sweeper thread drops
+expired entries and, when the file holds more than ``max_bytes`` of
+values, evicts the least recently used ones. The schema version is kept
+in a meta table; opening a cache written by a different version wipes
+it, so upgrades never read stale formats.
+
+Enable it with ORCA_DISK_CACHE_PATH (see Settings).
+
+Example:
+    cache = DiskCache("data/orca_cache.sqlite3", max_bytes=256 * 2**20)
+    cache.set("search", "ai bubble|10", payload, ttl=300)
+    payload = cache.get("search", "ai bubble|10")   # bytes or None
+    raw = await cache.aget("search", key)           # from async code
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Optional, Union
+
+from minerva_jess import metrics
+from minerva_jess.config import Settings
+
+logger = logging.getLogger(__name__)
+
+# Bump whenever the table layout or any stored payload format changes
+SCHEMA_VERSION = 1
+
+DISK_CACHE_EVICTIONS = metrics.REGISTRY.counter(
+    "jess_disk_cache_evictions_total",
+    "Entries removed from the on-disk cache, by reason (expired/lru).",
+    ("reason",),
+)
+
+_SCHEMA = (
+    """CREATE TABLE IF NOT EXISTS entries (
+        namespace TEXT NOT NULL,
+        key TEXT NOT NULL,
+        value BLOB NOT NULL,
+        size INTEGER NOT NULL,
+        expires_at REAL NOT NULL,
+        accessed_at REAL NOT NULL,
+        PRIMARY KEY (namespace, key)
+    ) WITHOUT ROWID""",
+    "CREATE INDEX IF NOT EXISTS entries_accessed ON entries (accessed_at)",
+    "CREATE INDEX IF NOT EXISTS entries_expires ON entries (expires_at)",
+)
+
+
+def make_key(parts: Any) -> str:
+    """
+    Stable short key for any JSON-serializable key (tuples, strings, ...).
+
+    Serialized with the stdlib encoder, not codec, so processes running
+    different codec backends agree on keys (they escape non-ASCII
+    differently).
+    """
+    data = json.dumps(parts, sort_keys=True, ensure_ascii=True, separators=(",", ":"))
+    return hashlib.sha256(data.encode()).hexdigest()
+
+
+class DiskCache:
+    """
+    SQLite-backed TTL + LRU cache of byte payloads, safe across processes.
+
+    Args:
+        path: SQLite file (created with its directory if missing)
+        max_bytes: Value bytes kept before the sweeper evicts LRU entries
+        sweep_interval: Seconds between sweeps (0 disables the sweeper thread)
+        clock: Wall-clock time source (shared between processes)
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        max_bytes: int = 256 * 2**20,
+        sweep_interval: float = 60.0,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self.sweep_interval = sweep_interval
+        self._clock = clock
+        self._local = threading.local()
+        self._stop = threading.Event()
+        self._sweeper: Optional[threading.Thread] = None
+        self.hits = 0
+        self.misses = 0
+        self.errors = 0
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._migrate()
+        if sweep_interval > 0:
+            self._sweeper = threading.Thread(
+                target=self._sweep_loop, name="jess-disk-cache-sweeper", daemon=True
+            )
+            self._sweeper.start()
+
+    def _connect(self) -> sqlite3.Connection:
+        """This thread's connection (sqlite3 connections aren't shared across threads)."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=5.0, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def _migrate(self) -> None:
+        """Create the schema, wiping entries written by another schema version."""
+        conn = self._connect()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+            row = conn.execute("SELECT value FROM meta WHERE key = 'schema_version'").fetchone()
+            if row is None or row[0] != str(SCHEMA_VERSION):
+                if row is not None:
+                    logger.info(
+                        f"Disk cache {self.path} has schema {row[0]}, "
+                        f"expected {SCHEMA_VERSION}; clearing it"
+                    )
+                conn.execute("DROP TABLE IF EXISTS entries")
+                conn.execute(
+                    "INSERT OR REPLACE INTO meta (key, value) VALUES ('schema_version', ?)",
+                    (str(SCHEMA_VERSION),),
+                )
+            for statement in _SCHEMA:
+                conn.execute(statement)
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+
+    def get(self, namespace: str, key: str) -> Optional[bytes]:
+        """
+        Fresh payload for a key, or None (also on database errors).
+
+        Args:
+            namespace: Cache name plus anything that scopes it (e.g. Orca URL)
+            key: Entry key (see make_key)
+        """
+        now = self._clock()
+        try:
+            conn = self._connect()
+            row = conn.execute(
+                "SELECT value, expires_at FROM entries WHERE namespace = ? AND key = ?",
+                (namespace, key),
+            ).fetchone()
+        except sqlite3.Error as e:
+            self.errors += 1
+            logger.warning(f"Disk cache read failed: {e}")
+            row = None
+
+        hit = row is not None and row[1] > now
+        if hit:
+            # Recency only steers eviction; a locked database must not turn a hit into a miss
+            try:
+                conn.execute(
+                    "UPDATE entries SET accessed_at = ? WHERE namespace = ? AND key = ?",
+                    (now, namespace, key),
+                )
+            except sqlite3.Error as e:
+                logger.debug(f"Disk cache access time not updated: {e}")
+        if hit:
+            self.hits += 1
+        else:
+            self.misses += 1
+        metrics.record_cache(f"disk_{namespace.rsplit(':', 1)[-1]}", hit)
+        return bytes(row[0]) if hit else None
+
+    def set(self, namespace: str, key: str, value: bytes, ttl: float) -> None:
+        """Store a payload for `ttl` seconds (errors are logged, not raised)."""
+        now = self._clock()
+        try:
+            self._connect().execute(
+                "INSERT OR REPLACE INTO entries "
+                "(namespace, key, value, size, expires_at, accessed_at) VALUES (?, ?, ?, ?, ?, ?)",
+                (namespace, key, value, len(value), now + ttl, now),
+            )
+        except sqlite3.Error as e:
+            self.errors += 1
+            logger.warning(f"Disk cache write failed: {e}")
+
+    async def aget(self, namespace: str, key: str) -> Optional[bytes]:
+        """get() on a worker thread, so the event loop never waits on the database."""
+        return await asyncio.to_thread(self.get, namespace, key)
+
+    async def aset(self, namespace: str, key: str, value: bytes, ttl: float) -> None:
+        """set() on a worker thread."""
+        await asyncio.to_thread(self.set, namespace, key, value, ttl)
+
+    def sweep(self) -> dict[str, int]:
+        """
+        Drop expired entries, then least recently used ones above max_bytes.
+
+        Returns:
+            Number of entries removed per reason
+        """
+        conn = self._connect()
+        expired = conn.execute(
+            "DELETE FROM entries WHERE expires_at <= ?", (self._clock(),)
+        ).rowcount
+        evicted = 0
+        total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+        if total > self.max_bytes:
+            # Walk from the oldest access until enough bytes are freed
+            excess, cutoff = total - self.max_bytes, None
+            for accessed_at, size in conn.execute(
+                "SELECT accessed_at, size FROM entries ORDER BY accessed_at"
+            ):
+                excess -= size
+                cutoff = accessed_at
+                if excess <= 0:
+                    break
+            if cutoff is not None:
+                evicted = conn.execute(
+                    "DELETE FROM entries WHERE accessed_at <= ?", (cutoff,)
+                ).rowcount
+        if expired:
+            DISK_CACHE_EVICTIONS.inc(expired, reason="expired")
+        if evicted:
+            DISK_CACHE_EVICTIONS.inc(evicted, reason="lru")
+        return {"expired": expired, "lru": evicted}
+
+    def _sweep_loop(self) -> None:
+        while not self._stop.wait(self.sweep_interval):
+            try:
+                self.sweep()
+            except sqlite3.Error as e:
+                logger.warning(f"Disk cache sweep failed: {e}")
+
+    def clear(self) -> None:
+        """Drop every entry (all namespaces)."""
+        self._connect().execute("DELETE FROM entries")
+
+    def close(self) -> None:
+        """Stop the sweeper and close this thread's connection."""
+        self._stop.set()
+        if self._sweeper is not None and self._sweeper is not threading.current_thread():
+            self._sweeper.join(timeout=5.0)
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+    def stats(self) -> dict[str, Any]:
+        """Entry count, stored bytes and this process's hit statistics."""
+        try:
+            count, size = self._connect().execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries"
+            ).fetchone()
+        except sqlite3.Error:
+            count, size = None, None
+        lookups = self.hits + self.misses
+        return {
+            "path": str(self.path),
+            "entries": count,
+            "bytes": size,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "errors": self.errors,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+        }
+
+
+_lock = threading.Lock()
+_disk_caches: dict[str, DiskCache] = {}
+
+
+def get_disk_cache(settings: Settings) -> Optional[DiskCache]:
+    """Process-wide disk cache for the configured path (None when disabled)."""
+    if not settings.orca_disk_cache_path:
+        return None
+    path = str(Path(settings.orca_disk_cache_path).resolve())
+    cache = _disk_caches.get(path)
+    if cache is None:
+        with _lock:
+            cache = _disk_caches.get(path)
+            if cache is None:
+                cache = _disk_caches[path] = DiskCache(
+                    path,
+                    max_bytes=int(settings.orca_disk_cache_max_mb * 2**20),
+                    sweep_interval=settings.orca_disk_cache_sweep_seconds,
+                )
+    return cache
+
+
+def namespace(settings: Settings, name: str) -> str:
+    """Namespace for one cache of one Orca (the token is hashed, never stored)."""
+    token = hashlib.sha256((settings.orca_token or "").encode()).hexdigest()[:12]
+    return f"{settings.orca_url}:{token}:{name}"
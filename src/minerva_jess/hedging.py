@@ -0,0 +1,220 @@
+"""
+Request hedging for Orca calls.
+
+If a request hasn't answered within a latency percentile learned from
+recent calls, an identical second request is fired and whichever
+finishes first is used. Results the caller marks as failed (e.g. 5xx
+responses) don't win the race or teach the tracker. A token budget caps the extra load: each
+primary request earns ``budget`` tokens and each hedge spends one, so
+hedges stay below that fraction of traffic.
+
+Hedgers are shared per (orca_url, operation) so every client in the
+process learns from the same latency history.
+
+Example:
+    hedger = get_hedger(settings, "search")
+    response = await hedger.run(lambda: client.post("/video/search", json=payload))
+"""
+
+import asyncio
+import logging
+import time
+from collections import deque
+from typing import Awaitable, Callable, Optional, TypeVar
+
+from minerva_jess import metrics
+from minerva_jess.config import Settings
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+HEDGES = metrics.REGISTRY.counter(
+    "jess_orca_hedges_total",
+    "Hedged Orca requests by outcome (fired, won, lost, skipped_budget).",
+    ("operation", "outcome"),
+)
+
+
+class _FailedAttemptError(Exception):
+    """Carries a result the caller's `failed` predicate rejected."""
+
+    def __init__(self, result):
+        super().__init__("attempt returned a failed result")
+        self.result = result
+
+
+class LatencyTracker:
+    """Sliding window of recent latencies with a cached percentile."""
+
+    def __init__(self, window: int = 200, min_samples: int = 20, recompute_every: int = 10):
+        self._samples: deque[float] = deque(maxlen=window)
+        self.min_samples = min_samples
+        self._recompute_every = recompute_every
+        self._since_recompute = 0
+        self._cached: dict[float, float] = {}
+
+    def record(self, latency: float) -> None:
+        """Add one observed latency (seconds)."""
+        self._samples.append(latency)
+        self._since_recompute += 1
+        if self._since_recompute >= self._recompute_every:
+            self._cached.clear()
+            self._since_recompute = 0
+
+    def percentile(self, pct: float) -> Optional[float]:
+        """Latency at `pct` (0-1), or None until enough samples exist."""
+        if len(self._samples) < self.min_samples:
+            return None
+        value = self._cached.get(pct)
+        if value is None:
+            ordered = sorted(self._samples)
+            value = ordered[min(len(ordered) - 1, int(pct * len(ordered)))]
+            self._cached[pct] = value
+        return value
+
+
+class HedgeBudget:
+    """Token bucket limiting hedges to a fraction of requests."""
+
+    def __init__(self, ratio: float = 0.1, burst: float = 10.0):
+        self.ratio = ratio
+        self.burst = burst
+        self._tokens = 0.0
+
+    def earn(self) -> None:
+        """Credit one primary request."""
+        self._tokens = min(self.burst, self._tokens + self.ratio)
+
+    def try_spend(self) -> bool:
+        """Take a token for a hedge if one is available."""
+        if self._tokens >= 1.0:
+            self._tokens -= 1.0
+            return True
+        return False
+
+
+class Hedger:
+    """
+    Runs a request, hedging it with a duplicate if it is slow.
+
+    Args:
+        operation: Operation name for metrics (e.g. "search")
+        percentile: Latency percentile (0-1) after which to hedge
+        min_delay: Never hedge earlier than this (seconds)
+        budget: Maximum fraction of extra requests
+        window: Number of recent latencies to learn from
+        min_samples: Latencies needed before hedging starts
+    """
+
+    def __init__(
+        self,
+        operation: str,
+        percentile: float = 0.95,
+        min_delay: float = 0.05,
+        budget: float = 0.1,
+        window: int = 200,
+        min_samples: int = 20,
+    ):
+        self.operation = operation
+        self.percentile = percentile
+        self.min_delay = min_delay
+        self.latencies = LatencyTracker(window=window, min_samples=min_samples)
+        self.budget = HedgeBudget(ratio=budget)
+
+    def hedge_delay(self) -> Optional[float]:
+        """Seconds to wait before hedging, or None if not enough history."""
+        learned = self.latencies.percentile(self.percentile)
+        return None if learned is None else max(learned, self.min_delay)
+
+    async def _timed(
+        self, attempt: Callable[[], Awaitable[T]], failed: Optional[Callable[[T], bool]]
+    ) -> T:
+        start = time.perf_counter()
+        try:
+            result = await attempt()
+        except asyncio.CancelledError:
+            # A slow attempt cut short took at least this long; dropping it skews the window fast
+            self.latencies.record(time.perf_counter() - start)
+            raise
+        if failed is not None and failed(result):
+            raise _FailedAttemptError(result)
+        self.latencies.record(time.perf_counter() - start)
+        return result
+
+    async def run(
+        self,
+        attempt: Callable[[], Awaitable[T]],
+        failed: Optional[Callable[[T], bool]] = None,
+    ) -> T:
+        """
+        Run `attempt`, firing one duplicate if it outlives the hedge delay.
+
+        Args:
+            attempt: Zero-argument callable returning a fresh awaitable
+            failed: Predicate marking a returned result as a failure (e.g. a 5xx
+                response), so the other attempt is preferred and its latency isn't learned
+
+        Returns:
+            Result of whichever attempt finished first (successfully, if either did)
+        """
+        try:
+            return await self._race(attempt, failed)
+        except _FailedAttemptError as e:
+            return e.result
+
+    async def _race(
+        self, attempt: Callable[[], Awaitable[T]], failed: Optional[Callable[[T], bool]]
+    ) -> T:
+        self.budget.earn()
+        delay = self.hedge_delay()
+        if delay is None:
+            return await self._timed(attempt, failed)
+
+        primary = asyncio.ensure_future(self._timed(attempt, failed))
+        try:
+            done, _ = await asyncio.wait({primary}, timeout=delay)
+            if done:
+                return primary.result()
+
+            if not self.budget.try_spend():
+                HEDGES.inc(operation=self.operation, outcome="skipped_budget")
+                return await primary
+
+            HEDGES.inc(operation=self.operation, outcome="fired")
+            hedge = asyncio.ensure_future(self._timed(attempt, failed))
+            pending = {primary, hedge}
+            try:
+                while pending:
+                    done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                    # Prefer a successful attempt; fall through to the other if one failed
+                    for task in sorted(done, key=lambda t: t.exception() is not None):
+                        if task.exception() is None or not pending:
+                            outcome = "won" if task is hedge else "lost"
+                            HEDGES.inc(operation=self.operation, outcome=outcome)
+                            return task.result()
+            finally:
+                for task in pending:
+                    task.cancel()
+            raise RuntimeError("unreachable")  # pragma: no cover
+        finally:
+            if not primary.done():
+                primary.cancel()
+
+
+_hedgers: dict[tuple[str, str], Hedger] = {}
+
+
+def get_hedger(settings: Settings, operation: str) -> Hedger:
+    """Get the process-wide hedger for an Orca URL and operation."""
+    key = (settings.orca_url, operation)
+    hedger = _hedgers.get(key)
+    if hedger is None:
+        hedger = _hedgers[key] = Hedger(
+            operation,
+            percentile=settings.orca_hedge_percentile,
+            min_delay=settings.orca_hedge_min_delay,
+            budget=settings.orca_hedge_budget,
+            min_samples=settings.orca_hedge_min_samples,
+        )
+    return hedger
@@ -0,0 +1,226 @@
+"""
+Intent routing for user queries.
+
+Every intent phrase (built-in defaults plus any under ``intents:`` in
+config.yaml) is compiled once into a single regex, shaped as a prefix
+trie so shared prefixes are tested once. A query is routed with one
+scan, so the cost stays roughly flat as phrases are added. Each intent
+carries parameters (e.g. ``sort``) and a priority that picks the winner
+when a query matches several intents.
+
+Phrases match case-insensitively at the start of a word (they may run
+on, so "recommend" matches "recommendations"). Phrases in scripts
+written without spaces (e.g. Japanese) match anywhere.
+
+Example:
+    router = IntentRouter.from_config(agent_config)
+    match = router.route("what are the most popular videos?")
+    # IntentMatch(intent="recommend_popular", params={"sort": "popular"}, phrase="most popular")
+
+config.yaml:
+    intents:
+      recommend_popular:
+        phrases: ["crowd favourites"]   # added to the defaults
+      recommend_webinars:
+        priority: 5
+        params: {sort: latest, format: webinar}
+        phrases: ["webinar", "webinars"]
+"""
+
+import re
+from dataclasses import dataclass, field
+from typing import Any, Mapping, Optional
+
+# Built-in intents, including phrasings for the translated audiences
+# (Spanish, French, German, Italian, Portuguese, Japanese, Hindi, Polish)
+DEFAULT_INTENTS: dict[str, dict[str, Any]] = {
+    "recommend_popular": {
+        "priority": 30,
+        "params": {"sort": "popular"},
+        "phrases": [
+            "popular", "most viewed", "most watched",
+            "más vistos", "más populares",
+            "plus populaire", "plus populaires", "plus vues", "plus regardées",
+            "beliebteste", "meistgesehen",
+            "più popolari", "più visti",
+            "mais populares", "mais vistos",
+            "人気",
+            "लोकप्रिय", "सबसे ज़्यादा देखे",
+            "najpopularniejsze", "najczęściej oglądane",
+        ],
+    },
+    "recommend_latest": {
+        "priority": 20,
+        "params": {"sort": "latest"},
+        "phrases": [
+            "latest", "newest",
+            "más recientes", "lo último", "últimos videos",
+            "plus récentes", "dernières vidéos",
+            "neueste",
+            "più recenti", "ultimi video",
+            "mais recentes", "últimos vídeos",
+            "最新", "新着",
+            "नवीनतम", "नए वीडियो",
+            "najnowsze",
+        ],
+    },
+    "recommend_featured": {
+        "priority": 10,
+        "params": {"sort": "featured"},
+        "phrases": [
+            "featured",
+            "destacados", "destacado",
+            "à la une", "en vedette",
+            "hervorgehoben", "empfohlene videos",
+            "in evidenza",
+            "em destaque",
+            "注目",
+            "फ़ीचर्ड", "विशेष वीडियो",
+            "wyróżnione", "polecane",
+        ],
+    },
+    "recommend_topic": {
+        # Only routed when the query names a catalog topic (see JessAgent._route)
+        "priority": 5,
+        "params": {"sort": "default", "requires_topic": True},
+        "phrases": [
+            "videos about", "videos on", "anything about", "anything on", "videos covering",
+            "videos sobre", "vídeos sobre", "vidéos sur", "videos über", "video su",
+            "filmy o",
+        ],
+    },
+    "recommend": {
+        "priority": 0,
+        "params": {"sort": "default"},
+        "phrases": [
+            "help", "what should i watch", "recommend", "suggestion", "best video",
+            "what do you have", "what videos", "recent", "top video", "where to start",
+            "what can you show", "what topics", "what content", "list videos",
+            "available videos", "show videos",
+            "ayuda", "qué debería ver", "recomienda", "recomendación", "qué videos",
+            "aidez-moi", "besoin d'aide", "que devrais-je regarder", "recommande",
+            "quelles vidéos",
+            "hilfe", "was soll ich ansehen", "empfiehl", "empfehlung", "welche videos",
+            "aiuto", "cosa dovrei guardare", "consiglia", "quali video",
+            "ajuda", "o que devo assistir", "recomenda", "quais vídeos",
+            "ヘルプ", "おすすめ", "何を見れば", "どんな動画",
+            "मदद", "सुझाव", "क्या देखना चाहिए", "कौन से वीडियो",
+            "pomoc", "co powinienem obejrzeć", "poleć", "jakie filmy",
+        ],
+    },
+}
+
+
+@dataclass(frozen=True)
+class IntentMatch:
+    """The intent a query routed to."""
+
+    intent: str
+    params: dict[str, Any] = field(default_factory=dict)
+    phrase: str = ""
+
+
+def _needs_word_start(phrase: str) -> bool:
+    """Whether a phrase must start at a word boundary (not for CJK and similar scripts)."""
+    first = phrase[0]
+    return first.isalnum() and ord(first) < 0x3000
+
+
+def _trie_regex(phrases: list[str]) -> str:
+    """Regex matching any phrase, factored by common prefixes (longest match wins)."""
+    trie: dict = {}
+    for phrase in phrases:
+        node = trie
+        for char in phrase:
+            node = node.setdefault(char, {})
+        node[""] = True
+
+    def build(node: dict) -> str:
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        return f"(?:{body})?" if "" in node else body
+
+    return build(trie)
+
+
+class IntentRouter:
+    """
+    Routes queries to intents with one compiled regex.
+
+    Args:
+        intents: Intent name -> {"phrases": [...], "params": {...}, "priority": int}
+    """
+
+    def __init__(self, intents: Mapping[str, Mapping[str, Any]]):
+        self.intents = {name: dict(spec) for name, spec in intents.items()}
+        self._phrases: dict[str, tuple[int, str, dict[str, Any]]] = {}
+        for name, spec in self.intents.items():
+            priority = int(spec.get("priority", 0))
+            params = dict(spec.get("params") or {})
+            for phrase in spec.get("phrases") or []:
+                phrase = " ".join(str(phrase).lower().split())
+                current = self._phrases.get(phrase)
+                if phrase and (current is None or priority > current[0]):
+                    self._phrases[phrase] = (priority, name, params)
+
+        bounded = [p for p in self._phrases if _needs_word_start(p)]
+        anywhere = [p for p in self._phrases if not _needs_word_start(p)]
+        parts = []
+        if bounded:
+            parts.append(rf"(?<!\w){_trie_regex(bounded)}")
+        if anywhere:
+            parts.append(_trie_regex(anywhere))
+        self._pattern = re.compile("|".join(parts)) if parts else None
+
+    @classmethod
+    def from_config(cls, config: Any = None) -> "IntentRouter":
+        """
+        Defaults merged with ``intents:`` from an AgentConfig.
+
+        Phrases for an existing intent are added to its defaults; params
+        and priority given in config override them.
+        """
+        merged = {name: dict(spec) for name, spec in DEFAULT_INTENTS.items()}
+        extra = getattr(config, "intents", None) if config is not None else None
+        if isinstance(extra, Mapping):
+            for name, spec in extra.items():
+                if not isinstance(spec, Mapping):
+                    continue
+                base = merged.setdefault(name, {"priority": 0, "params": {}, "phrases": []})
+                base["phrases"] = list(base.get("phrases", [])) + list(spec.get("phrases") or [])
+                if "params" in spec:
+                    base["params"] = {**base.get("params", {}), **(spec["params"] or {})}
+                if "priority" in spec:
+                    base["priority"] = spec["priority"]
+        return cls(merged)
+
+    def __len__(self) -> int:
+        return len(self._phrases)
+
+    def route(self, query: str) -> Optional[IntentMatch]:
+        """
+        Highest-priority intent matched anywhere in the query.
+
+        Args:
+            query: User query (already cleaned of @mentions)
+
+        Returns:
+            IntentMatch, or None if no intent phrase occurs
+        """
+        if self._pattern is None:
+            return None
+        text = " ".join(query.lower().split())
+        first = self._pattern.search(text)
+        if first is None:
+            return None  # Most queries are searches: one scan, no match objects
+        best: Optional[tuple[int, str, dict[str, Any]]] = None
+        best_phrase = ""
+        for match in self._pattern.finditer(text, first.start()):
+            entry = self._phrases[match.group()]
+            if best is None or entry[0] > best[0]:
+                best, best_phrase = entry, match.group()
+        if best is None:
+            return None
+        return IntentMatch(intent=best[1], params=dict(best[2]), phrase=best_phrase)
@@ -0,0 +1,336 @@
+"""
+Persistent job scheduler with priorities, rate limits and retries.
+
+Jobs live in a JsonStore file (see state.py), so a queue survives
+restarts and every web worker can run the scheduler: each tick claims
+jobs under the file lock (marking them "running" with a lease), runs
+them outside it and records the outcome. A worker that dies mid-job
+only holds its claim until the lease expires.
+
+Each tick starts at most as many jobs as the upstream has room for:
+``max_in_flight`` minus what ``in_flight()`` reports as still running
+there, and never more than ``quota`` starts per ``quota_window``.
+Higher priorities go first, then older jobs. A job that fails with a
+retryable error (429, 5xx, network) is retried with exponential backoff
+and jitter, or after the upstream's Retry-After, up to ``max_attempts``.
+
+Jobs are keyed (e.g. "video_id:language"); enqueueing a key that is
+already queued or running is skipped, as is anything the ``skip``
+callback rejects (e.g. already translated). Finished jobs and their
+batches are dropped after ``retention`` seconds, and a tick that claims
+nothing doesn't rewrite the file.
+
+Example:
+    scheduler = JobScheduler(JsonStore(DATA_DIR / "jobs.json"), run=submit, max_in_flight=3)
+    batch = scheduler.enqueue([{"key": "abc:French", "video_id": "abc"}], priority=5)
+    scheduler.run_once()                       # from a background loop
+    scheduler.progress(batch["batch_id"])      # {"counts": {"queued": 1, ...}, ...}
+"""
+
+import asyncio
+import logging
+import random
+import time
+import uuid
+from dataclasses import dataclass, field
+from typing import Any, Callable, Iterable, Optional
+
+from minerva_jess import metrics
+from minerva_jess.state import JsonStore
+
+logger = logging.getLogger(__name__)
+
+QUEUED, RUNNING, DONE, FAILED = "queued", "running", "done", "failed"
+
+# Job fields listed by progress()
+_PROGRESS_FIELDS = ("key", "state", "attempts", "error", "result", "next_attempt_at")
+
+JOBS_PROCESSED = metrics.REGISTRY.counter(
+    "jess_jobs_total",
+    "Scheduled job attempts by outcome (done, retry, failed).",
+    ("scheduler", "outcome"),
+)
+JOBS_QUEUED = metrics.REGISTRY.gauge(
+    "jess_jobs_queued",
+    "Jobs waiting in the scheduler queue.",
+    ("scheduler",),
+)
+
+
+@dataclass
+class Outcome:
+    """Result of running one job."""
+
+    ok: bool
+    result: dict[str, Any] = field(default_factory=dict)
+    error: str = ""
+    retryable: bool = False
+    retry_after: Optional[float] = None
+
+
+class JobScheduler:
+    """
+    Priority job queue persisted in a JsonStore.
+
+    Args:
+        store: File holding the queue
+        run: Runs one job (blocking) and reports the Outcome
+        name: Scheduler label for metrics
+        max_in_flight: Jobs allowed to be running upstream at once
+        in_flight: Jobs currently running upstream (besides claimed ones)
+        quota: Job starts allowed per quota_window (0 for no quota)
+        quota_window: Quota window in seconds
+        max_attempts: Attempts before a retryable job is marked failed
+        backoff_base: First retry delay in seconds (doubles per attempt)
+        backoff_max: Longest retry delay
+        lease: Seconds a claim is held before another worker may retake it
+        retention: Seconds finished jobs and batches are kept for progress()
+        clock: Wall-clock time source (shared between processes)
+    """
+
+    def __init__(
+        self,
+        store: JsonStore,
+        run: Callable[[dict[str, Any]], Outcome],
+        name: str = "jobs",
+        max_in_flight: int = 3,
+        in_flight: Optional[Callable[[], int]] = None,
+        quota: int = 0,
+        quota_window: float = 86400.0,
+        max_attempts: int = 5,
+        backoff_base: float = 30.0,
+        backoff_max: float = 1800.0,
+        lease: float = 300.0,
+        retention: float = 7 * 86400.0,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.store = store
+        self.run = run
+        self.name = name
+        self.max_in_flight = max_in_flight
+        self.in_flight = in_flight or (lambda: 0)
+        self.quota = quota
+        self.quota_window = quota_window
+        self.max_attempts = max_attempts
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.lease = lease
+        self.retention = retention
+        self._clock = clock
+
+    def enqueue(
+        self,
+        items: Iterable[dict[str, Any]],
+        priority: int = 0,
+        skip: Optional[Callable[[dict[str, Any]], Optional[str]]] = None,
+    ) -> dict[str, Any]:
+        """
+        Queue jobs as one batch.
+
+        Args:
+            items: Job payloads, each with a unique "key"
+            priority: Higher runs first (an item's own "priority" wins)
+            skip: Returns a reason to skip an item (None to queue it)
+
+        Returns:
+            {"batch_id", "queued": [keys], "skipped": [{"key", "reason"}]}
+        """
+        now = self._clock()
+        candidates, skipped = [], []
+        for item in items:
+            reason = skip(item) if skip is not None else None
+            if reason:
+                skipped.append({"key": item["key"], "reason": reason})
+            else:
+                candidates.append(item)
+
+        batch_id = uuid.uuid4().hex[:12]
+
+        def add(state: dict) -> list[str]:
+            jobs = state.setdefault("jobs", {})
+            queued = []
+            for item in candidates:
+                key = item["key"]
+                existing = jobs.get(key)
+                if existing is not None and existing["state"] in (QUEUED, RUNNING):
+                    skipped.append({"key": key, "reason": existing["state"]})
+                    continue
+                jobs[key] = {
+                    "key": key,
+                    "payload": {k: v for k, v in item.items() if k not in ("key", "priority")},
+                    "priority": item.get("priority", priority),
+                    "batch_id": batch_id,
+                    "state": QUEUED,
+                    "attempts": 0,
+                    "created_at": now,
+                    "updated_at": now,
+                    "next_attempt_at": now,
+                    "error": None,
+                    "result": None,
+                }
+                queued.append(key)
+            state.setdefault("batches", {})[batch_id] = {"created_at": now, "keys": queued}
+            self._record_depth(state)
+            return queued
+
+        queued = self.store.update(add)
+        logger.info(f"{self.name}: queued {len(queued)} jobs, skipped {len(skipped)}")
+        return {"batch_id": batch_id, "queued": queued, "skipped": skipped}
+
+    def run_once(self) -> list[dict[str, Any]]:
+        """
+        Claim the jobs there is room for, run them and record the outcomes.
+
+        Returns:
+            The claimed jobs, as updated
+        """
+        claimed, _ = self.store.update(self._claim, changed=lambda result: result[1])
+        finished = []
+        for job in claimed:
+            try:
+                outcome = self.run(dict(job["payload"]))
+            except Exception as e:  # A crashing job must not take the loop down
+                logger.exception(f"{self.name}: job {job['key']} raised")
+                outcome = Outcome(ok=False, error=str(e), retryable=True)
+            finished.append(self.store.update(lambda state: self._finish(state, job, outcome)))
+        return finished
+
+    async def run_forever(self, interval: float = 5.0) -> None:
+        """Call run_once() on a worker thread every `interval` seconds until cancelled."""
+        while True:
+            try:
+                await asyncio.to_thread(self.run_once)
+            except Exception as e:
+                logger.error(f"{self.name}: scheduler tick failed: {e}")
+            await asyncio.sleep(interval)
+
+    def progress(self, batch_id: Optional[str] = None) -> Optional[dict[str, Any]]:
+        """
+        Job counts by state, for one batch or the whole queue.
+
+        Returns:
+            {"counts", "jobs"} (jobs listed for a batch only), or None for
+            an unknown batch
+        """
+        state = self.store.read()
+        jobs = state.get("jobs", {})
+        if batch_id is None:
+            selected, listed = list(jobs.values()), False
+        else:
+            batch = state.get("batches", {}).get(batch_id)
+            if batch is None:
+                return None
+            selected = [jobs[key] for key in batch["keys"] if key in jobs]
+            listed = True
+
+        counts = {QUEUED: 0, RUNNING: 0, DONE: 0, FAILED: 0}
+        for job in selected:
+            if batch_id is None or job["batch_id"] == batch_id:
+                counts[job["state"]] += 1
+        progress: dict[str, Any] = {"counts": counts, "total": sum(counts.values())}
+        if listed:
+            progress["batch_id"] = batch_id
+            progress["jobs"] = [
+                {k: job[k] for k in _PROGRESS_FIELDS}
+                for job in selected
+                if job["batch_id"] == batch_id
+            ]
+        return progress
+
+    def _claim(self, state: dict) -> tuple[list[dict[str, Any]], bool]:
+        """Claim ready jobs; returns them and whether the state changed."""
+        now = self._clock()
+        jobs = state.setdefault("jobs", {})
+        changed = self._prune(state, now)
+
+        for job in jobs.values():
+            if job["state"] == RUNNING and job.get("lease_until", 0) <= now:
+                logger.warning(f"{self.name}: lease on {job['key']} expired; requeueing")
+                job["state"] = QUEUED
+                changed = True
+
+        running = sum(1 for job in jobs.values() if job["state"] == RUNNING)
+        room = self.max_in_flight - running - self.in_flight()
+        if self.quota:
+            starts = [t for t in state.get("starts", []) if t > now - self.quota_window]
+            state["starts"] = starts
+            room = min(room, self.quota - len(starts))
+        if room <= 0:
+            return [], changed
+
+        ready = sorted(
+            (
+                job
+                for job in jobs.values()
+                if job["state"] == QUEUED and job["next_attempt_at"] <= now
+            ),
+            key=lambda job: (-job["priority"], job["created_at"]),
+        )[:room]
+        for job in ready:
+            job["state"] = RUNNING
+            job["attempts"] += 1
+            job["lease_until"] = now + self.lease
+            job["updated_at"] = now
+            if self.quota:
+                state["starts"].append(now)
+        self._record_depth(state)
+        return [dict(job) for job in ready], changed or bool(ready)
+
+    def _prune(self, state: dict, now: float) -> bool:
+        """Drop finished jobs and batches older than the retention; True if any were."""
+        cutoff = now - self.retention
+        jobs = state.get("jobs", {})
+        expired = [
+            key for key, job in jobs.items()
+            if job["state"] in (DONE, FAILED) and job["updated_at"] < cutoff
+        ]
+        for key in expired:
+            del jobs[key]
+
+        batches = state.get("batches", {})
+        stale = [
+            batch_id for batch_id, batch in batches.items()
+            if batch["created_at"] < cutoff
+            and not any(
+                jobs.get(key, {}).get("batch_id") == batch_id
+                and jobs[key]["state"] in (QUEUED, RUNNING)
+                for key in batch["keys"]
+            )
+        ]
+        for batch_id in stale:
+            del batches[batch_id]
+        if expired or stale:
+            logger.info(f"{self.name}: pruned {len(expired)} finished jobs, {len(stale)} batches")
+        return bool(expired or stale)
+
+    def _finish(self, state: dict, claimed: dict[str, Any], outcome: Outcome) -> dict[str, Any]:
+        now = self._clock()
+        job = state.setdefault("jobs", {}).get(claimed["key"])
+        if job is None or job["state"] != RUNNING or job["batch_id"] != claimed["batch_id"]:
+            return claimed  # Requeued or replaced meanwhile; the newer record wins
+        job.pop("lease_until", None)
+        job["updated_at"] = now
+
+        if outcome.ok:
+            job.update(state=DONE, result=outcome.result, error=None)
+            JOBS_PROCESSED.inc(scheduler=self.name, outcome="done")
+        elif outcome.retryable and job["attempts"] < self.max_attempts:
+            delay = min(self.backoff_max, self.backoff_base * 2 ** (job["attempts"] - 1))
+            delay *= random.uniform(0.5, 1.0)
+            if outcome.retry_after is not None:
+                delay = max(delay, outcome.retry_after)
+            job.update(state=QUEUED, error=outcome.error, next_attempt_at=now + delay)
+            JOBS_PROCESSED.inc(scheduler=self.name, outcome="retry")
+            logger.info(
+                f"{self.name}: {job['key']} failed ({outcome.error}); retry in {delay:.0f}s"
+            )
+        else:
+            job.update(state=FAILED, error=outcome.error)
+            JOBS_PROCESSED.inc(scheduler=self.name, outcome="failed")
+            logger.warning(f"{self.name}: {job['key']} failed: {outcome.error}")
+        self._record_depth(state)
+        return dict(job)
+
+    def _record_depth(self, state: dict) -> None:
+        queued = sum(1 for job in state.get("jobs", {}).values() if job["state"] == QUEUED)
+        JOBS_QUEUED.set(queued, scheduler=self.name)
@@ -2,7 +2,7 @@
 Data models for Minerva-Jess.
 """
 
-from typing import Optional
+from typing import Literal, Optional, Union
 from pydantic import BaseModel, Field
 
 
@@ -65,6 +65,31 @@ class VideoSegment(BaseModel):
         )
 
 
+class CatalogSnapshot(BaseModel):
+    """The video catalog with ranked views precomputed once per refresh."""
+
+    videos: list[VideoInfo] = Field(default_factory=list, description="All videos")
+    popular: list[VideoInfo] = Field(default_factory=list, description="By view count")
+    latest: list[VideoInfo] = Field(default_factory=list, description="By publish date")
+    featured: list[VideoInfo] = Field(default_factory=list, description="Featured only")
+    default: list[VideoInfo] = Field(
+        default_factory=list, description="Featured first, then by view count"
+    )
+
+    @classmethod
+    def from_videos(cls, videos: list[VideoInfo]) -> "CatalogSnapshot":
+        """Build a snapshot and its ranked views."""
+        featured = [v for v in videos if v.featured]
+        popular = sorted(videos, key=lambda v: v.view_count, reverse=True)
+        return cls(
+            videos=videos,
+            popular=popular,
+            latest=sorted(videos, key=lambda v: v.publish_date or "", reverse=True),
+            featured=featured,
+            default=featured + [v for v in popular if not v.featured],
+        )
+
+
 class SearchResult(BaseModel):
     """Result from a video search."""
 
@@ -94,6 +119,50 @@ class AgentResponse(BaseModel):
     success: bool = Field(True, description="Whether request succeeded")
     video_info: Optional[dict] = Field(None, description="Video embed information")
     clickable_examples: Optional[list[str]] = Field(None, description="Follow-up suggestions")
+    error: Optional[str] = Field(None, description="Why the answer failed or is incomplete")
 
     class Config:
         extra = "allow"
+
+
+class BatchResult(BaseModel):
+    """Outcome of one query in a JessAgent.query_many batch."""
+
+    index: int = Field(..., description="Position of the query in the input batch")
+    query: str = Field(..., description="Query as submitted")
+    response: Optional[AgentResponse] = Field(None, description="Agent response, if any")
+    error: Optional[str] = Field(None, description="Error message if the query raised")
+    duration: float = Field(0.0, description="Seconds spent answering the query")
+    duplicate: bool = Field(
+        False, description="Answered by an identical earlier query in the batch"
+    )
+
+    @property
+    def success(self) -> bool:
+        """Whether the query produced a successful response."""
+        return self.error is None and self.response is not None and self.response.success
+
+
+class SearchEvent(BaseModel):
+    """Streamed as soon as search results (and the top video) are known."""
+
+    type: Literal["search"] = "search"
+    segments: list[VideoSegment] = Field(default_factory=list, description="Matching segments")
+    video_info: Optional[dict] = Field(None, description="Video embed information")
+
+
+class AnswerChunkEvent(BaseModel):
+    """A piece of the answer text, in order."""
+
+    type: Literal["answer_chunk"] = "answer_chunk"
+    text: str = Field(..., description="Answer text fragment")
+
+
+class ResponseEvent(BaseModel):
+    """Final event of a stream, carrying the complete response."""
+
+    type: Literal["response"] = "response"
+    response: AgentResponse = Field(..., description="Complete agent response")
+
+
+StreamEvent = Union[SearchEvent, AnswerChunkEvent, ResponseEvent]
@@ -10,26 +10,63 @@ Example:
 """
 
 import logging
-from typing import Any, Optional
+import re
+import time
+from typing import Any, AsyncIterator, Awaitable, Callable, Iterator, Optional, TypeVar
 
 import httpx
 
-from minerva_jess.config import Settings, VIDEO_CATALOG
-from minerva_jess.models import VideoInfo, VideoSegment
+from minerva_jess import codec, disk_cache, metrics, orca_pool
+from minerva_jess.cache import StaleWhileRevalidate, TTLCache, get_cache, get_swr, normalize_query
+from minerva_jess.circuit import CircuitOpenError, get_breaker
+from minerva_jess.catalog import VideoCatalog, get_video_catalog
+from minerva_jess.config import Settings
+from minerva_jess.hedging import get_hedger
+from minerva_jess.models import CatalogSnapshot, VideoInfo, VideoSegment
+from minerva_jess.packing import pack_segments
+from minerva_jess.segments import SegmentTable
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+_WORD = re.compile(r"\S+\s*|\s+")
+
+
+def chunk_text(text: str, size: int = 80) -> Iterator[str]:
+    """Split text into roughly `size`-character chunks on word boundaries."""
+    chunk = ""
+    for match in _WORD.finditer(text):
+        chunk += match.group()
+        if len(chunk) >= size:
+            yield chunk
+            chunk = ""
+    if chunk:
+        yield chunk
+
 
 class OrcaClientError(Exception):
     """Raised when communication with Orca fails."""
     pass
 
 
+class OrcaUnavailableError(OrcaClientError):
+    """Raised without calling Orca because the endpoint's circuit is open."""
+    pass
+
+
+class SynthesisInterruptedError(OrcaClientError):
+    """Raised when a streamed answer breaks off after some text was yielded."""
+    pass
+
+
 class OrcaMCPClient:
     """
     Client for the Orca Video API.
 
     Connects to Orca via HTTP for video search, synthesis, and listing.
+    By default all clients share one connection pool per Orca URL and
+    token (see orca_pool); set ``orca_shared_pool=False`` for a private one.
 
     Example:
         client = OrcaMCPClient(settings)
@@ -42,24 +79,154 @@ class OrcaMCPClient:
         self._client: Optional[httpx.AsyncClient] = None
 
     def _get_client(self) -> httpx.AsyncClient:
-        """Get or create HTTP client."""
-        if self._client is None:
-            self._client = httpx.AsyncClient(
-                base_url=self.settings.orca_url,
-                timeout=60.0,  # Synthesis can take time
-                headers=self._get_headers()
-            )
+        """Get the shared pool, or create this client's private one."""
+        if self._client is not None:
+            return self._client
+        if self.settings.orca_shared_pool:
+            return orca_pool.get_client(self.settings)
+        self._client = orca_pool.build_client(self.settings)
         return self._client
 
     def _get_headers(self) -> dict:
         """Get HTTP headers including auth if configured."""
-        headers = {"Content-Type": "application/json"}
-        if self.settings.orca_token:
-            headers["Authorization"] = f"Bearer {self.settings.orca_token}"
-        return headers
+        return orca_pool.build_headers(self.settings)
+
+    def _timeout(self, operation: str) -> httpx.Timeout:
+        """Per-operation timeout from settings."""
+        return orca_pool.operation_timeout(self.settings, operation)
+
+    async def _send(
+        self,
+        operation: str,
+        request: Callable[[], Awaitable[httpx.Response]],
+        hedge: bool = False,
+    ) -> httpx.Response:
+        """
+        Send a request through the endpoint's circuit breaker.
+
+        Raises CircuitOpenError without sending if the circuit is open.
+        Transport errors and 5xx responses count as failures. The call
+        is traced as an "orca.<operation>" span, whose context reaches
+        Orca in the traceparent header (see orca_pool.build_client).
+
+        Args:
+            operation: Endpoint name (search, synthesize, list, transcript)
+            request: Zero-argument callable issuing the request
+            hedge: Allow hedging (if enabled in settings)
+        """
+        breaker = None
+        if self.settings.orca_circuit_enabled:
+            breaker = get_breaker(self.settings, operation)
+            if not breaker.allow():
+                raise CircuitOpenError(breaker.name)
+
+        start = time.perf_counter()
+        try:
+            with metrics.track_upstream("orca", operation) as span:
+                if hedge and self.settings.orca_hedge_enabled:
+                    response = await get_hedger(self.settings, operation).run(
+                        request, failed=lambda response: response.status_code >= 500
+                    )
+                else:
+                    response = await request()
+                span.set_attribute("http.status_code", response.status_code)
+        except Exception:
+            if breaker is not None:
+                breaker.record_failure(time.perf_counter() - start)
+            raise
+        except BaseException:
+            if breaker is not None:
+                breaker.release()
+            raise
+
+        if response.status_code >= 400 and response.status_code != 404:
+            metrics.record_upstream_error("orca", operation, f"http_{response.status_code}")
+        if breaker is not None:
+            if response.status_code >= 500:
+                breaker.record_failure(time.perf_counter() - start)
+            else:
+                breaker.record_success(time.perf_counter() - start)
+        return response
+
+    def _cache(self, name: str) -> TTLCache:
+        """Shared response cache ("search" or "synthesis") for this Orca."""
+        if name == "search":
+            size, ttl = self.settings.orca_search_cache_size, self.settings.orca_search_cache_ttl
+        else:
+            size, ttl = (
+                self.settings.orca_synthesis_cache_size,
+                self.settings.orca_synthesis_cache_ttl,
+            )
+        return get_cache(self.settings, name, maxsize=size, ttl=ttl)
+
+    def _disk_cache(self) -> Optional[disk_cache.DiskCache]:
+        """Shared on-disk cache behind the in-memory ones (None when disabled)."""
+        if not self.settings.orca_cache_enabled:
+            return None
+        return disk_cache.get_disk_cache(self.settings)
+
+    async def _through_disk(
+        self,
+        name: str,
+        key: Any,
+        load: Callable[[], Awaitable[T]],
+        ttl: float,
+        encode: Callable[[T], Any] = lambda value: value,
+        decode: Callable[[Any], T] = lambda data: data,
+        bypass: bool = False,
+    ) -> T:
+        """
+        Load through the on-disk cache, so workers share Orca responses.
+
+        Falsy results (no hits, no transcript) are never written. An entry
+        that no longer decodes is treated as a miss.
+
+        Args:
+            name: Cache name ("search", "synthesis", "list" or "transcript")
+            key: JSON-serializable key
+            load: Fetches the value from Orca on a miss
+            ttl: Seconds the stored entry stays fresh
+            encode: Value to JSON-serializable form
+            decode: Inverse of encode
+            bypass: Skip the lookup (the fresh value is still stored)
+        """
+        cache = self._disk_cache()
+        if cache is None:
+            return await load()
+
+        namespace, entry = disk_cache.namespace(self.settings, name), disk_cache.make_key(key)
+        if not bypass:
+            data = await cache.aget(namespace, entry)
+            if data is not None:
+                try:
+                    return decode(codec.loads(data))
+                except (ValueError, KeyError, TypeError) as e:
+                    logger.warning(f"Ignoring unreadable disk cache entry ({name}): {e}")
+
+        value = await load()
+        if value:
+            await cache.aset(namespace, entry, codec.dumps(encode(value)), ttl)
+        return value
+
+    def video_catalog(self) -> VideoCatalog:
+        """Local video metadata used to enrich Orca results."""
+        return get_video_catalog(self.settings.catalog_cache_path)
+
+    def _catalog(self) -> StaleWhileRevalidate:
+        """Shared stale-while-revalidate holder for the video catalog."""
+        return get_swr(self.settings, "catalog", ttl=self.settings.orca_catalog_ttl)
+
+    def cache_stats(self) -> dict[str, dict[str, Any]]:
+        """Hit-rate statistics for the search, synthesis, catalog and disk caches."""
+        stats = {name: self._cache(name).stats() for name in ("search", "synthesis")}
+        stats["catalog"] = self._catalog().stats()
+        disk = self._disk_cache()
+        if disk is not None:
+            stats["disk"] = disk.stats()
+        return stats
 
     async def close(self):
-        """Close the HTTP client."""
+        """Close this client's private HTTP client (the shared pool stays open)."""
         if self._client:
             await self._client.aclose()
             self._client = None
@@ -68,43 +235,81 @@ class OrcaMCPClient:
         self,
         query: str,
         max_results: Optional[int] = None,
+        use_cache: bool = True,
     ) -> list[VideoSegment]:
         """
         Search video transcripts.
 
+        Results are cached per normalized query and max_results, in
+        memory and (if configured) on disk; concurrent identical searches
+        share one request.
+
         Args:
             query: Search query text
             max_results: Maximum number of results
+            use_cache: Set False to skip the cache lookup for this call
 
         Returns:
             List of matching video segments
         """
+        table = await self.search_table(query, max_results, use_cache)
+        return table.to_segments()
+
+    async def search_table(
+        self,
+        query: str,
+        max_results: Optional[int] = None,
+        use_cache: bool = True,
+    ) -> SegmentTable:
+        """
+        Search video transcripts, returning compact columns.
+
+        Same as search() but skips building a VideoSegment per hit;
+        callers materialize only the rows they need.
+        """
         max_results = max_results or self.settings.max_search_results
 
+        if not self.settings.orca_cache_enabled:
+            return await self._search(query, max_results)
+
+        key = (normalize_query(query), max_results)
+        return await self._cache("search").get_or_load(
+            key,
+            lambda: self._through_disk(
+                "search",
+                key,
+                lambda: self._search(query, max_results),
+                ttl=self.settings.orca_search_cache_ttl,
+                encode=SegmentTable.to_columns,
+                decode=SegmentTable.from_columns,
+                bypass=not use_cache,
+            ),
+            bypass=not use_cache,
+        )
+
+    async def _search(self, query: str, max_results: int) -> SegmentTable:
+        """Search request to Orca (uncached)."""
         try:
             client = self._get_client()
-            response = await client.post(
+            response = await self._send("search", lambda: client.post(
                 "/video/search",
-                json={"query": query, "max_results": max_results}
-            )
+                json={"query": query, "max_results": max_results},
+                timeout=self._timeout("search"),
+            ), hedge=True)
             response.raise_for_status()
-            data = response.json()
-
-            segments = []
-            for item in data.get("results", []):
-                segment = VideoSegment.from_search_result(item)
-
-                # Enrich with catalog metadata
-                if segment.video_id in VIDEO_CATALOG:
-                    catalog = VIDEO_CATALOG[segment.video_id]
-                    if not segment.title or segment.title.startswith("Video "):
-                        segment.title = catalog.get("title", segment.title)
+            data = codec.loads(response.content)
 
-                segments.append(segment)
+            # Enriches placeholder titles with catalog metadata
+            table = SegmentTable.from_results(
+                data.get("results", []), catalog=self.video_catalog()
+            )
 
-            logger.info(f"Search returned {len(segments)} segments for '{query}'")
-            return segments
+            logger.info(f"Search returned {len(table)} segments for '{query}'")
+            return table
 
+        except CircuitOpenError as e:
+            logger.warning(f"Orca search skipped: {e}")
+            raise OrcaUnavailableError(f"Search failed: {e}") from e
         except httpx.HTTPError as e:
             logger.error(f"Orca API search failed: {e}")
             raise OrcaClientError(f"Search failed: {e}") from e
@@ -116,55 +321,53 @@ class OrcaMCPClient:
         self,
         query: str,
         segments: list[VideoSegment],
-        tone: str = "professional"
+        tone: str = "professional",
+        use_cache: bool = True,
     ) -> str:
         """
         Synthesize an answer from video segments.
 
+        Segments are packed into the input token budget first (see
+        pack_segments). Answers are cached per normalized query, packed
+        segments and tone; fallback answers are never cached.
+
         Args:
             query: The original query
             segments: Video segments to synthesize from
             tone: Response tone
+            use_cache: Set False to skip the cache lookup for this call
 
         Returns:
             Synthesized answer text
         """
-        if not segments:
+        selected = self._pack(segments)
+        if not selected:
             return f"No matching content found for '{query}'."
 
         try:
-            client = self._get_client()
+            if not self.settings.orca_cache_enabled:
+                return await self._synthesize(query, selected, tone)
 
-            # Convert segments to dicts for API
-            video_results = [
-                {
-                    "video_id": s.video_id,
-                    "title": s.title,
-                    "text": s.full_text or s.text,
-                    "timestamp": s.timestamp,
-                    "url": s.url,
-                    "start_time": s.start_time
-                }
-                for s in segments[:5]
-            ]
-
-            response = await client.post(
-                "/video/synthesize",
-                json={
-                    "query": query,
-                    "video_results": video_results,
-                    "tone": tone
-                }
+            key = (
+                normalize_query(query),
+                self._segments_key(selected),
+                tone,
+            )
+            return await self._cache("synthesis").get_or_load(
+                key,
+                lambda: self._through_disk(
+                    "synthesis",
+                    key,
+                    lambda: self._synthesize(query, selected, tone),
+                    ttl=self.settings.orca_synthesis_cache_ttl,
+                    bypass=not use_cache,
+                ),
+                bypass=not use_cache,
             )
-            response.raise_for_status()
-            data = response.json()
-
-            if "error" in data:
-                logger.error(f"Synthesis error: {data['error']}")
-                return self._format_fallback(segments)
-
-            return data.get("answer", "Unable to synthesize answer.")
 
+        except CircuitOpenError as e:
+            logger.warning(f"Orca synthesis skipped, using fallback: {e}")
+            return self._format_fallback(segments)
         except httpx.HTTPError as e:
             logger.error(f"Orca API synthesis failed: {e}")
             return self._format_fallback(segments)
@@ -172,41 +375,221 @@ class OrcaMCPClient:
             logger.error(f"Synthesis failed: {e}")
             return self._format_fallback(segments)
 
-    async def list_videos(self) -> list[VideoInfo]:
+    async def synthesize_stream(
+        self,
+        query: str,
+        segments: list[VideoSegment],
+        tone: str = "professional",
+        use_cache: bool = True,
+    ) -> AsyncIterator[str]:
         """
-        List all available videos.
+        Synthesize an answer, yielding text chunks as Orca produces them.
 
-        Returns:
-            List of video metadata
+        Asks Orca to stream (SSE or NDJSON). If the endpoint answers with
+        plain JSON, or the answer is cached, the full text is yielded in
+        chunks instead. On failure before any text the fallback summary
+        is yielded.
+
+        Args:
+            query: The original query
+            segments: Video segments to synthesize from
+            tone: Response tone
+            use_cache: Set False to skip the cache lookup for this call
+
+        Yields:
+            Answer text fragments, in order
+
+        Raises:
+            SynthesisInterruptedError: The stream broke after some text was
+                yielded (the answer so far is incomplete and isn't cached)
         """
+        selected = self._pack(segments)
+        if not selected:
+            yield f"No matching content found for '{query}'."
+            return
+
+        cache = self._cache("synthesis") if self.settings.orca_cache_enabled else None
+        key = (
+            normalize_query(query),
+            self._segments_key(selected),
+            tone,
+        )
+        disk = self._disk_cache()
+        if cache is not None and use_cache:
+            cached = cache.get(key)
+            if cached is None and disk is not None:
+                data = await disk.aget(
+                    disk_cache.namespace(self.settings, "synthesis"), disk_cache.make_key(key)
+                )
+                if data is not None:
+                    try:
+                        cached = codec.loads(data)
+                    except (ValueError, KeyError, TypeError) as e:
+                        logger.warning(f"Ignoring unreadable disk cache entry (synthesis): {e}")
+                    else:
+                        cache.set(key, cached)
+            if cached is not None:
+                for chunk in chunk_text(cached):
+                    yield chunk
+                return
+
+        parts: list[str] = []
         try:
-            client = self._get_client()
-            response = await client.get("/video/list")
-            response.raise_for_status()
-            data = response.json()
-
-            videos = []
-            for item in data.get("videos", []):
-                video_id = item.get("video_id", "")
-                catalog = VIDEO_CATALOG.get(video_id, {})
-
-                video = VideoInfo(
-                    video_id=video_id,
-                    title=catalog.get("title", item.get("title", f"Video {video_id}")),
-                    duration=item.get("duration", 0),
-                    duration_formatted=item.get("duration_formatted", ""),
-                    url=item.get("url", f"https://youtube.com/watch?v={video_id}"),
-                    topics=catalog.get("topics", []),
-                    publish_date=catalog.get("publish_date"),
-                    view_count=catalog.get("view_count", 0),
-                    featured=catalog.get("featured", False),
-                    description=catalog.get("description", ""),
-                    chapter_count=item.get("chapters", 0),
+            async for chunk in self._synthesize_stream(query, selected, tone):
+                parts.append(chunk)
+                yield chunk
+        except Exception as e:
+            if isinstance(e, CircuitOpenError):
+                logger.warning(f"Orca synthesis skipped, using fallback: {e}")
+            else:
+                logger.error(f"Streaming synthesis failed: {e}")
+            if parts:
+                raise SynthesisInterruptedError(f"Synthesis stream interrupted: {e}") from e
+            for chunk in chunk_text(self._format_fallback(segments)):
+                yield chunk
+            return
+
+        if cache is not None and parts:
+            answer = "".join(parts)
+            cache.set(key, answer)
+            if disk is not None:
+                await disk.aset(
+                    disk_cache.namespace(self.settings, "synthesis"),
+                    disk_cache.make_key(key),
+                    codec.dumps(answer),
+                    self.settings.orca_synthesis_cache_ttl,
                 )
-                videos.append(video)
 
-            return videos
+    async def _synthesize_stream(
+        self, query: str, segments: list[VideoSegment], tone: str
+    ) -> AsyncIterator[str]:
+        """Streaming synthesis request to Orca (uncached); raises on any failure."""
+        client = self._get_client()
+        request = client.build_request(
+            "POST",
+            "/video/synthesize",
+            json={
+                "query": query,
+                "video_results": self._video_results(segments),
+                "tone": tone,
+                "max_tokens": self.settings.max_synthesis_tokens,
+                "stream": True,
+            },
+            timeout=self._timeout("synthesize"),
+        )
+        response = await self._send("synthesize", lambda: client.send(request, stream=True))
+        try:
+            response.raise_for_status()
+            content_type = response.headers.get("content-type", "")
+
+            if "text/event-stream" in content_type or "ndjson" in content_type:
+                async for line in response.aiter_lines():
+                    if line.startswith("data:"):
+                        line = line[5:].strip()
+                    elif "text/event-stream" in content_type:
+                        continue  # SSE comments, event names, blank separators
+                    if not line or line == "[DONE]":
+                        continue
+                    try:
+                        event = codec.loads(line)
+                    except ValueError:
+                        event = {"text": line}  # Plain-text data lines
+                    if not isinstance(event, dict):
+                        event = {"text": str(event)}
+                    if "error" in event:
+                        metrics.record_upstream_error("orca", "synthesize", "api_error")
+                        raise OrcaClientError(f"Synthesis error: {event['error']}")
+                    text = event.get("delta") or event.get("text") or ""
+                    if text:
+                        yield text
+                return
+
+            # Endpoint doesn't stream: chunk the complete answer
+            await response.aread()
+            data = codec.loads(response.content)
+            if "error" in data:
+                metrics.record_upstream_error("orca", "synthesize", "api_error")
+                raise OrcaClientError(f"Synthesis error: {data['error']}")
+            for chunk in chunk_text(data.get("answer", "Unable to synthesize answer.")):
+                yield chunk
+        finally:
+            await response.aclose()
+
+    def _pack(self, segments: list[VideoSegment]) -> list[VideoSegment]:
+        """Segments to synthesize from, packed into the input token budget."""
+        return pack_segments(
+            segments,
+            budget=self.settings.max_synthesis_input_tokens,
+            min_relevance=self.settings.min_relevance_score,
+            max_segments=self.settings.max_synthesis_segments,
+            merge_gap=self.settings.synthesis_merge_gap,
+        )
+
+    @staticmethod
+    def _segments_key(segments: list[VideoSegment]) -> tuple:
+        """Cache key part identifying packed segments."""
+        return tuple((s.video_id, s.start_time, s.end_time, len(s.full_text)) for s in segments)
+
+    @staticmethod
+    def _video_results(segments: list[VideoSegment]) -> list[dict[str, Any]]:
+        """Segments as the dicts the synthesis API expects."""
+        return [
+            {
+                "video_id": s.video_id,
+                "title": s.title,
+                "text": s.full_text or s.text,
+                "timestamp": s.timestamp,
+                "url": s.url,
+                "start_time": s.start_time
+            }
+            for s in segments
+        ]
+
+    async def _synthesize(self, query: str, segments: list[VideoSegment], tone: str) -> str:
+        """Synthesis request to Orca (uncached); raises on any failure."""
+        client = self._get_client()
+        video_results = self._video_results(segments)
+
+        response = await self._send("synthesize", lambda: client.post(
+            "/video/synthesize",
+            json={
+                "query": query,
+                "video_results": video_results,
+                "tone": tone,
+                "max_tokens": self.settings.max_synthesis_tokens,
+            },
+            timeout=self._timeout("synthesize"),
+        ))
+        response.raise_for_status()
+        data = codec.loads(response.content)
+
+        if "error" in data:
+            metrics.record_upstream_error("orca", "synthesize", "api_error")
+            raise OrcaClientError(f"Synthesis error: {data['error']}")
+
+        return data.get("answer", "Unable to synthesize answer.")
+
+    async def list_videos(self, use_cache: bool = True) -> list[VideoInfo]:
+        """
+        List all available videos.
+
+        Served from the catalog cache (see get_catalog) when caching is enabled.
 
+        Args:
+            use_cache: Set False to fetch the list from Orca directly
+
+        Returns:
+            List of video metadata (empty if Orca is unavailable)
+        """
+        if use_cache and self.settings.orca_cache_enabled:
+            # Copy so callers can't reorder or trim the shared snapshot
+            return list((await self.get_catalog()).videos)
+
+        try:
+            return await self._list_videos()
+        except CircuitOpenError as e:
+            logger.warning(f"Orca list skipped: {e}")
+            return []
         except httpx.HTTPError as e:
             logger.error(f"Orca API list failed: {e}")
             return []
@@ -214,10 +597,89 @@ class OrcaMCPClient:
             logger.error(f"List videos failed: {e}")
             return []
 
+    async def get_catalog(self, refresh: bool = False) -> CatalogSnapshot:
+        """
+        Get the video catalog with precomputed rankings.
+
+        The catalog is loaded once and then served from memory; after
+        ``orca_catalog_ttl`` it is refreshed in the background while the
+        previous snapshot keeps being served. A failed or empty refresh
+        never replaces a good snapshot. With caching disabled every call
+        fetches from Orca.
+
+        Args:
+            refresh: Wait for a fresh catalog from Orca
+
+        Returns:
+            Catalog snapshot (empty if Orca has never answered)
+        """
+        holder = self._catalog()
+
+        async def load() -> CatalogSnapshot:
+            videos = await self._through_disk(
+                "list",
+                "videos",
+                self._list_videos,
+                ttl=self.settings.orca_catalog_ttl,
+                encode=lambda videos: [v.model_dump(mode="json") for v in videos],
+                decode=lambda items: [VideoInfo.model_validate(item) for item in items],
+                bypass=refresh,
+            )
+            if not videos and holder.value is not None and holder.value.videos:
+                raise OrcaClientError("Orca returned an empty catalog")
+            return CatalogSnapshot.from_videos(videos)
+
+        try:
+            return await holder.get(load, refresh=refresh or not self.settings.orca_cache_enabled)
+        except CircuitOpenError as e:
+            logger.warning(f"Orca list skipped: {e}")
+        except httpx.HTTPError as e:
+            logger.error(f"Orca API list failed: {e}")
+        except Exception as e:
+            logger.error(f"List videos failed: {e}")
+        return holder.value or CatalogSnapshot()
+
+    async def _list_videos(self) -> list[VideoInfo]:
+        """Fetch the video list from Orca (raises on failure)."""
+        client = self._get_client()
+        response = await self._send(
+            "list",
+            lambda: client.get("/video/list", timeout=self._timeout("list")),
+            hedge=True,
+        )
+        response.raise_for_status()
+        data = codec.loads(response.content)
+
+        video_catalog = self.video_catalog()
+        videos = []
+        for item in data.get("videos", []):
+            video_id = item.get("video_id", "")
+            catalog = video_catalog.get(video_id, {})
+
+            video = VideoInfo(
+                video_id=video_id,
+                title=catalog.get("title", item.get("title", f"Video {video_id}")),
+                duration=item.get("duration", 0),
+                duration_formatted=item.get("duration_formatted", ""),
+                url=item.get("url", f"https://youtube.com/watch?v={video_id}"),
+                topics=catalog.get("topics", []),
+                publish_date=catalog.get("publish_date"),
+                view_count=catalog.get("view_count", 0),
+                featured=catalog.get("featured", False),
+                description=catalog.get("description", ""),
+                chapter_count=item.get("chapters", 0),
+            )
+            videos.append(video)
+
+        return videos
+
     async def get_transcript(self, video_id: str) -> Optional[dict]:
         """
         Get transcript for a specific video.
 
+        Found transcripts are kept in the on-disk cache (if configured)
+        for ``orca_transcript_cache_ttl`` seconds.
+
         Args:
             video_id: YouTube video ID
 
@@ -225,15 +687,16 @@ class OrcaMCPClient:
             Transcript data or None
         """
         try:
-            client = self._get_client()
-            response = await client.get(f"/video/transcript/{video_id}")
-
-            if response.status_code == 404:
-                return None
-
-            response.raise_for_status()
-            return response.json()
+            return await self._through_disk(
+                "transcript",
+                video_id,
+                lambda: self._get_transcript(video_id),
+                ttl=self.settings.orca_transcript_cache_ttl,
+            )
 
+        except CircuitOpenError as e:
+            logger.warning(f"Orca transcript skipped: {e}")
+            return None
         except httpx.HTTPError as e:
             logger.error(f"Get transcript failed: {e}")
             return None
@@ -241,11 +704,24 @@ class OrcaMCPClient:
             logger.error(f"Get transcript failed: {e}")
             return None
 
+    async def _get_transcript(self, video_id: str) -> Optional[dict]:
+        """Transcript request to Orca (uncached); None if Orca doesn't know the video."""
+        client = self._get_client()
+        response = await self._send("transcript", lambda: client.get(
+            f"/video/transcript/{video_id}", timeout=self._timeout("list")
+        ))
+
+        if response.status_code == 404:
+            return None
+
+        response.raise_for_status()
+        return codec.loads(response.content)
+
     async def health_check(self) -> bool:
         """Check if Orca API is available."""
         try:
             client = self._get_client()
-            response = await client.get("/health")
+            response = await client.get("/health", timeout=self._timeout("list"))
             return response.status_code == 200
         except:
             return False
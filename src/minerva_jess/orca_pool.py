@@ -0,0 +1,158 @@
+"""
+Shared Orca HTTP connection pool.
+
+One httpx.AsyncClient per (orca_url, token) per event loop, shared by
+every OrcaMCPClient (and so every JessAgent) in the process. Pool
+limits, keep-alive expiry, HTTP/2 and per-operation timeouts come from
+Settings.
+
+httpx clients are bound to the event loop that first uses them, so the
+registry is kept per loop; pools of loops that have been closed are
+dropped automatically.
+
+Example:
+    from minerva_jess import orca_pool
+
+    app = FastAPI(lifespan=orca_pool.lifespan)
+
+    # or explicitly
+    await orca_pool.startup(settings)
+    ...
+    await orca_pool.shutdown()
+"""
+
+import asyncio
+import logging
+import weakref
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Optional
+
+import httpx
+
+from minerva_jess import tracing
+from minerva_jess.config import Settings
+
+logger = logging.getLogger(__name__)
+
+PoolKey = tuple[str, Optional[str]]
+
+_pools: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[PoolKey, httpx.AsyncClient]]"
+_pools = weakref.WeakKeyDictionary()
+
+# Settings field holding the read timeout for each operation
+OPERATION_TIMEOUTS = {
+    "search": "orca_search_timeout",
+    "synthesize": "orca_synthesize_timeout",
+    "list": "orca_list_timeout",
+}
+
+
+def pool_key(settings: Settings) -> PoolKey:
+    """Registry key for a settings object."""
+    return (settings.orca_url, settings.orca_token)
+
+
+def build_headers(settings: Settings) -> dict[str, str]:
+    """Default headers including auth if configured."""
+    headers = {"Content-Type": "application/json"}
+    if settings.orca_token:
+        headers["Authorization"] = f"Bearer {settings.orca_token}"
+    return headers
+
+
+def operation_timeout(settings: Settings, operation: str) -> httpx.Timeout:
+    """Timeout for an Orca operation (falls back to the synthesize timeout)."""
+    field = OPERATION_TIMEOUTS.get(operation, "orca_synthesize_timeout")
+    return httpx.Timeout(getattr(settings, field), connect=settings.orca_connect_timeout)
+
+
+async def _inject_trace_context(request: httpx.Request) -> None:
+    """Request hook: send the active trace's traceparent to Orca."""
+    context = tracing.current_context()
+    if context is not None:
+        request.headers["traceparent"] = context.traceparent
+
+
+def build_client(settings: Settings, **overrides: Any) -> httpx.AsyncClient:
+    """
+    Create an AsyncClient configured from settings.
+
+    Args:
+        settings: Pool limits, timeouts and auth
+        **overrides: Extra AsyncClient arguments (e.g. transport)
+    """
+    limits = httpx.Limits(
+        max_connections=settings.orca_max_connections,
+        max_keepalive_connections=settings.orca_max_keepalive_connections,
+        keepalive_expiry=settings.orca_keepalive_expiry,
+    )
+    kwargs: dict[str, Any] = {
+        "base_url": settings.orca_url,
+        "headers": build_headers(settings),
+        "limits": limits,
+        "timeout": operation_timeout(settings, "synthesize"),
+        "event_hooks": {"request": [_inject_trace_context]},
+        **overrides,
+    }
+    if settings.orca_http2:
+        try:
+            return httpx.AsyncClient(http2=True, **kwargs)
+        except ImportError:
+            logger.warning("HTTP/2 requested but 'h2' is not installed; using HTTP/1.1")
+    return httpx.AsyncClient(**kwargs)
+
+
+def get_client(settings: Settings) -> httpx.AsyncClient:
+    """
+    Get (or create) the shared client for these settings.
+
+    Must be called from a coroutine; the client belongs to the running loop.
+    """
+    clients = _pools.setdefault(asyncio.get_running_loop(), {})
+    key = pool_key(settings)
+    client = clients.get(key)
+    if client is None or client.is_closed:
+        client = clients[key] = build_client(settings)
+        logger.debug(f"Created shared Orca pool for {settings.orca_url}")
+    return client
+
+
+async def startup(settings: Optional[Settings] = None) -> httpx.AsyncClient:
+    """
+    App startup hook: create the shared pool up front.
+
+    Args:
+        settings: Settings to build the pool from (defaults to get_settings())
+    """
+    from minerva_jess.config import get_settings
+    return get_client(settings or get_settings())
+
+
+async def shutdown() -> None:
+    """App shutdown hook: close every shared pool on the current loop."""
+    loop = asyncio.get_running_loop()
+    clients = _pools.pop(loop, {})
+    for client in clients.values():
+        await client.aclose()
+    # Pools bound to loops that have since closed can't be awaited; drop them
+    for other in [lp for lp in _pools.keys() if lp.is_closed()]:
+        _pools.pop(other, None)
+
+
+@asynccontextmanager
+async def lifespan(app: Any = None) -> AsyncIterator[None]:
+    """FastAPI/Starlette lifespan that opens and closes the shared pool."""
+    await startup()
+    try:
+        yield
+    finally:
+        await shutdown()
+
+
+def stats() -> list[dict[str, Any]]:
+    """Open shared pools (for monitoring/debugging)."""
+    return [
+        {"orca_url": url, "authenticated": token is not None, "closed": client.is_closed}
+        for clients in list(_pools.values())
+        for (url, token), client in clients.items()
+    ]
@@ -0,0 +1,130 @@
+"""
+Token-budget packing of search segments for synthesis.
+
+Sits between search and synthesis: drops segments below the relevance
+floor, merges adjacent or overlapping segments from the same video, and
+fills an input token budget in relevance order. Token counts are a
+local approximation (about four characters per token), so nothing is
+sent to a tokenizer.
+
+Example:
+    packed = pack_segments(segments, budget=3000, min_relevance=0.2)
+    total = sum(segment_tokens(s) for s in packed)  # <= 3000
+"""
+
+import math
+
+from minerva_jess.models import VideoSegment
+from minerva_jess.segments import SNIPPET_CHARS
+
+# Approximate characters per token for English text
+CHARS_PER_TOKEN = 4
+
+# Tokens for a segment's title, timestamp, url and JSON keys
+SEGMENT_OVERHEAD_TOKENS = 24
+
+# Don't bother sending a segment truncated below this many text tokens
+MIN_TRUNCATED_TOKENS = 64
+
+
+def estimate_tokens(text: str) -> int:
+    """Approximate token count of `text`."""
+    return math.ceil(len(text) / CHARS_PER_TOKEN)
+
+
+def segment_tokens(segment: VideoSegment) -> int:
+    """Approximate tokens a segment costs in a synthesis request."""
+    return estimate_tokens(segment.full_text or segment.text) + SEGMENT_OVERHEAD_TOKENS
+
+
+def _with_text(segment: VideoSegment, text: str, **update) -> VideoSegment:
+    """Copy of a segment with new transcript text (and other fields)."""
+    return segment.model_copy(update={
+        "full_text": text,
+        "text": text[:SNIPPET_CHARS],
+        **update,
+    })
+
+
+def merge_segments(segments: list[VideoSegment], gap: float = 2.0) -> list[VideoSegment]:
+    """
+    Merge segments from the same video that overlap or are within `gap` seconds.
+
+    The merged segment spans both, joins their text and keeps the higher
+    relevance. Output is grouped by video in time order.
+
+    Args:
+        segments: Segments to merge
+        gap: Maximum seconds between one segment's end and the next's start
+    """
+    by_video: dict[str, list[VideoSegment]] = {}
+    for segment in segments:
+        by_video.setdefault(segment.video_id, []).append(segment)
+
+    merged: list[VideoSegment] = []
+    for group in by_video.values():
+        group.sort(key=lambda s: s.start_time)
+        current = group[0]
+        for segment in group[1:]:
+            if segment.start_time > current.end_time + gap:
+                merged.append(current)
+                current = segment
+                continue
+            current_text = current.full_text or current.text
+            text = segment.full_text or segment.text
+            if text and text not in current_text:
+                current_text = f"{current_text} {text}" if current_text else text
+            current = _with_text(
+                current,
+                current_text,
+                end_time=max(current.end_time, segment.end_time),
+                relevance=max(current.relevance, segment.relevance),
+            )
+        merged.append(current)
+    return merged
+
+
+def pack_segments(
+    segments: list[VideoSegment],
+    budget: int,
+    min_relevance: float = 0.0,
+    max_segments: int = 5,
+    merge_gap: float = 2.0,
+) -> list[VideoSegment]:
+    """
+    Choose the segments to send for synthesis within a token budget.
+
+    Segments are taken in relevance order; one that doesn't fit is
+    skipped in favour of smaller ones, or truncated to the remaining
+    budget if enough is left.
+
+    Args:
+        segments: Search results
+        budget: Maximum approximate input tokens for all packed segments
+        min_relevance: Drop segments scoring below this
+        max_segments: Maximum segments to pack
+        merge_gap: Seconds between same-video segments that still merge
+
+    Returns:
+        Packed segments, most relevant first (empty if none qualify)
+    """
+    kept = [s for s in segments if s.relevance >= min_relevance]
+    candidates = sorted(merge_segments(kept, merge_gap), key=lambda s: s.relevance, reverse=True)
+
+    packed: list[VideoSegment] = []
+    used = 0
+    for segment in candidates:
+        if len(packed) >= max_segments:
+            break
+        cost = segment_tokens(segment)
+        if used + cost <= budget:
+            packed.append(segment)
+            used += cost
+            continue
+
+        room = budget - used - SEGMENT_OVERHEAD_TOKENS
+        if room >= MIN_TRUNCATED_TOKENS:
+            text = (segment.full_text or segment.text)[:room * CHARS_PER_TOKEN]
+            packed.append(_with_text(segment, text))
+            used += segment_tokens(packed[-1])
+    return packed
@@ -0,0 +1,234 @@
+"""
+On-demand request profiling for Minerva-Jess.
+
+Profiles a sample of calls with cProfile and keeps the results in a
+bounded in-memory ring buffer. Profiling is off unless a sample rate
+is set (JESS_PROFILE_SAMPLE_RATE or configure()) or a call is forced,
+e.g. by web.py when a request carries the X-Jess-Profile header.
+
+Only one profile runs at a time: cProfile hooks the whole thread, so a
+profile taken around an async call also includes whatever else the
+event loop ran in that window. Calls arriving while a profile is
+active are simply not profiled.
+
+Example:
+    from minerva_jess import profiling
+
+    profiling.PROFILER.configure(sample_rate=0.05)
+
+    @profiling.profiled("search")
+    async def search(query: str) -> list:
+        ...
+
+    for record in profiling.PROFILER.list():
+        print(record.name, record.duration)
+"""
+
+import cProfile
+import functools
+import io
+import itertools
+import logging
+import marshal
+import os
+import pstats
+import random
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Callable, Iterator, Optional
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ProfileRecord:
+    """A captured profile."""
+
+    id: str
+    name: str
+    started_at: str
+    duration: float
+    stats: bytes = field(repr=False)
+    tags: dict[str, str] = field(default_factory=dict)
+
+    def summary(self, sort: str = "cumulative", limit: int = 40) -> str:
+        """Human-readable pstats report."""
+        stream = io.StringIO()
+        stats = pstats.Stats(self._as_profile(), stream=stream)
+        stats.sort_stats(sort).print_stats(limit)
+        return stream.getvalue()
+
+    def _as_profile(self) -> cProfile.Profile:
+        """Rebuild a profile object pstats can load."""
+        profile = cProfile.Profile()
+        profile.stats = marshal.loads(self.stats)  # type: ignore[attr-defined]
+        profile.create_stats = lambda: None  # type: ignore[method-assign]
+        return profile
+
+    def to_dict(self) -> dict[str, Any]:
+        """Metadata without the stats payload."""
+        return {
+            "id": self.id,
+            "name": self.name,
+            "started_at": self.started_at,
+            "duration": round(self.duration, 6),
+            "size": len(self.stats),
+            "tags": self.tags,
+        }
+
+
+class Profiler:
+    """
+    Sampling cProfile hook with a bounded ring buffer of results.
+
+    Args:
+        sample_rate: Fraction of calls to profile (0.0 - 1.0)
+        max_profiles: Number of profiles kept; oldest are dropped
+        paths: Optional name prefixes eligible for sampling
+    """
+
+    def __init__(
+        self,
+        sample_rate: float = 0.0,
+        max_profiles: int = 20,
+        paths: Optional[list[str]] = None,
+    ):
+        self.sample_rate = sample_rate
+        self.paths = list(paths or [])
+        self._records: deque[ProfileRecord] = deque(maxlen=max_profiles)
+        self._active = threading.Lock()
+        self._ids = itertools.count(1)
+
+    def configure(
+        self,
+        sample_rate: Optional[float] = None,
+        max_profiles: Optional[int] = None,
+        paths: Optional[list[str]] = None,
+    ) -> None:
+        """Change sampling at runtime (no restart needed)."""
+        if sample_rate is not None:
+            self.sample_rate = min(max(sample_rate, 0.0), 1.0)
+        if max_profiles is not None and max_profiles != self._records.maxlen:
+            self._records = deque(self._records, maxlen=max_profiles)
+        if paths is not None:
+            self.paths = list(paths)
+
+    def should_profile(self, name: str = "", force: bool = False) -> bool:
+        """Decide whether a call should be profiled."""
+        if force:
+            return True
+        if self.sample_rate <= 0.0:
+            return False
+        if self.paths and not any(name.startswith(p) for p in self.paths):
+            return False
+        return random.random() < self.sample_rate
+
+    @contextmanager
+    def profile(
+        self,
+        name: str,
+        force: bool = False,
+        tags: Optional[dict[str, str]] = None,
+    ) -> Iterator[Optional[cProfile.Profile]]:
+        """
+        Profile the enclosed block if sampled.
+
+        Yields the active profiler, or None if this call isn't profiled.
+        """
+        if not self.should_profile(name, force) or not self._active.acquire(blocking=False):
+            yield None
+            return
+
+        profiler = cProfile.Profile()
+        started_at = datetime.now().isoformat()
+        start = time.perf_counter()
+        try:
+            profiler.enable()
+            try:
+                yield profiler
+            finally:
+                profiler.disable()
+        finally:
+            self._active.release()
+            self._store(name, started_at, time.perf_counter() - start, profiler, tags)
+
+    def _store(
+        self,
+        name: str,
+        started_at: str,
+        duration: float,
+        profiler: cProfile.Profile,
+        tags: Optional[dict[str, str]],
+    ) -> None:
+        """Save a finished profile into the ring buffer."""
+        try:
+            profiler.create_stats()
+            record = ProfileRecord(
+                id=f"{int(time.time())}-{next(self._ids)}",
+                name=name,
+                started_at=started_at,
+                duration=duration,
+                stats=marshal.dumps(profiler.stats),  # type: ignore[attr-defined]
+                tags=dict(tags or {}),
+            )
+            self._records.append(record)
+            logger.info(f"Captured profile {record.id} for {name} ({duration:.3f}s)")
+        except Exception as e:
+            logger.error(f"Failed to store profile for {name}: {e}")
+
+    def list(self) -> list[ProfileRecord]:
+        """Captured profiles, newest first."""
+        return list(reversed(self._records))
+
+    def get(self, profile_id: str) -> Optional[ProfileRecord]:
+        """Look up a profile by id."""
+        for record in self._records:
+            if record.id == profile_id:
+                return record
+        return None
+
+    def clear(self) -> None:
+        """Drop all captured profiles."""
+        self._records.clear()
+
+
+def _env_float(name: str, default: float) -> float:
+    try:
+        return float(os.environ.get(name, default))
+    except ValueError:
+        return default
+
+
+# Process-wide profiler shared by the SDK and web.py
+PROFILER = Profiler(
+    sample_rate=_env_float("JESS_PROFILE_SAMPLE_RATE", 0.0),
+    max_profiles=int(_env_float("JESS_PROFILE_BUFFER", 20)),
+)
+
+
+def profiled(name: Optional[str] = None, profiler: Optional[Profiler] = None) -> Callable:
+    """
+    Decorator that profiles sampled calls of an async function.
+
+    Pass ``_profile=True`` to the decorated function to force profiling
+    of a single call.
+
+    Args:
+        name: Profile name (defaults to the function's qualified name)
+        profiler: Profiler to record into (defaults to PROFILER)
+    """
+    def decorator(func: Callable) -> Callable:
+        label = name or func.__qualname__
+
+        @functools.wraps(func)
+        async def wrapper(*args: Any, _profile: bool = False, **kwargs: Any) -> Any:
+            with (profiler or PROFILER).profile(label, force=_profile):
+                return await func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
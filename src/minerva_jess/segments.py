@@ -0,0 +1,126 @@
+"""
+Compact column storage for Orca search results.
+
+SegmentTable parses a /video/search payload once into parallel columns
+(ids, titles and text in lists; timing and score in float arrays).
+Timestamps and URLs are formatted on demand, and rows become pydantic
+VideoSegment objects only when handed to callers. Those objects are
+built with model_construct, since the columns are already typed.
+
+Example:
+    table = SegmentTable.from_results(data["results"], catalog=get_video_catalog())
+    print(len(table), table.url(0))
+    segments = table.to_segments(limit=5)
+"""
+
+from array import array
+from typing import Iterable, Iterator, Mapping, Optional
+
+from minerva_jess.models import VideoSegment
+
+# Snippet length kept in VideoSegment.text
+SNIPPET_CHARS = 300
+
+
+class SegmentTable:
+    """Search results stored column-wise; rows materialize lazily."""
+
+    __slots__ = ("video_ids", "titles", "texts", "starts", "ends", "scores")
+
+    def __init__(self):
+        self.video_ids: list[str] = []
+        self.titles: list[str] = []
+        self.texts: list[str] = []
+        self.starts = array("d")
+        self.ends = array("d")
+        self.scores = array("d")
+
+    @classmethod
+    def from_results(
+        cls,
+        results: Iterable[dict],
+        catalog: Optional[Mapping[str, dict]] = None,
+    ) -> "SegmentTable":
+        """
+        Parse raw search hits (same rules as VideoSegment.from_search_result).
+
+        Args:
+            results: The "results" list of a /video/search response
+            catalog: Video metadata used to replace missing or placeholder titles
+        """
+        table = cls()
+        catalog = catalog or {}
+        add_id, add_title, add_text = (
+            table.video_ids.append, table.titles.append, table.texts.append
+        )
+        add_start, add_end, add_score = table.starts.append, table.ends.append, table.scores.append
+
+        for item in results:
+            video_id = item.get("video_id", "")
+            start = item.get("start_time", item.get("start", 0))
+            end = item.get("end_time", item.get("end", start))
+            title = item.get("title")
+            if title is None:
+                title = f"Video {video_id}"  # Also for an explicit null (titles are str)
+            if video_id in catalog and (not title or title.startswith("Video ")):
+                title = catalog[video_id].get("title", title)
+
+            add_id(video_id)
+            add_title(title)
+            add_text(item.get("text", ""))
+            add_start(start)
+            add_end(end)
+            add_score(item.get("score", item.get("relevance", 0.0)) or 0.0)
+        return table
+
+    def __len__(self) -> int:
+        return len(self.video_ids)
+
+    def __getitem__(self, index: int) -> VideoSegment:
+        return self.segment(index)
+
+    def __iter__(self) -> Iterator[VideoSegment]:
+        return (self.segment(i) for i in range(len(self)))
+
+    def timestamp(self, index: int) -> str:
+        """Human-readable start time of a row (m:ss)."""
+        start = self.starts[index]
+        return f"{int(start // 60)}:{int(start % 60):02d}"
+
+    def url(self, index: int) -> str:
+        """YouTube URL at a row's start time."""
+        return f"https://youtube.com/watch?v={self.video_ids[index]}&t={int(self.starts[index])}s"
+
+    def segment(self, index: int) -> VideoSegment:
+        """Materialize one row as a VideoSegment."""
+        text = self.texts[index]
+        return VideoSegment.model_construct(
+            video_id=self.video_ids[index],
+            title=self.titles[index],
+            text=text[:SNIPPET_CHARS],
+            full_text=text,
+            start_time=self.starts[index],
+            end_time=self.ends[index],
+            timestamp=self.timestamp(index),
+            url=self.url(index),
+            relevance=self.scores[index],
+        )
+
+    def to_columns(self) -> dict[str, list]:
+        """Columns as plain lists (for serialization)."""
+        return {name: list(getattr(self, name)) for name in self.__slots__}
+
+    @classmethod
+    def from_columns(cls, columns: Mapping[str, Iterable]) -> "SegmentTable":
+        """Inverse of to_columns()."""
+        table = cls()
+        for name in ("video_ids", "titles", "texts"):
+            setattr(table, name, list(columns[name]))
+        for name in ("starts", "ends", "scores"):
+            setattr(table, name, array("d", columns[name]))
+        return table
+
+    def to_segments(self, limit: Optional[int] = None) -> list[VideoSegment]:
+        """Materialize the first `limit` rows (all by default)."""
+        count = len(self) if limit is None else min(limit, len(self))
+        return [self.segment(i) for i in range(count)]
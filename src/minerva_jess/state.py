@@ -0,0 +1,218 @@
+"""
+Multi-worker-safe JSON state files.
+
+web.py keeps its state (video list, translations, transcripts) in JSON
+files. With several uvicorn workers, plain load-modify-save loses
+writes: two workers load the same file and the second save drops the
+first one's change. JsonStore fixes that with three rules:
+
+- Writes go to a temporary file in the same directory, are fsynced and
+  then renamed over the original, so readers always see a whole file.
+- Changes run inside update(), which holds an exclusive advisory lock
+  (flock on a ``.lock`` file next to the data file) across the
+  read-modify-write, so concurrent writers are serialized.
+- Every read returns a version (the file's inode, mtime and size).
+  write(..., expected_version=v) raises StateConflictError if another
+  writer got there first, for callers that read, do slow work outside
+  the lock (e.g. call HeyGen), then write.
+
+Reads take no lock. Locks are advisory and per host; workers on
+different machines need a shared database instead.
+
+Example:
+    store = JsonStore(DATA_DIR / "translations.json")
+
+    def add_job(translations):
+        translations.setdefault(video_id, {"languages": {}})["languages"][lang] = job
+
+    store.update(add_job)
+    translations = store.read()
+"""
+
+import logging
+import os
+import tempfile
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Iterator, Optional, TypeVar, Union
+
+from minerva_jess import codec
+
+try:
+    import fcntl
+except ImportError:  # Windows: fall back to in-process locking only
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Sentinel for write() without a version check
+_ANY = object()
+
+
+class StateConflictError(Exception):
+    """The file changed since it was read (another writer saved first)."""
+
+
+class JsonStore:
+    """
+    One JSON state file with atomic writes, locked updates and versions.
+
+    Args:
+        path: Data file (created on first write)
+        default: Factory for the value of a missing or unreadable file
+        migrate: Upgrades old data in place, returning True if it changed
+            anything; applied on every read and persisted once
+        indent: Write indented JSON (easier to inspect by hand)
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        default: Callable[[], Any] = dict,
+        migrate: Optional[Callable[[Any], bool]] = None,
+        indent: bool = False,
+    ):
+        self.path = Path(path)
+        self.lock_path = self.path.with_name(self.path.name + ".lock")
+        self.default = default
+        self.migrate = migrate
+        self.indent = indent
+        # flock is per open file; this makes lock() reentrant within a thread
+        self._thread_lock = threading.RLock()
+        self._local = threading.local()
+
+    def read(self) -> Any:
+        """Current contents (the default if the file is missing or corrupt)."""
+        return self.read_versioned()[0]
+
+    def read_versioned(self) -> tuple[Any, Optional[str]]:
+        """
+        Current contents and their version.
+
+        Returns:
+            (data, version); version is None if the file doesn't exist
+        """
+        data, version = self._load()
+        if self.migrate is not None and version is not None and self.migrate(data):
+            # Persist the upgrade once; a concurrent writer may have beaten us to it
+            with self.lock():
+                data, version = self._load()
+                if self.migrate(data):
+                    version = self._write(data)
+        return data, version
+
+    def version(self) -> Optional[str]:
+        """Version of the file on disk (None if missing)."""
+        try:
+            return _version(os.stat(self.path))
+        except FileNotFoundError:
+            return None
+
+    def write(self, data: Any, expected_version: Any = _ANY) -> str:
+        """
+        Atomically replace the file.
+
+        Args:
+            data: New contents
+            expected_version: Version returned by read_versioned(); raise
+                StateConflictError if the file has changed since
+
+        Returns:
+            The new version
+        """
+        with self.lock():
+            if expected_version is not _ANY and self.version() != expected_version:
+                raise StateConflictError(f"{self.path.name} changed since it was read")
+            return self._write(data)
+
+    def update(
+        self, mutate: Callable[[Any], T], changed: Optional[Callable[[T], bool]] = None
+    ) -> T:
+        """
+        Read, change and write the file while holding the lock.
+
+        ``mutate`` receives the current data and changes it in place; keep
+        it fast (no network calls), since other writers wait for it.
+
+        Args:
+            mutate: Changes the data in place
+            changed: Given mutate's result, whether anything changed; the
+                write (and fsync) is skipped when it returns False
+
+        Returns:
+            Whatever ``mutate`` returns
+        """
+        with self.lock():
+            data, _ = self._load()
+            migrated = self.migrate is not None and self.migrate(data)
+            result = mutate(data)
+            if migrated or changed is None or changed(result):
+                self._write(data)
+            return result
+
+    @contextmanager
+    def lock(self) -> Iterator[None]:
+        """Exclusive lock across processes (reentrant within a thread)."""
+        with self._thread_lock:
+            depth = getattr(self._local, "depth", 0)
+            if depth:
+                self._local.depth = depth + 1
+                try:
+                    yield
+                finally:
+                    self._local.depth = depth
+                return
+
+            self.lock_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.lock_path, "a") as handle:
+                if fcntl is not None:
+                    fcntl.flock(handle.fileno(), fcntl.LOCK_EX)
+                self._local.depth = 1
+                try:
+                    yield
+                finally:
+                    self._local.depth = 0
+                    if fcntl is not None:
+                        fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+
+    def _load(self) -> tuple[Any, Optional[str]]:
+        try:
+            with open(self.path, "rb") as f:
+                # Version from the open file, so it matches the bytes read
+                version = _version(os.fstat(f.fileno()))
+                raw = f.read()
+        except FileNotFoundError:
+            return self.default(), None
+        try:
+            return codec.loads(raw), version
+        except ValueError as e:
+            logger.warning(f"Unreadable state file {self.path}: {e}")
+            return self.default(), version
+
+    def _write(self, data: Any) -> str:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        payload = codec.dumps(data, self.indent)
+        fd, tmp = tempfile.mkstemp(
+            dir=self.path.parent, prefix=f".{self.path.name}.", suffix=".tmp"
+        )
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(payload)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp, self.path)
+        except BaseException:
+            try:
+                os.unlink(tmp)
+            except FileNotFoundError:
+                pass
+            raise
+        return _version(os.stat(self.path))
+
+
+def _version(st: os.stat_result) -> str:
+    # A rename installs a new inode, so this changes on every write
+    return f"{st.st_ino}-{st.st_mtime_ns}-{st.st_size}"
@@ -0,0 +1,600 @@
+"""
+Request tracing for Minerva-Jess.
+
+Spans time each stage of a request (query cleaning, intent routing,
+Orca calls, transcript fetches, LLM calls, file I/O) and are linked
+into one trace through a context variable, so context follows a
+request from web.py through JessAgent into OrcaMCPClient without being
+passed around. Outgoing calls carry a W3C ``traceparent`` header.
+
+Sampling is decided once per trace, at its root: with the default
+sample rate of 0 a span costs one context-variable lookup. An incoming
+``traceparent`` is continued (same trace id), but its sampled flag is
+only followed with JESS_TRACE_TRUST_PARENT=1, since any client can set
+it. Finished spans of sampled traces are kept in a bounded ring buffer
+and sent to the configured exporters:
+
+    JESS_TRACE_SAMPLE_RATE=0.01
+    JESS_TRACE_TRUST_PARENT=1                                # behind a trusted caller only
+    JESS_TRACE_FILE=data/traces.jsonl                        # one span per line
+    JESS_TRACE_OTLP_ENDPOINT=http://localhost:4318/v1/traces  # OTLP/HTTP JSON
+
+Example:
+    from minerva_jess import tracing
+
+    tracing.TRACER.configure(sample_rate=0.05)
+
+    with tracing.span("video_mcp.get_transcript", video_id=video_id) as span:
+        resp = requests.post(url, json=payload, headers=tracing.inject())
+        span.set_attribute("status_code", resp.status_code)
+
+    @tracing.traced("file.load_transcripts")
+    def load_transcripts() -> dict:
+        ...
+"""
+
+import functools
+import inspect
+import logging
+import os
+import queue
+import random
+import re
+import threading
+import time
+import urllib.request
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Iterator, Optional, Union
+
+from minerva_jess import codec
+
+logger = logging.getLogger(__name__)
+
+_TRACEPARENT = re.compile(r"^00-([0-9a-f]{32})-([0-9a-f]{16})-([0-9a-f]{2})$")
+
+
+@dataclass(frozen=True)
+class SpanContext:
+    """Identifies a span within a trace, and whether the trace is recorded."""
+
+    trace_id: str
+    span_id: str
+    sampled: bool = True
+
+    @property
+    def traceparent(self) -> str:
+        """W3C traceparent header value."""
+        return f"00-{self.trace_id}-{self.span_id}-{'01' if self.sampled else '00'}"
+
+
+def _trace_id() -> str:
+    return f"{random.getrandbits(128):032x}"
+
+
+def _span_id() -> str:
+    return f"{random.getrandbits(64):016x}"
+
+
+def extract(headers: Any) -> Optional[SpanContext]:
+    """
+    Parse the traceparent header of an incoming request.
+
+    Args:
+        headers: Any mapping with .get() (or a raw header value)
+
+    Returns:
+        The caller's span context, or None if absent or malformed
+    """
+    value = headers if isinstance(headers, str) else headers.get("traceparent")
+    match = _TRACEPARENT.match((value or "").strip().lower())
+    if match is None or set(match.group(1)) == {"0"} or set(match.group(2)) == {"0"}:
+        return None
+    return SpanContext(match.group(1), match.group(2), bool(int(match.group(3), 16) & 1))
+
+
+_current: ContextVar[Optional[SpanContext]] = ContextVar("jess_trace_context", default=None)
+
+
+def current_context() -> Optional[SpanContext]:
+    """Span context active in this task/thread, if any."""
+    return _current.get()
+
+
+def inject(headers: Optional[dict[str, str]] = None) -> dict[str, str]:
+    """
+    Add the active trace's traceparent header to `headers`.
+
+    Args:
+        headers: Headers to update (a new dict if omitted)
+
+    Returns:
+        The headers (unchanged when no trace is active)
+    """
+    headers = {} if headers is None else headers
+    context = _current.get()
+    if context is not None:
+        headers["traceparent"] = context.traceparent
+    return headers
+
+
+class Span:
+    """A timed operation in a trace."""
+
+    __slots__ = (
+        "name", "context", "parent_id", "root", "start_ns", "end_ns",
+        "attributes", "status", "error", "_start",
+    )
+
+    def __init__(
+        self,
+        name: str,
+        context: SpanContext,
+        parent_id: Optional[str] = None,
+        attributes: Optional[dict[str, Any]] = None,
+        root: Optional[bool] = None,
+    ):
+        self.name = name
+        self.context = context
+        self.parent_id = parent_id
+        # First span of the trace in this process (its parent, if any, is remote)
+        self.root = parent_id is None if root is None else root
+        self.attributes: dict[str, Any] = dict(attributes or {})
+        self.status = "ok"
+        self.error: Optional[str] = None
+        self.start_ns = time.time_ns()
+        self.end_ns: Optional[int] = None
+        self._start = time.perf_counter()
+
+    @property
+    def trace_id(self) -> str:
+        return self.context.trace_id
+
+    @property
+    def span_id(self) -> str:
+        return self.context.span_id
+
+    @property
+    def duration(self) -> float:
+        """Seconds from start to end (or to now while open)."""
+        if self.end_ns is not None:
+            return (self.end_ns - self.start_ns) / 1e9
+        return time.perf_counter() - self._start
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        """Attach a key/value to the span."""
+        self.attributes[key] = value
+
+    def record_error(self, error: BaseException) -> None:
+        """Mark the span failed with an exception."""
+        self.status = "error"
+        self.error = f"{type(error).__name__}: {error}"
+
+    def end(self) -> None:
+        """Stop the clock (idempotent)."""
+        if self.end_ns is None:
+            self.end_ns = self.start_ns + int((time.perf_counter() - self._start) * 1e9)
+
+    def to_dict(self) -> dict[str, Any]:
+        """JSON-friendly representation (the JSONL export format)."""
+        return {
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "name": self.name,
+            "start_ns": self.start_ns,
+            "end_ns": self.end_ns,
+            "duration_ms": round(self.duration * 1000, 3),
+            "status": self.status,
+            "error": self.error,
+            "attributes": self.attributes,
+        }
+
+
+class _NoopSpan:
+    """Stand-in yielded for spans that aren't recorded."""
+
+    __slots__ = ()
+    context = None
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        pass
+
+    def record_error(self, error: BaseException) -> None:
+        pass
+
+
+NOOP_SPAN = _NoopSpan()
+
+AnySpan = Union[Span, _NoopSpan]
+
+
+class JsonlExporter:
+    """
+    Appends finished spans to a JSON Lines file.
+
+    Args:
+        path: File to append to (parent directories are created)
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._file = None
+
+    def export(self, spans: list[Span]) -> None:
+        lines = b"".join(codec.dumps(s.to_dict()) + b"\n" for s in spans)
+        with self._lock:
+            if self._file is None:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                self._file = open(self.path, "ab")
+            self._file.write(lines)
+            self._file.flush()
+
+    def shutdown(self) -> None:
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+
+def _otlp_value(value: Any) -> dict[str, Any]:
+    """Attribute value in OTLP/JSON form."""
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+def to_otlp(spans: list[Span], service_name: str = "jess") -> dict[str, Any]:
+    """Spans as an OTLP/HTTP JSON ExportTraceServiceRequest body."""
+    return {
+        "resourceSpans": [{
+            "resource": {"attributes": [
+                {"key": "service.name", "value": {"stringValue": service_name}},
+            ]},
+            "scopeSpans": [{
+                "scope": {"name": "minerva_jess"},
+                "spans": [
+                    {
+                        "traceId": s.trace_id,
+                        "spanId": s.span_id,
+                        "parentSpanId": s.parent_id or "",
+                        "name": s.name,
+                        "kind": 1,
+                        "startTimeUnixNano": str(s.start_ns),
+                        "endTimeUnixNano": str(s.end_ns or s.start_ns),
+                        "attributes": [
+                            {"key": k, "value": _otlp_value(v)} for k, v in s.attributes.items()
+                        ],
+                        "status": (
+                            {"code": 2, "message": s.error or ""}
+                            if s.status == "error" else {"code": 1}
+                        ),
+                    }
+                    for s in spans
+                ],
+            }],
+        }],
+    }
+
+
+class OtlpHttpExporter:
+    """
+    Posts spans in batches to an OTLP/HTTP (JSON) collector.
+
+    Spans are queued and sent by a daemon thread, so request handling
+    never waits on the collector. When the queue is full, or the
+    collector fails, spans are dropped.
+
+    Args:
+        endpoint: Collector URL (e.g. http://localhost:4318/v1/traces)
+        service_name: Reported as the service.name resource attribute
+        batch_size: Maximum spans per request
+        interval: Seconds between flushes of a partial batch
+        max_queue: Spans buffered before new ones are dropped
+        timeout: Seconds to wait for the collector
+    """
+
+    def __init__(
+        self,
+        endpoint: str,
+        service_name: str = "jess",
+        batch_size: int = 256,
+        interval: float = 2.0,
+        max_queue: int = 4096,
+        timeout: float = 5.0,
+    ):
+        self.endpoint = endpoint
+        self.service_name = service_name
+        self.batch_size = batch_size
+        self.interval = interval
+        self.timeout = timeout
+        self.dropped = 0
+        self._queue: queue.Queue[Optional[Span]] = queue.Queue(maxsize=max_queue)
+        self._idle = threading.Event()
+        self._idle.set()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def export(self, spans: list[Span]) -> None:
+        self._ensure_thread()
+        for span in spans:
+            try:
+                self._queue.put_nowait(span)
+                self._idle.clear()
+            except queue.Full:
+                self.dropped += 1
+
+    def _ensure_thread(self) -> None:
+        if self._thread is None or not self._thread.is_alive():
+            with self._lock:
+                if self._thread is None or not self._thread.is_alive():
+                    self._thread = threading.Thread(
+                        target=self._worker, name="jess-trace-export", daemon=True
+                    )
+                    self._thread.start()
+
+    def _worker(self) -> None:
+        while True:
+            batch: list[Span] = []
+            deadline = time.monotonic() + self.interval
+            stop = False
+            while len(batch) < self.batch_size:
+                try:
+                    item = self._queue.get(timeout=max(deadline - time.monotonic(), 0.0))
+                except queue.Empty:
+                    break
+                if item is None:
+                    stop = True
+                    break
+                batch.append(item)
+            if batch:
+                self._post(batch)
+            if self._queue.empty():
+                self._idle.set()
+            if stop:
+                return
+
+    def _post(self, spans: list[Span]) -> None:
+        body = codec.dumps(to_otlp(spans, self.service_name))
+        request = urllib.request.Request(
+            self.endpoint, data=body, headers={"Content-Type": "application/json"}
+        )
+        try:
+            with urllib.request.urlopen(request, timeout=self.timeout) as response:
+                response.read()
+        except Exception as e:
+            self.dropped += len(spans)
+            logger.warning(f"Trace export to {self.endpoint} failed: {e}")
+
+    def flush(self, timeout: float = 5.0) -> bool:
+        """Wait until queued spans have been sent (or dropped)."""
+        if self._thread is None:
+            return True
+        return self._idle.wait(timeout)
+
+    def shutdown(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            self._queue.put(None)
+            self._thread.join(timeout=self.timeout)
+
+
+class Tracer:
+    """
+    Head-sampling tracer with a ring buffer of recent spans.
+
+    Args:
+        sample_rate: Fraction of new traces to record (0.0 - 1.0)
+        exporters: Objects with export(spans) (and optionally shutdown())
+        max_spans: Recent spans kept in memory for /admin/traces
+        parent_based: Follow the sampled flag of an incoming traceparent
+            (otherwise it is re-sampled at ``sample_rate``, keeping its trace id)
+    """
+
+    def __init__(
+        self,
+        sample_rate: float = 0.0,
+        exporters: Optional[list[Any]] = None,
+        max_spans: int = 2000,
+        parent_based: bool = True,
+    ):
+        self.sample_rate = sample_rate
+        self.exporters = list(exporters or [])
+        self.parent_based = parent_based
+        self._recent: deque[Span] = deque(maxlen=max_spans)
+
+    def configure(
+        self,
+        sample_rate: Optional[float] = None,
+        exporters: Optional[list[Any]] = None,
+        max_spans: Optional[int] = None,
+    ) -> None:
+        """Change sampling or exporters at runtime (no restart needed)."""
+        if sample_rate is not None:
+            self.sample_rate = min(max(sample_rate, 0.0), 1.0)
+        if exporters is not None:
+            self.exporters = list(exporters)
+        if max_spans is not None and max_spans != self._recent.maxlen:
+            self._recent = deque(self._recent, maxlen=max_spans)
+
+    @contextmanager
+    def span(
+        self,
+        name: str,
+        parent: Optional[SpanContext] = None,
+        force: bool = False,
+        **attributes: Any,
+    ) -> Iterator[AnySpan]:
+        """
+        Time the enclosed block as a span of the active trace.
+
+        With no active trace this starts one, sampled at ``sample_rate``.
+        Yields NOOP_SPAN when the trace isn't recorded.
+
+        Args:
+            name: Span name, e.g. "orca.search"
+            parent: Remote parent (from extract()) instead of the active context
+            force: Record this trace regardless of the sample rate
+            **attributes: Initial span attributes
+        """
+        remote = parent is not None
+        if parent is None:
+            parent = _current.get()
+
+        if (
+            parent is None
+            or (force and not parent.sampled)
+            or (remote and not self.parent_based)
+        ):
+            if not force and self.sample_rate <= 0.0:
+                yield NOOP_SPAN
+                return
+            sampled = force or random.random() < self.sample_rate
+            trace_id = parent.trace_id if parent is not None else _trace_id()
+            parent_id = parent.span_id if parent is not None else None
+        elif not parent.sampled:
+            # Keep propagating the caller's "not sampled" decision downstream
+            token = _current.set(SpanContext(parent.trace_id, _span_id(), sampled=False))
+            try:
+                yield NOOP_SPAN
+            finally:
+                _current.reset(token)
+            return
+        else:
+            sampled, trace_id, parent_id = True, parent.trace_id, parent.span_id
+
+        context = SpanContext(trace_id, _span_id(), sampled)
+        token = _current.set(context)
+        if not sampled:
+            try:
+                yield NOOP_SPAN
+            finally:
+                _current.reset(token)
+            return
+
+        span = Span(name, context, parent_id, attributes, root=remote or parent_id is None)
+        try:
+            yield span
+        except BaseException as e:
+            span.record_error(e)
+            raise
+        finally:
+            _current.reset(token)
+            span.end()
+            self._finish(span)
+
+    def _finish(self, span: Span) -> None:
+        """Buffer and export a finished span."""
+        self._recent.append(span)
+        for exporter in self.exporters:
+            try:
+                exporter.export([span])
+            except Exception as e:
+                logger.error(f"Trace exporter {type(exporter).__name__} failed: {e}")
+
+    def traces(self, limit: int = 50) -> list[dict[str, Any]]:
+        """Recent traces (newest first) summarized by their root span."""
+        counts: dict[str, int] = {}
+        for span in self._recent:
+            counts[span.trace_id] = counts.get(span.trace_id, 0) + 1
+        summaries = []
+        for span in reversed(self._recent):
+            if span.root:
+                summaries.append({
+                    "trace_id": span.trace_id,
+                    "name": span.name,
+                    "start_ns": span.start_ns,
+                    "duration_ms": round(span.duration * 1000, 3),
+                    "status": span.status,
+                    "spans": counts.get(span.trace_id, 0),
+                })
+                if len(summaries) >= limit:
+                    break
+        return summaries
+
+    def get_trace(self, trace_id: str) -> list[Span]:
+        """Buffered spans of one trace, in start order."""
+        return sorted(
+            (s for s in self._recent if s.trace_id == trace_id), key=lambda s: s.start_ns
+        )
+
+    def clear(self) -> None:
+        """Drop buffered spans."""
+        self._recent.clear()
+
+    def shutdown(self) -> None:
+        """Flush and close exporters."""
+        for exporter in self.exporters:
+            shutdown = getattr(exporter, "shutdown", None)
+            if shutdown is not None:
+                shutdown()
+
+
+def _env_float(name: str, default: float) -> float:
+    try:
+        return float(os.environ.get(name, default))
+    except ValueError:
+        return default
+
+
+def _env_exporters() -> list[Any]:
+    """Exporters configured through JESS_TRACE_FILE / JESS_TRACE_OTLP_ENDPOINT."""
+    exporters: list[Any] = []
+    if os.environ.get("JESS_TRACE_FILE"):
+        exporters.append(JsonlExporter(os.environ["JESS_TRACE_FILE"]))
+    if os.environ.get("JESS_TRACE_OTLP_ENDPOINT"):
+        exporters.append(OtlpHttpExporter(
+            os.environ["JESS_TRACE_OTLP_ENDPOINT"],
+            service_name=os.environ.get("JESS_TRACE_SERVICE", "jess"),
+        ))
+    return exporters
+
+
+# Process-wide tracer shared by the SDK and web.py
+TRACER = Tracer(
+    sample_rate=_env_float("JESS_TRACE_SAMPLE_RATE", 0.0),
+    exporters=_env_exporters(),
+    max_spans=int(_env_float("JESS_TRACE_BUFFER", 2000)),
+    parent_based=os.environ.get("JESS_TRACE_TRUST_PARENT", "").lower() in ("1", "true", "yes"),
+)
+
+
+def span(name: str, **attributes: Any):
+    """Span on the default tracer (see Tracer.span)."""
+    return TRACER.span(name, **attributes)
+
+
+def traced(name: Optional[str] = None, tracer: Optional[Tracer] = None) -> Callable:
+    """
+    Decorator wrapping each call of a function (sync or async) in a span.
+
+    Args:
+        name: Span name (defaults to the function's qualified name)
+        tracer: Tracer to record into (defaults to TRACER)
+    """
+    def decorator(func: Callable) -> Callable:
+        label = name or func.__qualname__
+
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+                with (tracer or TRACER).span(label):
+                    return await func(*args, **kwargs)
+
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            with (tracer or TRACER).span(label):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
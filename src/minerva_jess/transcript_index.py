@@ -0,0 +1,162 @@
+"""
+Segment-level transcript storage with timestamp lookup.
+
+A TranscriptIndex keeps a transcript's segments column-wise: start and
+end times in float arrays, speaker ids in an int array (names listed
+once), and text as offsets into the flat transcript string, which is
+the same space-joined text web.py has always stored. Stored records
+keep their "transcript" field unchanged and gain a compact "segments"
+column dict, so nothing is duplicated.
+
+Segments are sorted by start time, so at(t) and between(start, end)
+bisect the start array: O(log n) instead of a scan.
+
+Example:
+    index = TranscriptIndex.from_segments(data["segments"])
+    record = {"transcript": index.text, "segments": index.to_columns(), ...}
+
+    index = TranscriptIndex.from_record(record)
+    index.segment(index.at(195.0))     # what was said at 3:15
+    rows = index.between(60, 120)
+    [index.segment(i) for i in rows], index.span_text(rows)
+"""
+
+from array import array
+from bisect import bisect_right
+from typing import Any, Iterable, Mapping, Optional
+
+# Separator between segment texts in the flat transcript
+_SEP = " "
+
+
+class TranscriptIndex:
+    """One transcript's segments, stored column-wise."""
+
+    __slots__ = ("starts", "ends", "offsets", "speakers", "speaker_names", "text")
+
+    def __init__(self):
+        self.starts = array("d")
+        self.ends = array("d")
+        # Start of segment i's text in `text`; one extra entry past the end
+        self.offsets = array("q", [0])
+        self.speakers = array("i")  # Index into speaker_names, -1 if unknown
+        self.speaker_names: list[str] = []
+        self.text = ""
+
+    @classmethod
+    def from_segments(cls, segments: Iterable[Mapping[str, Any]]) -> "TranscriptIndex":
+        """
+        Build from Video MCP segments.
+
+        Accepts start/start_time, end/end_time (or duration) and an optional
+        speaker. A missing end runs to the next segment's start.
+        """
+        rows = []
+        for seg in segments:
+            start = float(seg.get("start_time", seg.get("start", 0)) or 0)
+            end = seg.get("end_time", seg.get("end"))
+            if end is None and seg.get("duration") is not None:
+                end = start + float(seg["duration"])
+            rows.append((start, end, seg.get("text", "") or "", seg.get("speaker")))
+        rows.sort(key=lambda row: row[0])
+
+        index = cls()
+        speaker_ids: dict[str, int] = {}
+        texts = []
+        position = 0
+        for i, (start, end, text, speaker) in enumerate(rows):
+            if end is None:
+                end = rows[i + 1][0] if i + 1 < len(rows) else start
+            index.starts.append(start)
+            index.ends.append(max(float(end), start))
+            if speaker is None:
+                index.speakers.append(-1)
+            else:
+                if speaker not in speaker_ids:
+                    speaker_ids[speaker] = len(index.speaker_names)
+                    index.speaker_names.append(str(speaker))
+                index.speakers.append(speaker_ids[speaker])
+            texts.append(text)
+            position += len(text) + len(_SEP)
+            index.offsets.append(position)
+        index.text = _SEP.join(texts)
+        return index
+
+    @classmethod
+    def from_record(cls, record: Mapping[str, Any]) -> Optional["TranscriptIndex"]:
+        """Index of a stored transcript record (None if it has no segments)."""
+        columns = record.get("segments")
+        if not isinstance(columns, Mapping):
+            return None
+        index = cls()
+        index.starts = array("d", columns["starts"])
+        index.ends = array("d", columns["ends"])
+        index.offsets = array("q", columns["offsets"])
+        index.speakers = array("i", columns["speakers"])
+        index.speaker_names = list(columns.get("speaker_names", []))
+        index.text = record.get("transcript") or ""
+        return index
+
+    def to_columns(self) -> dict[str, list]:
+        """Columns for the stored record (the text is the record's "transcript")."""
+        return {
+            "starts": self.starts.tolist(),
+            "ends": self.ends.tolist(),
+            "offsets": self.offsets.tolist(),
+            "speakers": self.speakers.tolist(),
+            "speaker_names": list(self.speaker_names),
+        }
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def segment_text(self, index: int) -> str:
+        """Text of one segment (a slice of the flat transcript)."""
+        return self.text[self.offsets[index]:self.offsets[index + 1] - len(_SEP)]
+
+    def span_text(self, rows: range) -> str:
+        """Text of consecutive segments (one slice, no joining)."""
+        if not rows:
+            return ""
+        return self.text[self.offsets[rows.start]:self.offsets[rows.stop] - len(_SEP)]
+
+    def speaker(self, index: int) -> Optional[str]:
+        """Speaker of one segment (None if unknown)."""
+        speaker_id = self.speakers[index]
+        return self.speaker_names[speaker_id] if speaker_id >= 0 else None
+
+    def segment(self, index: int) -> dict[str, Any]:
+        """One segment as a dict (index, start, end, timestamp, speaker, text)."""
+        start = self.starts[index]
+        return {
+            "index": index,
+            "start": start,
+            "end": self.ends[index],
+            "timestamp": f"{int(start // 60)}:{int(start % 60):02d}",
+            "speaker": self.speaker(index),
+            "text": self.segment_text(index),
+        }
+
+    def at(self, t: float) -> Optional[int]:
+        """
+        Segment being spoken at `t` seconds.
+
+        In a pause between segments this is the one that just ended.
+
+        Returns:
+            Segment index, or None before the first or after the last segment
+        """
+        index = bisect_right(self.starts, t) - 1
+        if index < 0 or t > self.ends[-1]:
+            return None
+        return index
+
+    def between(self, start: float, end: float) -> range:
+        """Indexes of the segments overlapping [start, end], in time order."""
+        if end < start or not self.starts:
+            return range(0)
+        lo = max(bisect_right(self.starts, start) - 1, 0)
+        if self.ends[lo] < start:
+            lo += 1  # Previous segment ended before the range begins
+        hi = bisect_right(self.starts, end)
+        return range(lo, max(lo, hi))
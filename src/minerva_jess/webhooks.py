@@ -0,0 +1,115 @@
+"""
+HeyGen webhook handling.
+
+HeyGen calls back when a video translation finishes, so web.py no longer
+has to poll every processing job. Each callback is signed: the
+``Signature`` header is the hex HMAC-SHA256 of the raw body under the
+endpoint secret. Events are applied idempotently, so redelivered or
+late callbacks never regress a translation's state.
+
+Example:
+    if not verify_signature(secret, body, request.headers.get("Signature", "")):
+        raise HTTPException(status_code=401)
+    update = parse_translation_event(codec.loads(body))
+    outcome = translations_store.update(lambda t: apply_translation_update(t, update))
+"""
+
+import hashlib
+import hmac
+from dataclasses import dataclass
+from typing import Any, Optional
+
+# Event type suffixes for finished translations
+_STATUSES = {"success": "completed", "fail": "failed", "failed": "failed"}
+
+
+@dataclass(frozen=True)
+class TranslationUpdate:
+    """A finished HeyGen translation job."""
+
+    job_id: Optional[str]
+    callback_id: Optional[str]
+    status: str
+    output_url: Optional[str] = None
+    error: Optional[str] = None
+
+
+def sign(secret: str, body: bytes) -> str:
+    """Signature HeyGen sends for `body` (also used by the local callback sender)."""
+    return hmac.new(secret.encode(), body, hashlib.sha256).hexdigest()
+
+
+def verify_signature(secret: str, body: bytes, signature: str) -> bool:
+    """Check a callback's signature in constant time (False without a secret)."""
+    if not secret or not signature:
+        return False
+    return hmac.compare_digest(sign(secret, body), signature.strip().lower())
+
+
+def parse_translation_event(event: dict[str, Any]) -> Optional[TranslationUpdate]:
+    """
+    Translation result carried by a callback.
+
+    Args:
+        event: Callback body, e.g. {"event_type": "video_translate.success",
+            "event_data": {"video_translate_id": ..., "url": ...}}
+
+    Returns:
+        The update, or None for events that aren't a finished translation
+    """
+    event_type = str(event.get("event_type", ""))
+    kind, _, outcome = event_type.rpartition(".")
+    status = _STATUSES.get(outcome)
+    if kind != "video_translate" or status is None:
+        return None
+
+    data = event.get("event_data") or {}
+    job_id = data.get("video_translate_id") or data.get("id")
+    callback_id = data.get("callback_id")
+    if not job_id and not callback_id:
+        return None
+    if status == "completed":
+        return TranslationUpdate(job_id, callback_id, status, output_url=data.get("url"))
+    return TranslationUpdate(
+        job_id, callback_id, status, error=data.get("msg") or data.get("message") or "Unknown error"
+    )
+
+
+def apply_translation_update(translations: dict[str, Any], update: TranslationUpdate) -> str:
+    """
+    Apply a finished job to translations.json data, in place.
+
+    Matches on the HeyGen job id, falling back to the callback id
+    ("video_id:language") we submit with each job. Only a job that is
+    still processing changes, so repeated deliveries are no-ops.
+
+    Returns:
+        "updated", "duplicate" (already finished) or "unknown_job"
+    """
+    entry = None
+    for trans in translations.values():
+        for data in trans.get("languages", {}).values():
+            if update.job_id and data.get("job_id") == update.job_id:
+                entry = data
+                break
+        if entry is not None:
+            break
+
+    if entry is None and update.callback_id and ":" in update.callback_id:
+        video_id, _, language = update.callback_id.partition(":")
+        candidate = translations.get(video_id, {}).get("languages", {}).get(language)
+        # A resubmitted pair has a newer job id; don't let the old job's callback land
+        if candidate and (not update.job_id or not candidate.get("job_id")):
+            entry = candidate
+
+    if entry is None:
+        return "unknown_job"
+    if entry.get("status") != "processing":
+        return "duplicate"
+
+    entry["status"] = update.status
+    if update.output_url:
+        entry["output_url"] = update.output_url
+    if update.error:
+        entry["error"] = update.error
+    return "updated"
@@ -0,0 +1,94 @@
+"""Tests for admission control."""
+
+import asyncio
+
+import pytest
+
+from minerva_jess.admission import (
+    ADMISSION_REJECTED,
+    AdmissionController,
+    AdmissionRejectedError,
+)
+
+
+async def _hold(controller: AdmissionController, client: str, release: asyncio.Event, log: list):
+    """Occupy a slot until `release` is set, recording the admission order."""
+    async with controller.admit(client):
+        log.append(client)
+        await release.wait()
+
+
+class TestAdmissionController:
+    """Test cases for AdmissionController."""
+
+    async def test_global_cap_queues_in_order(self):
+        """Test callers over the global cap wait and are admitted FIFO."""
+        controller = AdmissionController("t_fifo", max_concurrent=2, max_per_client=5)
+        release, log = asyncio.Event(), []
+        tasks = [asyncio.create_task(_hold(controller, c, release, log)) for c in "abcd"]
+        await asyncio.sleep(0)
+
+        assert log == ["a", "b"]
+        assert controller.stats()["queued"] == 2
+
+        release.set()
+        await asyncio.gather(*tasks)
+        assert log == ["a", "b", "c", "d"]
+        assert controller.stats()["active"] == 0
+
+    async def test_per_client_cap_lets_others_through(self):
+        """Test one busy client doesn't block another client's calls."""
+        controller = AdmissionController("t_client", max_concurrent=4, max_per_client=1)
+        release, log = asyncio.Event(), []
+        tasks = [
+            asyncio.create_task(_hold(controller, c, release, log)) for c in ("x", "x", "y")
+        ]
+        await asyncio.sleep(0)
+
+        assert log == ["x", "y"]
+        release.set()
+        await asyncio.gather(*tasks)
+        assert log == ["x", "y", "x"]
+
+    async def test_full_queue_and_deadline_reject(self):
+        """Test a full queue rejects at once and waiters give up at the deadline."""
+        controller = AdmissionController(
+            "t_reject", max_concurrent=1, max_queue=1, queue_timeout=0.05
+        )
+        release, log = asyncio.Event(), []
+        holder = asyncio.create_task(_hold(controller, "a", release, log))
+        waiter = asyncio.create_task(_hold(controller, "b", release, log))
+        await asyncio.sleep(0)
+
+        with pytest.raises(AdmissionRejectedError) as full:
+            async with controller.admit("c"):
+                pass
+        assert full.value.reason == "queue_full"
+        assert full.value.retry_after >= 1
+
+        with pytest.raises(AdmissionRejectedError) as late:
+            await waiter
+        assert late.value.reason == "timeout"
+        assert ADMISSION_REJECTED.get(endpoint="t_reject", reason="timeout") == 1
+
+        release.set()
+        await holder
+        assert controller.admitted == 1 and controller.rejected == 2
+
+    async def test_cancelled_waiter_frees_its_place(self):
+        """Test a client disconnecting while queued leaves no slot behind."""
+        controller = AdmissionController("t_cancel", max_concurrent=1)
+        release, log = asyncio.Event(), []
+        holder = asyncio.create_task(_hold(controller, "a", release, log))
+        waiter = asyncio.create_task(_hold(controller, "b", release, log))
+        await asyncio.sleep(0)
+
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        assert controller.stats()["queued"] == 0
+
+        release.set()
+        await holder
+        async with controller.admit("c"):
+            assert controller.stats()["active"] == 1
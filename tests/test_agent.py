@@ -52,6 +52,17 @@ class TestJessAgent:
         assert not agent._is_help_query("What are AI bubble risks?")
         assert not agent._is_help_query("Tell me about ASEAN markets")
 
+    def test_help_patterns_alias(self, mock_settings, mock_config):
+        """Test the deprecated HELP_PATTERNS is readable and still extends routing."""
+        assert "list videos" in JessAgent.HELP_PATTERNS
+
+        class CustomAgent(JessAgent):
+            HELP_PATTERNS = JessAgent.HELP_PATTERNS + ["show me around"]
+
+        agent = CustomAgent(mock_settings, mock_config)
+        assert agent._is_help_query("Can you show me around?")
+        assert not JessAgent(mock_settings, mock_config)._is_help_query("show me around")
+
     def test_agent_properties(self, mock_settings, mock_config):
         """Test agent name and icon properties."""
         agent = JessAgent(mock_settings, mock_config)
@@ -0,0 +1,156 @@
+"""Tests for JessAgent.query_many and JessAgentSync."""
+
+import asyncio
+import json
+import time
+from concurrent.futures import CancelledError, ThreadPoolExecutor
+from pathlib import Path
+
+import httpx
+import pytest
+
+from minerva_jess import orca_pool
+from minerva_jess.agent import JessAgent, JessAgentSync
+from minerva_jess.config import AgentConfig, Settings
+
+CONFIG = AgentConfig(config_path=Path("/nonexistent/config.yaml"))
+
+
+class SlowOrca:
+    """Orca stub that tracks concurrent requests."""
+
+    def __init__(self, delay: float = 0.01):
+        self.delay = delay
+        self.active = 0
+        self.peak = 0
+        self.searches: list[str] = []
+
+    async def handler(self, request: httpx.Request) -> httpx.Response:
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            await asyncio.sleep(self.delay)
+            body = json.loads(request.content)
+            if request.url.path == "/video/search":
+                self.searches.append(body["query"])
+                if body["query"] == "boom":
+                    return httpx.Response(500, json={"error": "index offline"})
+                return httpx.Response(200, json={"results": [
+                    {"video_id": "abc", "text": body["query"], "start_time": 5, "score": 0.9}
+                ]})
+            return httpx.Response(200, json={"answer": f"About {body['query']}"})
+        finally:
+            self.active -= 1
+
+
+def make_agent(orca: SlowOrca, url: str) -> JessAgent:
+    agent = JessAgent(Settings(orca_url=url, orca_cache_enabled=False), CONFIG)
+    agent.client._client = httpx.AsyncClient(
+        base_url=url, transport=httpx.MockTransport(orca.handler)
+    )
+    return agent
+
+
+class TestQueryMany:
+    """Test cases for batch queries."""
+
+    async def test_dedupes_and_bounds_concurrency(self):
+        """Test identical queries run once and concurrency is capped."""
+        orca = SlowOrca()
+        agent = make_agent(orca, "http://batch.test")
+        queries = [f"topic {i}" for i in range(6)] + ["@jess Topic 0", "topic  1"]
+
+        results = [r async for r in agent.query_many(queries, concurrency=2)]
+
+        assert sorted(r.index for r in results) == list(range(8))
+        assert len(orca.searches) == 6
+        assert orca.peak <= 2
+        by_index = {r.index: r for r in results}
+        assert by_index[6].duplicate and by_index[6].response.content == "About topic 0"
+        assert all(r.success and r.duration > 0 for r in results)
+
+    async def test_per_item_errors(self):
+        """Test a failing query doesn't stop the batch."""
+        orca = SlowOrca(delay=0)
+        agent = make_agent(orca, "http://batch-errors.test")
+
+        results = {r.query: r async for r in agent.query_many(["boom", "fine"])}
+
+        assert not results["boom"].success
+        assert results["fine"].success
+
+    async def test_rejects_zero_concurrency(self):
+        """Test concurrency must be positive."""
+        agent = JessAgent(Settings(orca_url="http://batch.test"), CONFIG)
+        with pytest.raises(ValueError):
+            [r async for r in agent.query_many(["a"], concurrency=0)]
+
+
+def test_sync_query_many_preserves_order():
+    """Test the sync wrapper returns results in input order."""
+    orca = SlowOrca(delay=0)
+    settings = Settings(orca_url="http://batch-sync.test", orca_cache_enabled=False)
+    sync = JessAgentSync(settings, CONFIG)
+    sync._agent.client._client = httpx.AsyncClient(
+        base_url="http://batch-sync.test", transport=httpx.MockTransport(orca.handler)
+    )
+
+    with sync:
+        results = sync.query_many(["b", "a", "b"], concurrency=3)
+
+    assert [r.query for r in results] == ["b", "a", "b"]
+    assert [r.duplicate for r in results] == [False, False, True]
+
+
+class TestJessAgentSync:
+    """Test cases for the persistent-loop sync wrapper."""
+
+    def make_sync(self, url: str) -> tuple[JessAgentSync, SlowOrca]:
+        orca = SlowOrca(delay=0.005)
+        sync = JessAgentSync(Settings(orca_url=url, orca_cache_enabled=False), CONFIG)
+        sync._agent.client._client = httpx.AsyncClient(
+            base_url=url, transport=httpx.MockTransport(orca.handler)
+        )
+        return sync, orca
+
+    def test_reuses_loop_and_pool_across_calls(self):
+        """Test every call runs on the same loop and shared pool."""
+        sync = JessAgentSync(Settings(orca_url="http://sync-pool.test"), CONFIG)
+
+        async def current():
+            return asyncio.get_running_loop(), orca_pool.get_client(sync._agent.settings)
+
+        with sync:
+            loop1, pool1 = sync._run(current())
+            loop2, pool2 = sync._run(current())
+            assert loop1 is loop2 and pool1 is pool2
+        assert loop1.is_closed() and pool1.is_closed
+
+    def test_thread_safe_concurrent_calls(self):
+        """Test concurrent callers from a thread pool all get answers."""
+        sync, orca = self.make_sync("http://sync-threads.test")
+        with sync, ThreadPoolExecutor(max_workers=8) as pool:
+            responses = list(pool.map(sync.query, [f"topic {i}" for i in range(16)]))
+        assert all(r.success for r in responses)
+        assert len(orca.searches) == 16
+
+    def test_closed_wrapper_rejects_calls(self):
+        """Test calls after close() raise instead of hanging."""
+        sync, _ = self.make_sync("http://sync-closed.test")
+        sync.query("topic")
+        sync.close()
+        sync.close()
+        with pytest.raises(RuntimeError):
+            sync.query("topic")
+
+    def test_close_cancels_waiting_callers(self):
+        """Test a call still running when close() is called fails instead of hanging."""
+        sync, orca = self.make_sync("http://sync-close-busy.test")
+        orca.delay = 30
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            pending = pool.submit(sync.query, "slow topic")
+            while not orca.active:
+                time.sleep(0.001)
+            sync.close()
+            with pytest.raises(CancelledError):
+                pending.result(timeout=5)
@@ -0,0 +1,220 @@
+"""Tests for Orca response caches."""
+
+import asyncio
+
+import httpx
+import pytest
+
+from minerva_jess.cache import StaleWhileRevalidate, TTLCache, normalize_query
+from minerva_jess.config import Settings
+from minerva_jess.orca_client import OrcaMCPClient
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestTTLCache:
+    """Test cases for TTLCache."""
+
+    def test_lru_eviction_and_ttl(self):
+        """Test entries are evicted by size and expire after the TTL."""
+        clock = FakeClock()
+        cache = TTLCache("test", maxsize=2, ttl=10, clock=clock)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")          # a is now most recently used
+        cache.set("c", 3)       # evicts b
+
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+
+        clock.now = 10
+        assert cache.get("a") is None
+        assert cache.stats()["hits"] == 2
+        assert cache.stats()["misses"] == 2
+
+    async def test_concurrent_misses_are_coalesced(self):
+        """Test identical in-flight loads share one call."""
+        cache = TTLCache("test")
+        calls = []
+
+        async def loader():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return "value"
+
+        results = await asyncio.gather(*(cache.get_or_load("k", loader) for _ in range(5)))
+
+        assert results == ["value"] * 5
+        assert len(calls) == 1
+        assert cache.stats()["coalesced"] == 4
+
+    async def test_failures_are_not_cached(self):
+        """Test a failed load is retried next time."""
+        cache = TTLCache("test")
+
+        async def failing():
+            raise ValueError("boom")
+
+        async def working():
+            return "ok"
+
+        with pytest.raises(ValueError):
+            await cache.get_or_load("k", failing)
+        assert await cache.get_or_load("k", working) == "ok"
+
+    async def test_waiter_survives_cancelled_loader(self):
+        """Test cancelling the caller that started a load doesn't fail its waiters."""
+        cache = TTLCache("test")
+        gate = asyncio.Event()
+        calls = []
+
+        async def loader():
+            calls.append(1)
+            await gate.wait()
+            return "value"
+
+        first = asyncio.create_task(cache.get_or_load("k", loader))
+        await asyncio.sleep(0)
+        second = asyncio.create_task(cache.get_or_load("k", loader))
+        await asyncio.sleep(0)
+        first.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await first
+
+        gate.set()
+        assert await second == "value"
+        assert cache.get("k") == "value"
+        assert len(calls) == 1
+
+    def test_normalize_query(self):
+        """Test cache keys ignore case and spacing."""
+        assert normalize_query("  Market   OUTLOOK ") == "market outlook"
+
+
+class TestStaleWhileRevalidate:
+    """Test cases for StaleWhileRevalidate."""
+
+    async def test_stale_value_served_while_refreshing(self):
+        """Test a stale value is returned immediately and refreshed in the background."""
+        clock = FakeClock()
+        holder = StaleWhileRevalidate("test", ttl=10, retry_after=5, clock=clock)
+        values = iter([1, 2])
+        gate = asyncio.Event()
+
+        async def loader():
+            value = next(values)
+            if value == 2:
+                await gate.wait()
+            return value
+
+        assert await holder.get(loader) == 1
+        clock.now = 11
+        assert await holder.get(loader) == 1  # stale, refresh started
+        assert await holder.get(loader) == 1  # refresh still running
+        gate.set()
+        await holder._refresh_task
+        assert await holder.get(loader) == 2
+        assert holder.refreshes == 2
+
+    async def test_failed_refresh_keeps_value(self):
+        """Test a failed refresh keeps the old value and backs off."""
+        clock = FakeClock()
+        holder = StaleWhileRevalidate("test", ttl=10, retry_after=5, clock=clock)
+        calls = []
+
+        async def loader():
+            calls.append(clock.now)
+            if len(calls) > 1:
+                raise RuntimeError("down")
+            return "good"
+
+        await holder.get(loader)
+        clock.now = 11
+        assert await holder.get(loader) == "good"
+        await holder._refresh_task
+        assert await holder.get(loader) == "good"  # within retry backoff
+        assert len(calls) == 2
+
+    async def test_reader_survives_cancelled_refresh(self):
+        """Test cancelling a forced refresh doesn't fail readers sharing it."""
+        holder = StaleWhileRevalidate("test")
+        gate = asyncio.Event()
+
+        async def loader():
+            await gate.wait()
+            return "fresh"
+
+        first = asyncio.create_task(holder.get(loader, refresh=True))
+        await asyncio.sleep(0)
+        second = asyncio.create_task(holder.get(loader))
+        await asyncio.sleep(0)
+        first.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await first
+
+        gate.set()
+        assert await second == "fresh"
+        assert holder.value == "fresh"
+
+
+class TestOrcaClientCache:
+    """Test OrcaMCPClient search caching."""
+
+    async def test_repeated_search_hits_cache(self):
+        """Test repeated searches are served from cache unless bypassed."""
+        calls = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(request.url.path)
+            return httpx.Response(200, json={"results": [
+                {"video_id": "abc", "text": "AI", "start_time": 1, "score": 0.9}
+            ]})
+
+        client = OrcaMCPClient(Settings(orca_url="http://cache.test"))
+        client._client = httpx.AsyncClient(
+            base_url="http://cache.test", transport=httpx.MockTransport(handler)
+        )
+
+        await client.search("AI bubble")
+        await client.search("ai   BUBBLE")
+        assert len(calls) == 1
+
+        await client.search("AI bubble", use_cache=False)
+        assert len(calls) == 2
+        assert client.cache_stats()["search"]["hits"] == 1
+        await client.close()
+
+    async def test_catalog_refresh_keeps_snapshot_on_empty_list(self):
+        """Test the catalog is cached and an empty refresh doesn't wipe it."""
+        responses = [
+            [{"video_id": "a"}, {"video_id": "b"}],
+            [],
+        ]
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, json={"videos": responses.pop(0)})
+
+        client = OrcaMCPClient(Settings(orca_url="http://catalog.test"))
+        client._client = httpx.AsyncClient(
+            base_url="http://catalog.test", transport=httpx.MockTransport(handler)
+        )
+
+        catalog = await client.get_catalog()
+        assert [v.video_id for v in catalog.videos] == ["a", "b"]
+        videos = await client.list_videos()
+        videos.clear()  # callers get their own list, not the snapshot's
+        assert len(await client.list_videos()) == 2
+        assert len(responses) == 1
+
+        refreshed = await client.get_catalog(refresh=True)
+        assert refreshed is catalog
+        assert client.cache_stats()["catalog"]["refreshes"] == 1
+        await client.close()
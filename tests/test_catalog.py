@@ -0,0 +1,96 @@
+"""Tests for the indexed video catalog."""
+
+import json
+from pathlib import Path
+
+import httpx
+
+from minerva_jess.agent import JessAgent
+from minerva_jess.catalog import VideoCatalog, default_cache_path, get_video_catalog
+from minerva_jess.config import VIDEO_CATALOG, AgentConfig, Settings
+
+CONFIG = AgentConfig(config_path=Path("/nonexistent/config.yaml"))
+
+
+def write_sources(tmp_path: Path) -> tuple[Path, Path]:
+    cache = tmp_path / "videos_cache.json"
+    cache.write_text(json.dumps({"videos": [
+        {"video_id": "a", "title": "Cached A", "published_at": "20240105", "view_count": 5},
+        {"video_id": "b", "title": "Cached B", "published_at": "", "view_count": 50},
+    ]}))
+    enrichment = tmp_path / "enrichment.json"
+    enrichment.write_text(json.dumps({"version": 1, "videos": {
+        "a": {"topics": ["China", "EVs"], "featured": True},
+        "b": {"title": "Curated B", "topics": ["china"], "publish_date": "2024-03-01"},
+        "c": {"title": "Only enriched", "topics": ["AI"]},
+    }}))
+    return cache, enrichment
+
+
+class TestVideoCatalog:
+    """Test cases for VideoCatalog."""
+
+    def test_merges_sources_and_indexes(self, tmp_path):
+        """Test cache and enrichment merge, with topic and ranking indexes."""
+        catalog = VideoCatalog.load(*write_sources(tmp_path))
+
+        assert len(catalog) == 3
+        assert catalog["a"]["title"] == "Cached A"
+        assert catalog["a"]["publish_date"] == "2024-01-05"
+        assert catalog["b"]["title"] == "Curated B"
+        assert catalog.ids_for_topic("CHINA") == ["a", "b"]
+        assert catalog.latest[:2] == ["b", "a"]
+        assert catalog.popular[0] == "b"
+        assert catalog.featured == ["a"]
+        assert catalog.find_topic("popular videos about china please") == "China"
+        assert catalog.find_topic("chinaware") is None
+        assert catalog.find_topic("show us videos about AI") == "AI"
+        assert catalog.find_topic("said about ai") is None
+
+    def test_missing_files_and_compat_mapping(self, tmp_path):
+        """Test a missing cache is fine and VIDEO_CATALOG still acts like a dict."""
+        catalog = VideoCatalog.load(tmp_path / "missing.json", tmp_path / "missing.json")
+        assert len(catalog) == 0 and catalog.find_topic("china") is None
+
+        assert "SKfMmH9Bk4o" in VIDEO_CATALOG
+        assert VIDEO_CATALOG["SKfMmH9Bk4o"]["featured"] is True
+        assert VIDEO_CATALOG.get("nope", {}) == {}
+
+    def test_shared_catalog_reloads_when_cache_changes(self, tmp_path):
+        """Test a rewritten videos_cache.json replaces the shared catalog."""
+        cache, _ = write_sources(tmp_path)
+        first = get_video_catalog(cache)
+        assert get_video_catalog(cache) is first
+
+        cache.write_text(json.dumps({"videos": [{"video_id": "new", "title": "Fresh"}]}))
+        assert get_video_catalog(cache)["new"]["title"] == "Fresh"
+
+    def test_default_path_follows_data_dir(self, tmp_path, monkeypatch):
+        """Test the default cache path comes from JESS_DATA_DIR, not the CWD."""
+        monkeypatch.setenv("JESS_DATA_DIR", str(tmp_path))
+        assert default_cache_path() == tmp_path / "videos_cache.json"
+
+        monkeypatch.delenv("JESS_DATA_DIR")
+        monkeypatch.chdir(tmp_path)
+        assert default_cache_path().is_absolute()
+
+
+async def test_topic_filtered_recommendations(tmp_path):
+    """Test 'videos about X' filters recommendations through the topic index."""
+    cache, _ = write_sources(tmp_path)
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={"videos": [
+            {"video_id": "SKfMmH9Bk4o"}, {"video_id": "biVXxcjM4ws"}, {"video_id": "J9izUotQ6Ls"},
+        ]})
+
+    url = "http://catalog-topics.test"
+    agent = JessAgent(Settings(orca_url=url, catalog_cache_path=str(cache)), CONFIG)
+    agent.client._client = httpx.AsyncClient(base_url=url, transport=httpx.MockTransport(handler))
+
+    response = await agent.query("popular videos about China")
+    assert response.content.startswith("Here are the most popular videos about China:")
+    assert "AI bubble" not in response.content
+    assert response.video_info["video_id"] == "biVXxcjM4ws"
+
+    assert not agent._is_help_query("videos about quantum gravity")
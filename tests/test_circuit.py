@@ -0,0 +1,102 @@
+"""Tests for Orca circuit breakers."""
+
+import httpx
+import pytest
+
+from minerva_jess.circuit import CircuitBreaker, CircuitState
+from minerva_jess.config import Settings
+from minerva_jess.models import VideoSegment
+from minerva_jess.orca_client import OrcaMCPClient, OrcaUnavailableError
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestCircuitBreaker:
+    """Test cases for CircuitBreaker state transitions."""
+
+    def test_opens_on_error_rate_and_recovers(self):
+        """Test closed -> open -> half-open -> closed."""
+        clock = FakeClock()
+        breaker = CircuitBreaker("test", min_calls=4, open_seconds=10, clock=clock)
+        transitions = []
+        breaker.add_listener(lambda name, old, new: transitions.append(new))
+
+        for _ in range(2):
+            breaker.record_success()
+        for _ in range(2):
+            breaker.record_failure()
+
+        assert breaker.state == CircuitState.OPEN
+        assert not breaker.allow()
+
+        clock.now = 10
+        assert breaker.allow()          # single probe
+        assert not breaker.allow()      # second probe rejected
+        breaker.record_success()
+
+        assert breaker.state == CircuitState.CLOSED
+        assert transitions == [CircuitState.OPEN, CircuitState.HALF_OPEN, CircuitState.CLOSED]
+
+    def test_failed_probe_reopens(self):
+        """Test a failing half-open probe opens the circuit again."""
+        clock = FakeClock()
+        breaker = CircuitBreaker("test", min_calls=1, open_seconds=5, clock=clock)
+        breaker.record_failure()
+
+        clock.now = 5
+        assert breaker.allow()
+        breaker.record_failure()
+
+        assert breaker.state == CircuitState.OPEN
+
+    def test_slow_calls_open_circuit(self):
+        """Test the latency threshold trips the breaker."""
+        breaker = CircuitBreaker("test", min_calls=3, slow_call_seconds=1.0, slow_call_rate=0.6)
+        for _ in range(3):
+            breaker.record_success(duration=2.0)
+
+        assert breaker.state == CircuitState.OPEN
+
+
+class TestOrcaClientCircuit:
+    """Test OrcaMCPClient fails fast while a circuit is open."""
+
+    async def test_fail_fast_and_fallback(self):
+        """Test search raises and synthesis falls back without calling Orca."""
+        calls = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(request.url.path)
+            return httpx.Response(503, json={"error": "down"})
+
+        settings = Settings(orca_url="http://circuit.test", orca_circuit_min_calls=2)
+        client = OrcaMCPClient(settings)
+        client._client = httpx.AsyncClient(
+            base_url="http://circuit.test", transport=httpx.MockTransport(handler)
+        )
+        segment = VideoSegment.from_search_result(
+            {"video_id": "abc", "text": "AI", "start_time": 5}
+        )
+
+        for _ in range(2):
+            await client.synthesize("AI", [segment])
+        calls.clear()
+
+        answer = await client.synthesize("AI", [segment])
+        assert answer.startswith("Found 1 relevant segment")
+        assert calls == []
+
+        for _ in range(2):
+            with pytest.raises(Exception):
+                await client.search("AI")
+        with pytest.raises(OrcaUnavailableError):
+            await client.search("AI")
+        await client.close()
@@ -0,0 +1,54 @@
+"""Tests for the JSON codec layer."""
+
+from datetime import datetime
+
+import pytest
+
+from minerva_jess import codec
+
+
+@pytest.fixture(params=codec.available())
+def backend(request):
+    """Each installed backend in turn, restoring the default afterwards."""
+    yield codec.use(request.param)
+    codec.use()
+
+
+class TestCodec:
+    """Test cases for the codec backends."""
+
+    def test_round_trip(self, backend):
+        """Test every backend agrees on encoding and decoding."""
+        data = {"title": "Marchés émergents", "n": 3, "score": 0.5, "ok": True, "tags": [None]}
+
+        encoded = codec.dumps(data)
+        assert isinstance(encoded, bytes) and b"\n" not in encoded
+        assert codec.loads(encoded) == data
+        assert codec.loads(encoded.decode()) == data
+        assert codec.loads(codec.dumps(data, indent=True)) == data
+
+    def test_unknown_types_and_bad_input(self, backend):
+        """Test unknown objects fall back to str() and bad JSON raises ValueError."""
+        assert codec.loads(codec.dumps({"at": datetime(2024, 1, 2)}))["at"].startswith("2024-01-02")
+        with pytest.raises(ValueError):
+            codec.loads(b"{not json")
+
+    def test_files_are_compact(self, tmp_path):
+        """Test data files are written without indentation."""
+        path = tmp_path / "data.json"
+        codec.write_file(path, {"videos": [{"id": 1}]})
+
+        assert path.read_bytes() == b'{"videos":[{"id":1}]}'
+        assert codec.read_file(path) == {"videos": [{"id": 1}]}
+
+    def test_missing_backend_falls_back_to_stdlib(self):
+        """Test selecting a backend that isn't installed uses the stdlib."""
+        def missing() -> codec.Codec:
+            raise ImportError("not installed")
+
+        codec.register_codec("missing", missing)
+        try:
+            assert codec.use("missing").name == "json"
+        finally:
+            del codec.CODECS["missing"]
+            codec.use()
@@ -0,0 +1,181 @@
+"""Tests for the shared on-disk Orca cache."""
+
+import hashlib
+import sqlite3
+
+import httpx
+
+from minerva_jess import disk_cache
+from minerva_jess.cache import normalize_query
+from minerva_jess.config import Settings
+from minerva_jess.disk_cache import DiskCache, make_key
+from minerva_jess.orca_client import OrcaMCPClient
+
+
+class FakeClock:
+    """Manually advanced wall clock."""
+
+    def __init__(self):
+        self.now = 1_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestDiskCache:
+    """Test cases for DiskCache."""
+
+    def test_get_set_and_ttl(self, tmp_path):
+        """Test entries are namespaced and expire after their TTL."""
+        clock = FakeClock()
+        cache = DiskCache(tmp_path / "cache.sqlite3", sweep_interval=0, clock=clock)
+
+        cache.set("orca:search", "k", b"value", ttl=10)
+        assert cache.get("orca:search", "k") == b"value"
+        assert cache.get("orca:synthesis", "k") is None
+
+        clock.now += 11
+        assert cache.get("orca:search", "k") is None
+        assert cache.sweep() == {"expired": 1, "lru": 0}
+        assert cache.stats()["entries"] == 0
+        assert cache.stats()["hits"] == 1
+        cache.close()
+
+    def test_sweep_evicts_least_recently_used(self, tmp_path):
+        """Test the sweeper trims the file to max_bytes, oldest access first."""
+        clock = FakeClock()
+        cache = DiskCache(tmp_path / "cache.sqlite3", max_bytes=250, sweep_interval=0, clock=clock)
+
+        for key in ("a", "b", "c"):
+            cache.set("ns", key, b"x" * 100, ttl=60)
+            clock.now += 1
+        cache.get("ns", "a")  # "b" is now the least recently used
+
+        assert cache.sweep() == {"expired": 0, "lru": 1}
+        assert cache.get("ns", "b") is None
+        assert cache.get("ns", "a") == cache.get("ns", "c") == b"x" * 100
+        cache.close()
+
+    def test_schema_version_mismatch_wipes_entries(self, tmp_path):
+        """Test a cache written by another schema version starts empty."""
+        path = tmp_path / "cache.sqlite3"
+        cache = DiskCache(path, sweep_interval=0)
+        cache.set("ns", "k", b"old", ttl=60)
+        cache.close()
+
+        conn = sqlite3.connect(path)
+        conn.execute("UPDATE meta SET value = '0' WHERE key = 'schema_version'")
+        conn.commit()
+        conn.close()
+
+        reopened = DiskCache(path, sweep_interval=0)
+        assert reopened.get("ns", "k") is None
+        reopened.close()
+
+    def test_processes_share_the_file(self, tmp_path):
+        """Test a second cache on the same file sees the first one's writes."""
+        path = tmp_path / "cache.sqlite3"
+        writer, reader = DiskCache(path, sweep_interval=0), DiskCache(path, sweep_interval=0)
+
+        writer.set("ns", make_key(("ai bubble", 10)), b"payload", ttl=60)
+        assert reader.get("ns", make_key(["ai bubble", 10])) == b"payload"
+        writer.close()
+        reader.close()
+
+    def test_hit_survives_locked_database(self, tmp_path):
+        """Test a hit is served even when the access-time update can't get the write lock."""
+        path = tmp_path / "cache.sqlite3"
+        cache = DiskCache(path, sweep_interval=0)
+        cache.set("ns", "k", b"value", ttl=60)
+        cache._connect().execute("PRAGMA busy_timeout = 0")
+
+        writer = sqlite3.connect(path, isolation_level=None)
+        writer.execute("BEGIN IMMEDIATE")
+        try:
+            assert cache.get("ns", "k") == b"value"
+            assert cache.stats()["errors"] == 0
+        finally:
+            writer.rollback()
+            writer.close()
+        cache.close()
+
+    def test_key_ignores_codec_backend(self):
+        """Test keys come from one fixed serializer, escaping non-ASCII."""
+        expected = hashlib.sha256(b'["caf\\u00e9",1]').hexdigest()
+        assert make_key(("café", 1)) == expected
+
+
+class TestOrcaClientDiskCache:
+    """Test OrcaMCPClient reads through the disk cache."""
+
+    async def test_second_worker_is_served_from_disk(self, tmp_path):
+        """Test a cold in-memory cache is filled from disk instead of Orca."""
+        calls = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(request.url.path)
+            if request.url.path == "/video/search":
+                return httpx.Response(200, json={"results": [
+                    {"video_id": "abc", "title": "AI", "text": "AI", "start_time": 1, "score": 0.9}
+                ]})
+            if request.url.path == "/video/transcript/abc":
+                return httpx.Response(200, json={"video_id": "abc", "transcript": "hello"})
+            return httpx.Response(404)
+
+        url = "http://disk-cache.test"
+        settings = Settings(
+            orca_url=url,
+            orca_disk_cache_path=str(tmp_path / "orca.sqlite3"),
+            orca_disk_cache_sweep_seconds=0,
+        )
+        client = OrcaMCPClient(settings)
+        client._client = httpx.AsyncClient(base_url=url, transport=httpx.MockTransport(handler))
+
+        first = await client.search("AI bubble")
+        assert await client.get_transcript("abc") == {"video_id": "abc", "transcript": "hello"}
+        assert await client.get_transcript("missing") is None
+        assert len(calls) == 3
+
+        # Another worker: same disk file, empty in-memory cache
+        client._cache("search").clear()
+        second = await client.search("ai  bubble")
+        assert [s.model_dump() for s in second] == [s.model_dump() for s in first]
+        assert await client.get_transcript("abc") == {"video_id": "abc", "transcript": "hello"}
+        assert await client.get_transcript("missing") is None
+        assert calls == [
+            "/video/search", "/video/transcript/abc", "/video/transcript/missing",
+            "/video/transcript/missing",
+        ]
+        assert client.cache_stats()["disk"]["hits"] == 2
+
+        disk_cache.get_disk_cache(settings).close()
+        await client.close()
+
+    async def test_unreadable_stream_entry_is_a_miss(self, tmp_path):
+        """Test a corrupt synthesis entry falls through to a live streamed answer."""
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.path == "/video/search":
+                return httpx.Response(200, json={"results": [
+                    {"video_id": "abc", "title": "AI", "text": "AI", "start_time": 1, "score": 0.9}
+                ]})
+            return httpx.Response(200, json={"answer": "AI is big."})
+
+        url = "http://disk-cache-corrupt.test"
+        settings = Settings(
+            orca_url=url,
+            orca_disk_cache_path=str(tmp_path / "orca.sqlite3"),
+            orca_disk_cache_sweep_seconds=0,
+        )
+        client = OrcaMCPClient(settings)
+        client._client = httpx.AsyncClient(base_url=url, transport=httpx.MockTransport(handler))
+        segments = await client.search("AI outlook")
+        key = (normalize_query("AI outlook"), client._segments_key(segments), "professional")
+        disk_cache.get_disk_cache(settings).set(
+            disk_cache.namespace(settings, "synthesis"), make_key(key), b"\x00not json", ttl=60
+        )
+
+        chunks = [chunk async for chunk in client.synthesize_stream("AI outlook", segments)]
+        assert "".join(chunks) == "AI is big."
+
+        disk_cache.get_disk_cache(settings).close()
+        await client.close()
@@ -0,0 +1,108 @@
+"""Tests for Orca request hedging."""
+
+import asyncio
+
+from minerva_jess.hedging import HEDGES, Hedger
+
+
+def make_hedger(**kwargs) -> Hedger:
+    """Hedger primed with fast latencies and budget for a hedge."""
+    hedger = Hedger("test", min_samples=5, min_delay=0.01, **kwargs)
+    for _ in range(5):
+        hedger.latencies.record(0.01)
+    hedger.budget._tokens = 5.0
+    return hedger
+
+
+class TestHedger:
+    """Test cases for Hedger."""
+
+    async def test_no_hedge_without_history(self):
+        """Test requests run once until latency history exists."""
+        hedger = Hedger("test", min_samples=5)
+        calls = []
+
+        async def attempt():
+            calls.append(1)
+            return "ok"
+
+        assert await hedger.run(attempt) == "ok"
+        assert len(calls) == 1
+
+    async def test_slow_primary_is_hedged(self):
+        """Test a slow first attempt loses to a fast hedge."""
+        hedger = make_hedger()
+        delays = [1.0, 0.0]
+
+        async def attempt():
+            delay = delays.pop(0)
+            await asyncio.sleep(delay)
+            return delay
+
+        before = HEDGES.get(operation="test", outcome="won")
+        assert await hedger.run(attempt) == 0.0
+        assert HEDGES.get(operation="test", outcome="won") == before + 1
+
+    async def test_failed_attempt_falls_back_to_other(self):
+        """Test an error from one attempt doesn't hide the other's success."""
+        hedger = make_hedger()
+        plan = ["slow", "fail"]
+
+        async def attempt():
+            step = plan.pop(0)
+            if step == "fail":
+                raise ConnectionError("boom")
+            await asyncio.sleep(0.05)
+            return "primary"
+
+        assert await hedger.run(attempt) == "primary"
+
+    async def test_failed_result_falls_back_to_other(self):
+        """Test a result marked failed (like a 5xx) loses to the other attempt."""
+        hedger = make_hedger()
+        plan = [(0.05, 200), (0.0, 503)]
+
+        async def attempt():
+            delay, status = plan.pop(0)
+            await asyncio.sleep(delay)
+            return status
+
+        assert await hedger.run(attempt, failed=lambda status: status >= 500) == 200
+
+    async def test_failed_result_is_returned_when_both_fail(self):
+        """Test the caller still gets a failed result to inspect if nothing succeeds."""
+        hedger = Hedger("test", min_samples=5)
+
+        async def attempt():
+            return 503
+
+        assert await hedger.run(attempt, failed=lambda status: status >= 500) == 503
+        assert len(hedger.latencies._samples) == 0
+
+    async def test_cancelled_slow_attempt_is_recorded(self):
+        """Test a primary cancelled after losing still counts its elapsed time."""
+        hedger = make_hedger()
+        delays = [1.0, 0.0]
+
+        async def attempt():
+            await asyncio.sleep(delays.pop(0))
+            return "ok"
+
+        assert await hedger.run(attempt) == "ok"
+        await asyncio.sleep(0)  # let the cancelled primary unwind
+        assert max(hedger.latencies._samples) >= 0.01
+        assert len(hedger.latencies._samples) == 7
+
+    async def test_budget_limits_hedges(self):
+        """Test no hedge fires when the budget is exhausted."""
+        hedger = make_hedger(budget=0.0)
+        hedger.budget._tokens = 0.0
+        calls = []
+
+        async def attempt():
+            calls.append(1)
+            await asyncio.sleep(0.03)
+            return "ok"
+
+        assert await hedger.run(attempt) == "ok"
+        assert len(calls) == 1
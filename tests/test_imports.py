@@ -0,0 +1,49 @@
+"""Tests for lazy package imports."""
+
+import subprocess
+import sys
+
+import pytest
+
+import minerva_jess
+
+
+def loaded_after(statement: str, *modules: str) -> list[str]:
+    """Which of `modules` a fresh interpreter has loaded after `statement`."""
+    code = f"import sys\n{statement}\nprint(' '.join(m for m in {modules!r} if m in sys.modules))"
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    return out.stdout.split()
+
+
+class TestLazyImports:
+    """Test cases for minerva_jess lazy attribute loading."""
+
+    def test_bare_import_is_light(self):
+        """Test importing the package loads no heavy dependencies."""
+        assert loaded_after(
+            "import minerva_jess", "pydantic", "pydantic_settings", "httpx", "yaml"
+        ) == []
+
+    def test_agent_defers_http_client(self):
+        """Test httpx loads only when the agent's Orca client is created."""
+        assert loaded_after("from minerva_jess import JessAgent", "httpx", "yaml") == []
+        assert loaded_after(
+            "from minerva_jess import JessAgent, Settings\n"
+            "JessAgent(Settings()).client",
+            "httpx",
+        ) == ["httpx"]
+
+    def test_lazy_attributes(self):
+        """Test public names resolve and unknown names raise AttributeError."""
+        from minerva_jess import JessAgent, metrics
+        from minerva_jess.agent import JessAgent as Direct
+
+        assert JessAgent is Direct
+        assert "JessAgent" in dir(minerva_jess)
+        assert metrics.render is not None
+        with pytest.raises(AttributeError):
+            minerva_jess.NotAThing
+
+    def test_all_matches_lazy_attributes(self):
+        """Test __all__ lists exactly the lazily exported names."""
+        assert sorted(minerva_jess.__all__) == sorted(minerva_jess._LAZY_ATTRS)
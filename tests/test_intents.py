@@ -0,0 +1,65 @@
+"""Tests for the compiled intent router."""
+
+from minerva_jess.intents import DEFAULT_INTENTS, IntentRouter
+
+
+class FakeConfig:
+    """AgentConfig stand-in with extra intents."""
+
+    intents = {
+        "recommend_popular": {"phrases": ["crowd favourites"]},
+        "recommend_webinars": {
+            "priority": 5,
+            "params": {"sort": "latest", "format": "webinar"},
+            "phrases": ["Webinars"],
+        },
+    }
+
+
+class TestIntentRouter:
+    """Test cases for IntentRouter."""
+
+    def test_routes_with_params_and_priority(self):
+        """Test the highest-priority intent wins and carries its params."""
+        router = IntentRouter.from_config()
+
+        match = router.route("help me find the most popular videos")
+        assert match.intent == "recommend_popular"
+        assert match.params == {"sort": "popular"}
+        assert match.phrase == "popular"
+
+        assert router.route("What videos do you have?").params["sort"] == "default"
+        assert router.route("recommendations please").intent == "recommend"
+        assert router.route("What are AI bubble risks?") is None
+
+    def test_word_start_and_non_english(self):
+        """Test phrases match at word starts, and CJK phrases anywhere."""
+        router = IntentRouter.from_config()
+
+        assert router.route("White House aides said") is None
+        assert router.route("unhelpful tariffs") is None
+        assert router.route("¿Cuáles son los vídeos más vistos?").params["sort"] == "popular"
+        assert router.route("Zeige mir die neueste Folge").params["sort"] == "latest"
+        assert router.route("一番人気の動画は?").params["sort"] == "popular"
+        assert router.route("सबसे लोकप्रिय वीडियो").params["sort"] == "popular"
+
+    def test_config_extends_defaults(self):
+        """Test config phrases and intents are added to the defaults."""
+        router = IntentRouter.from_config(FakeConfig())
+
+        assert router.route("show me crowd favourites").intent == "recommend_popular"
+        match = router.route("any new webinars?")
+        assert match.intent == "recommend_webinars"
+        assert match.params == {"sort": "latest", "format": "webinar"}
+        assert router.route("most popular").intent == "recommend_popular"
+
+    def test_large_phrase_sets(self):
+        """Test thousands of phrases compile and still route correctly."""
+        intents = {name: dict(spec) for name, spec in DEFAULT_INTENTS.items()}
+        intents["topics"] = {"phrases": [f"topic number {i}" for i in range(5000)]}
+        router = IntentRouter(intents)
+
+        assert len(router) > 5000
+        assert router.route("tell me about topic number 4321").intent == "topics"
+        assert router.route("latest topic number 12").intent == "recommend_latest"
+        assert router.route("topic numb") is None
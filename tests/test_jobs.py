@@ -0,0 +1,138 @@
+"""Tests for the persistent job scheduler."""
+
+from minerva_jess.jobs import DONE, FAILED, QUEUED, JobScheduler, Outcome
+from minerva_jess.state import JsonStore
+
+
+class FakeClock:
+    """Manually advanced wall clock."""
+
+    def __init__(self):
+        self.now = 1_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def make_scheduler(tmp_path, run, **kwargs) -> tuple[JobScheduler, FakeClock]:
+    clock = FakeClock()
+    scheduler = JobScheduler(JsonStore(tmp_path / "jobs.json"), run=run, clock=clock, **kwargs)
+    return scheduler, clock
+
+
+class TestJobScheduler:
+    """Test cases for JobScheduler."""
+
+    def test_priority_order_and_capacity(self, tmp_path):
+        """Test higher priorities run first, within the in-flight limit."""
+        ran = []
+        upstream = {"running": 1}
+
+        def run(payload):
+            ran.append(payload["name"])
+            return Outcome(ok=True, result={"id": payload["name"]})
+
+        scheduler, _ = make_scheduler(
+            tmp_path, run, max_in_flight=3, in_flight=lambda: upstream["running"]
+        )
+        scheduler.enqueue([{"key": "low", "name": "low"}], priority=0)
+        batch = scheduler.enqueue(
+            [{"key": "high", "name": "high"}, {"key": "urgent", "name": "urgent", "priority": 9}],
+            priority=5,
+        )
+
+        scheduler.run_once()
+        assert ran == ["urgent", "high"]
+
+        upstream["running"] = 2
+        scheduler.run_once()
+        assert ran == ["urgent", "high", "low"]
+
+        progress = scheduler.progress(batch["batch_id"])
+        assert progress["counts"][DONE] == 2
+        assert {job["key"]: job["result"] for job in progress["jobs"]} == {
+            "high": {"id": "high"}, "urgent": {"id": "urgent"},
+        }
+
+    def test_skips_queued_and_rejected_pairs(self, tmp_path):
+        """Test queued keys, duplicates and skip() rejections aren't queued again."""
+        scheduler, _ = make_scheduler(tmp_path, lambda payload: Outcome(ok=True))
+        scheduler.enqueue([{"key": "a"}])
+
+        batch = scheduler.enqueue(
+            [{"key": "a"}, {"key": "b"}, {"key": "b"}, {"key": "done"}],
+            skip=lambda item: "completed" if item["key"] == "done" else None,
+        )
+        assert batch["queued"] == ["b"]
+        assert sorted((s["key"], s["reason"]) for s in batch["skipped"]) == [
+            ("a", QUEUED), ("b", QUEUED), ("done", "completed"),
+        ]
+
+    def test_retries_with_backoff_then_fails(self, tmp_path):
+        """Test retryable errors back off (honouring Retry-After) up to max_attempts."""
+        outcomes = [
+            Outcome(ok=False, error="429", retryable=True, retry_after=120),
+            Outcome(ok=False, error="502", retryable=True),
+            Outcome(ok=False, error="503", retryable=True),
+        ]
+        scheduler, clock = make_scheduler(
+            tmp_path, lambda payload: outcomes.pop(0), max_attempts=3, backoff_base=10
+        )
+        scheduler.enqueue([{"key": "a"}])
+
+        [job] = scheduler.run_once()
+        assert job["state"] == QUEUED and job["next_attempt_at"] == clock.now + 120
+
+        clock.now += 60
+        assert scheduler.run_once() == []  # Still backing off
+        clock.now += 60
+        [job] = scheduler.run_once()
+        assert job["state"] == QUEUED
+        assert clock.now + 5 <= job["next_attempt_at"] <= clock.now + 20
+
+        clock.now += 20
+        [job] = scheduler.run_once()
+        assert job["state"] == FAILED and job["attempts"] == 3 and job["error"] == "503"
+
+    def test_quota_and_expired_lease(self, tmp_path):
+        """Test the start quota holds per window and abandoned claims are retaken."""
+        scheduler, clock = make_scheduler(
+            tmp_path, lambda payload: Outcome(ok=True), quota=1, quota_window=3600, lease=60
+        )
+        scheduler.enqueue([{"key": "a"}, {"key": "b"}])
+
+        # A worker claims "a" and dies before finishing
+        claimed, _ = scheduler.store.update(scheduler._claim)
+        assert [job["key"] for job in claimed] == ["a"]
+        assert scheduler.run_once() == []
+
+        clock.now += 3600
+        [job] = scheduler.run_once()
+        assert job["key"] == "a" and job["state"] == DONE and job["attempts"] == 2
+        assert scheduler.progress()["counts"] == {QUEUED: 1, "running": 0, DONE: 1, FAILED: 0}
+
+    def test_idle_ticks_skip_writes_and_old_jobs_expire(self, tmp_path):
+        """Test a tick with nothing to do leaves the file alone and finished jobs expire."""
+        upstream = {"running": 3}
+        scheduler, clock = make_scheduler(
+            tmp_path, lambda payload: Outcome(ok=True), max_in_flight=3,
+            in_flight=lambda: upstream["running"], retention=3600,
+        )
+        batch = scheduler.enqueue([{"key": "a"}])
+        version = scheduler.store.version()
+
+        clock.now += 10
+        assert scheduler.run_once() == []  # No room upstream
+        assert scheduler.store.version() == version
+
+        upstream["running"] = 0
+        [job] = scheduler.run_once()
+        assert job["state"] == DONE
+        version = scheduler.store.version()
+        scheduler.run_once()
+        assert scheduler.store.version() == version
+
+        clock.now += 3601
+        scheduler.run_once()
+        assert scheduler.progress(batch["batch_id"]) is None
+        assert scheduler.store.read() == {"jobs": {}, "batches": {}}
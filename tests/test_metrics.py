@@ -0,0 +1,76 @@
+"""Tests for the shared metrics registry."""
+
+import httpx
+import pytest
+
+from minerva_jess import metrics
+from minerva_jess.config import Settings
+from minerva_jess.orca_client import OrcaClientError, OrcaMCPClient
+
+
+class TestRegistry:
+    """Test cases for metric types and rendering."""
+
+    def test_counter_and_gauge_render(self):
+        """Test counters and gauges render with labels."""
+        registry = metrics.Registry()
+        counter = registry.counter("test_total", "A counter.", ("route",))
+        gauge = registry.gauge("test_in_flight", "A gauge.")
+
+        counter.inc(route="/a")
+        counter.inc(2, route="/a")
+        gauge.inc()
+        gauge.dec()
+
+        text = registry.render()
+        assert "# TYPE test_total counter" in text
+        assert 'test_total{route="/a"} 3' in text
+        assert "test_in_flight 0" in text
+
+    def test_histogram_buckets_are_cumulative(self):
+        """Test histogram bucket counts accumulate."""
+        registry = metrics.Registry()
+        hist = registry.histogram("test_seconds", "A histogram.", buckets=(0.1, 1.0))
+
+        hist.observe(0.05)
+        hist.observe(0.5)
+        hist.observe(5.0)
+
+        text = registry.render()
+        assert 'test_seconds_bucket{le="0.1"} 1' in text
+        assert 'test_seconds_bucket{le="1.0"} 2' in text
+        assert 'test_seconds_bucket{le="+Inf"} 3' in text
+        assert "test_seconds_count 3" in text
+        assert hist.count() == 3
+
+    def test_redefining_metric_with_other_type_fails(self):
+        """Test a name can't be reused for a different metric type."""
+        registry = metrics.Registry()
+        registry.counter("dup", "A counter.")
+
+        with pytest.raises(ValueError):
+            registry.gauge("dup", "A gauge.")
+
+
+class TestOrcaInstrumentation:
+    """Test that the Orca client records upstream metrics."""
+
+    async def test_search_records_latency_and_errors(self):
+        """Test search latency and failures are recorded."""
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(503, json={"error": "down"})
+
+        client = OrcaMCPClient(Settings(orca_url="http://orca.test"))
+        client._client = httpx.AsyncClient(
+            base_url="http://orca.test", transport=httpx.MockTransport(handler)
+        )
+        before = metrics.UPSTREAM_LATENCY.count(upstream="orca", operation="search")
+
+        with pytest.raises(OrcaClientError):
+            await client.search("AI bubble")
+
+        assert metrics.UPSTREAM_LATENCY.count(upstream="orca", operation="search") == before + 1
+        assert metrics.UPSTREAM_ERRORS.get(
+            upstream="orca", operation="search", reason="http_503"
+        ) >= 1
+        await client.close()
@@ -0,0 +1,38 @@
+"""Tests for the shared Orca connection pool."""
+
+from minerva_jess import orca_pool
+from minerva_jess.config import Settings
+from minerva_jess.orca_client import OrcaMCPClient
+
+
+class TestOrcaPool:
+    """Test cases for the shared client registry."""
+
+    async def test_clients_share_pool_per_url_and_token(self):
+        """Test agents with the same Orca URL/token reuse one HTTP client."""
+        settings = Settings(orca_url="http://orca.test", orca_token="a")
+        first = OrcaMCPClient(settings)._get_client()
+        second = OrcaMCPClient(Settings(orca_url="http://orca.test", orca_token="a"))._get_client()
+        other = OrcaMCPClient(Settings(orca_url="http://orca.test", orca_token="b"))._get_client()
+
+        assert first is second
+        assert first is not other
+        await orca_pool.shutdown()
+        assert first.is_closed
+
+    async def test_private_client_when_sharing_disabled(self):
+        """Test orca_shared_pool=False gives each client its own pool."""
+        settings = Settings(orca_url="http://orca.test", orca_shared_pool=False)
+        client = OrcaMCPClient(settings)
+
+        assert client._get_client() is not orca_pool.get_client(settings)
+        await client.close()
+        await orca_pool.shutdown()
+
+    def test_operation_timeouts(self):
+        """Test per-operation timeouts come from settings."""
+        settings = Settings(orca_search_timeout=3.0, orca_synthesize_timeout=45.0)
+
+        assert orca_pool.operation_timeout(settings, "search").read == 3.0
+        assert orca_pool.operation_timeout(settings, "synthesize").read == 45.0
+        assert orca_pool.operation_timeout(settings, "search").connect == 5.0
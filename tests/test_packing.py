@@ -0,0 +1,72 @@
+"""Tests for token-budget segment packing."""
+
+from minerva_jess.models import VideoSegment
+from minerva_jess.packing import (
+    SEGMENT_OVERHEAD_TOKENS,
+    estimate_tokens,
+    merge_segments,
+    pack_segments,
+    segment_tokens,
+)
+
+
+def seg(video_id: str, start: float, end: float, text: str, relevance: float) -> VideoSegment:
+    return VideoSegment.from_search_result({
+        "video_id": video_id,
+        "start_time": start,
+        "end_time": end,
+        "text": text,
+        "score": relevance,
+    })
+
+
+class TestPacking:
+    """Test cases for packing.py."""
+
+    def test_estimate_tokens(self):
+        """Test the rough four-characters-per-token estimate."""
+        assert estimate_tokens("") == 0
+        assert estimate_tokens("abcd" * 10) == 10
+        assert estimate_tokens("abcde") == 2
+
+    def test_merges_adjacent_and_overlapping(self):
+        """Test same-video neighbours merge and distant or other-video ones don't."""
+        merged = merge_segments([
+            seg("a", 10, 20, "second", 0.5),
+            seg("a", 0, 11, "first", 0.9),
+            seg("a", 21, 30, "third", 0.2),
+            seg("a", 100, 110, "far", 0.7),
+            seg("b", 20, 25, "other", 0.4),
+        ], gap=2.0)
+
+        a_segments = [s for s in merged if s.video_id == "a"]
+        assert len(a_segments) == 2
+        first = a_segments[0]
+        assert (first.start_time, first.end_time) == (0, 30)
+        assert first.full_text == "first second third"
+        assert first.relevance == 0.9
+        assert first.timestamp == "0:00"
+        assert len(merged) == 3
+
+    def test_respects_budget_floor_and_order(self):
+        """Test low scores are dropped and packing stays within budget."""
+        segments = [
+            seg("a", 0, 10, "x" * 400, 0.9),   # 124 tokens with overhead
+            seg("b", 0, 10, "y" * 2000, 0.8),  # too big, truncated to fit
+            seg("c", 0, 10, "z" * 40, 0.7),
+            seg("d", 0, 10, "w" * 40, 0.05),   # below floor
+        ]
+
+        packed = pack_segments(segments, budget=300, min_relevance=0.1)
+
+        assert [s.video_id for s in packed] == ["a", "b"]
+        assert sum(segment_tokens(s) for s in packed) <= 300
+
+        small = pack_segments(segments, budget=150, min_relevance=0.1)
+        assert [s.video_id for s in small] == ["a"]
+        assert segment_tokens(small[0]) == 100 + SEGMENT_OVERHEAD_TOKENS
+
+    def test_max_segments(self):
+        """Test the segment cap applies after merging."""
+        segments = [seg(f"v{i}", 0, 5, "text", 1 - i / 10) for i in range(8)]
+        assert len(pack_segments(segments, budget=10_000, max_segments=5)) == 5
@@ -0,0 +1,51 @@
+"""Tests for the on-demand profiler."""
+
+from minerva_jess.profiling import Profiler, profiled
+
+
+class TestProfiler:
+    """Test cases for Profiler."""
+
+    def test_disabled_by_default(self):
+        """Test nothing is profiled without a sample rate or force."""
+        profiler = Profiler()
+
+        with profiler.profile("idle") as active:
+            assert active is None
+
+        assert profiler.list() == []
+
+    def test_ring_buffer_is_bounded(self):
+        """Test only the newest profiles are kept."""
+        profiler = Profiler(max_profiles=2)
+
+        for i in range(3):
+            with profiler.profile(f"call-{i}", force=True):
+                sum(range(100))
+
+        names = [r.name for r in profiler.list()]
+        assert names == ["call-2", "call-1"]
+        assert "function calls" in profiler.list()[0].summary()
+
+    def test_nested_profiles_are_skipped(self):
+        """Test only one profile runs at a time."""
+        profiler = Profiler()
+
+        with profiler.profile("outer", force=True) as outer:
+            with profiler.profile("inner", force=True) as inner:
+                assert outer is not None
+                assert inner is None
+
+        assert [r.name for r in profiler.list()] == ["outer"]
+
+    async def test_decorator_force_flag(self):
+        """Test _profile=True forces a single call to be profiled."""
+        profiler = Profiler()
+
+        @profiled("double", profiler=profiler)
+        async def double(x: int) -> int:
+            return x * 2
+
+        assert await double(2) == 4
+        assert await double(3, _profile=True) == 6
+        assert [r.name for r in profiler.list()] == ["double"]
@@ -0,0 +1,46 @@
+"""Tests for the compact search result table."""
+
+from minerva_jess.config import VIDEO_CATALOG
+from minerva_jess.models import VideoSegment
+from minerva_jess.segments import SegmentTable
+
+CATALOG_ID = next(iter(VIDEO_CATALOG))
+
+RESULTS = [
+    {"video_id": CATALOG_ID, "title": "", "text": "x" * 500, "start_time": 125, "end_time": 140,
+     "score": 0.9},
+    {"video_id": "abc", "text": "short", "start": 3.5, "relevance": 0.4},
+    {"video_id": "def", "title": "Custom", "text": "", "start_time": 0},
+]
+
+
+class TestSegmentTable:
+    """Test cases for SegmentTable."""
+
+    def test_rows_match_from_search_result(self):
+        """Test materialized rows equal the validated pydantic path."""
+        table = SegmentTable.from_results(RESULTS)
+        expected = [VideoSegment.from_search_result(item) for item in RESULTS]
+
+        assert len(table) == 3
+        assert [s.model_dump() for s in table.to_segments()] == [
+            s.model_dump() for s in expected
+        ]
+
+    def test_null_title(self):
+        """Test a null title gets the placeholder instead of breaking the str field."""
+        table = SegmentTable.from_results([{"video_id": "abc", "title": None, "text": "hi"}])
+
+        assert table.titles == ["Video abc"]
+        assert table.segment(0).title == "Video abc"
+
+    def test_lazy_fields_and_catalog_titles(self):
+        """Test timestamp/url formatting and placeholder title enrichment."""
+        table = SegmentTable.from_results(RESULTS, catalog=VIDEO_CATALOG)
+
+        assert table.timestamp(0) == "2:05"
+        assert table.url(1) == "https://youtube.com/watch?v=abc&t=3s"
+        assert table.titles[0] == VIDEO_CATALOG[CATALOG_ID]["title"]
+        assert table.titles[1] == "Video abc"
+        assert table.titles[2] == "Custom"
+        assert [s.video_id for s in table.to_segments(limit=2)] == [CATALOG_ID, "abc"]
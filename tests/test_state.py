@@ -0,0 +1,79 @@
+"""Tests for multi-worker-safe state files."""
+
+import multiprocessing
+
+import pytest
+
+from minerva_jess.state import JsonStore, StateConflictError
+
+
+def _increment(path: str, worker: int, times: int) -> None:
+    """Bump a shared counter and record the worker, from another process."""
+    store = JsonStore(path)
+
+    def bump(data: dict):
+        data["count"] = data.get("count", 0) + 1
+        workers = data.setdefault("workers", {})
+        workers[str(worker)] = workers.get(str(worker), 0) + 1
+
+    for _ in range(times):
+        store.update(bump)
+
+
+class TestJsonStore:
+    """Test cases for JsonStore."""
+
+    def test_missing_and_corrupt_files_read_as_default(self, tmp_path):
+        """Test a missing or unreadable file yields the default."""
+        store = JsonStore(tmp_path / "state.json")
+        assert store.read_versioned() == ({}, None)
+
+        store.path.write_text("{not json")
+        assert store.read() == {}
+
+    def test_write_is_atomic_and_versioned(self, tmp_path):
+        """Test writes replace the file whole and stale versions are rejected."""
+        store = JsonStore(tmp_path / "state.json")
+        first = store.write({"a": 1})
+
+        data, version = store.read_versioned()
+        assert data == {"a": 1} and version == first
+
+        store.write({"a": 2}, expected_version=version)
+        with pytest.raises(StateConflictError):
+            store.write({"a": 3}, expected_version=version)
+        assert store.read() == {"a": 2}
+        assert [p.name for p in tmp_path.iterdir() if p.suffix == ".tmp"] == []
+
+    def test_migration_is_persisted(self, tmp_path):
+        """Test old data is upgraded on read and written back once."""
+        calls = []
+
+        def migrate(data: dict) -> bool:
+            calls.append(dict(data))
+            if "version" in data:
+                return False
+            data["version"] = 2
+            return True
+
+        store = JsonStore(tmp_path / "state.json", migrate=migrate)
+        store.path.write_text('{"a": 1}')
+
+        assert store.read() == {"a": 1, "version": 2}
+        assert JsonStore(store.path).read() == {"a": 1, "version": 2}
+        assert store.read() == {"a": 1, "version": 2}
+
+    def test_concurrent_processes_lose_no_updates(self, tmp_path):
+        """Test updates from several worker processes are all kept."""
+        path = str(tmp_path / "state.json")
+        ctx = multiprocessing.get_context("fork")
+        workers = [ctx.Process(target=_increment, args=(path, i, 50)) for i in range(4)]
+        for process in workers:
+            process.start()
+        for process in workers:
+            process.join(timeout=30)
+            assert process.exitcode == 0
+
+        data = JsonStore(path).read()
+        assert data["count"] == 200
+        assert data["workers"] == {str(i): 50 for i in range(4)}
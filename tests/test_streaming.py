@@ -0,0 +1,111 @@
+"""Tests for streaming synthesis and JessAgent.query_stream."""
+
+import json
+from pathlib import Path
+
+import httpx
+
+from minerva_jess.agent import JessAgent
+from minerva_jess.config import AgentConfig, Settings
+from minerva_jess.models import AnswerChunkEvent, ResponseEvent, SearchEvent
+from minerva_jess.orca_client import chunk_text
+
+CONFIG = AgentConfig(config_path=Path("/nonexistent/config.yaml"))
+
+SEARCH = {"results": [{"video_id": "abc", "text": "AI capex", "start_time": 42, "score": 0.9}]}
+
+
+def make_agent(url: str, synthesize) -> JessAgent:
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/video/search":
+            return httpx.Response(200, json=SEARCH)
+        return synthesize(json.loads(request.content))
+
+    agent = JessAgent(Settings(orca_url=url), CONFIG)
+    agent.client._client = httpx.AsyncClient(
+        base_url=url, transport=httpx.MockTransport(handler)
+    )
+    return agent
+
+
+class TestQueryStream:
+    """Test cases for query_stream."""
+
+    async def test_streams_sse_chunks(self):
+        """Test search event comes first, then streamed chunks, then the response."""
+        def synthesize(body):
+            assert body["stream"] is True
+            events = "".join(
+                f"data: {json.dumps({'delta': d})}\n\n" for d in ["AI ", "is ", "big."]
+            )
+            return httpx.Response(
+                200, text=events + "data: [DONE]\n\n",
+                headers={"content-type": "text/event-stream"},
+            )
+
+        agent = make_agent("http://stream-sse.test", synthesize)
+        events = [e async for e in agent.query_stream("@jess AI outlook")]
+
+        assert isinstance(events[0], SearchEvent)
+        assert events[0].video_info["start_time"] == 42
+        assert [e.text for e in events[1:-1]] == ["AI ", "is ", "big."]
+        assert isinstance(events[-1], ResponseEvent)
+        assert events[-1].response.content == "AI is big."
+        assert events[-1].response.video_info == events[0].video_info
+
+        # Second stream is served from the synthesis cache
+        again = [e async for e in agent.query_stream("AI outlook")]
+        assert again[-1].response.content == "AI is big."
+
+    async def test_chunked_fallback_for_plain_json(self):
+        """Test a non-streaming endpoint's answer is chunked."""
+        answer = "word " * 60
+
+        agent = make_agent(
+            "http://stream-json.test", lambda body: httpx.Response(200, json={"answer": answer})
+        )
+        events = [e async for e in agent.query_stream("AI outlook")]
+
+        chunks = [e for e in events if isinstance(e, AnswerChunkEvent)]
+        assert len(chunks) > 1
+        assert events[-1].response.content == answer
+
+    async def test_error_falls_back_to_segments(self):
+        """Test a failed synthesis streams the fallback summary."""
+        agent = make_agent("http://stream-err.test", lambda body: httpx.Response(500))
+        events = [e async for e in agent.query_stream("AI outlook")]
+
+        assert events[-1].response.success
+        assert "Found 1 relevant segment" in events[-1].response.content
+
+    async def test_broken_stream_is_flagged(self):
+        """Test a stream that breaks midway ends in a failed, partial response."""
+        class BrokenStream(httpx.AsyncByteStream):
+            async def __aiter__(self):
+                yield b'data: {"delta": "AI "}\n\n'
+                raise httpx.ReadError("connection reset")
+
+        agent = make_agent(
+            "http://stream-broken.test",
+            lambda body: httpx.Response(
+                200, stream=BrokenStream(), headers={"content-type": "text/event-stream"}
+            ),
+        )
+        events = [e async for e in agent.query_stream("AI outlook")]
+
+        assert [e.text for e in events if isinstance(e, AnswerChunkEvent)] == ["AI "]
+        response = events[-1].response
+        assert not response.success
+        assert response.content == "AI "
+        assert "interrupted" in response.error
+
+        # The partial answer isn't cached
+        assert agent.client._cache("synthesis").stats()["size"] == 0
+
+
+def test_chunk_text_round_trips():
+    """Test chunking preserves the text exactly."""
+    text = "one two  three\nfour " * 20
+    chunks = list(chunk_text(text, size=16))
+    assert "".join(chunks) == text
+    assert all(len(c) < 32 for c in chunks)
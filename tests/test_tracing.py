@@ -0,0 +1,141 @@
+"""Tests for request tracing."""
+
+import json
+from pathlib import Path
+
+import httpx
+import pytest
+
+from benchmarks.trace_collector import TraceCollector
+from minerva_jess import orca_pool, tracing
+from minerva_jess.agent import JessAgent
+from minerva_jess.config import AgentConfig, Settings
+from minerva_jess.tracing import NOOP_SPAN, JsonlExporter, OtlpHttpExporter, Tracer
+
+CONFIG = AgentConfig(config_path=Path("/nonexistent/config.yaml"))
+
+
+@pytest.fixture
+def tracer():
+    """The process-wide tracer, recording every trace for the test."""
+    saved = (tracing.TRACER.sample_rate, tracing.TRACER.exporters)
+    tracing.TRACER.configure(sample_rate=1.0, exporters=[])
+    tracing.TRACER.clear()
+    yield tracing.TRACER
+    tracing.TRACER.configure(sample_rate=saved[0], exporters=saved[1])
+    tracing.TRACER.clear()
+
+
+class TestTracer:
+    """Test cases for Tracer."""
+
+    def test_unsampled_by_default(self):
+        """Test spans are no-ops and no header is sent without sampling."""
+        tracer = Tracer()
+
+        with tracer.span("idle") as span:
+            assert span is NOOP_SPAN
+            assert tracing.inject() == {}
+
+        assert tracer.traces() == []
+
+    def test_nested_spans_and_jsonl_export(self, tmp_path):
+        """Test children share the trace, errors are recorded and spans are exported."""
+        path = tmp_path / "traces.jsonl"
+        tracer = Tracer(sample_rate=1.0, exporters=[JsonlExporter(path)])
+
+        with pytest.raises(ValueError):
+            with tracer.span("outer") as outer:
+                with tracer.span("inner", video_id="abc") as inner:
+                    assert tracing.inject()["traceparent"] == inner.context.traceparent
+                raise ValueError("boom")
+
+        assert inner.trace_id == outer.trace_id
+        assert inner.parent_id == outer.span_id
+        assert outer.status == "error" and inner.status == "ok"
+        assert [s.name for s in tracer.get_trace(outer.trace_id)] == ["outer", "inner"]
+        assert tracer.traces()[0]["spans"] == 2
+
+        lines = path.read_text().splitlines()
+        assert len(lines) == 2
+        assert json.loads(lines[0])["attributes"] == {"video_id": "abc"}
+
+    def test_remote_parent_decides_sampling(self):
+        """Test an incoming traceparent is continued and its sampled flag kept."""
+        tracer = Tracer(sample_rate=0.0)
+        trace_id, parent_id = "ab" * 16, "cd" * 8
+
+        with tracer.span("GET /", parent=tracing.extract(f"00-{trace_id}-{parent_id}-01")) as span:
+            assert span.parent_id == parent_id
+        assert tracer.traces()[0]["trace_id"] == trace_id
+
+        with tracer.span("GET /", parent=tracing.extract(f"00-{trace_id}-{parent_id}-00")) as span:
+            assert span is NOOP_SPAN
+            assert tracing.inject()["traceparent"].endswith("-00")
+
+        assert tracing.extract({"traceparent": "garbage"}) is None
+
+    def test_untrusted_parent_is_resampled(self):
+        """Test a client's sampled flag can't force recording, but its trace id is kept."""
+        trace_id, parent_id = "ab" * 16, "cd" * 8
+        incoming = tracing.extract(f"00-{trace_id}-{parent_id}-01")
+
+        idle = Tracer(sample_rate=0.0, parent_based=False)
+        with idle.span("GET /", parent=incoming) as span:
+            assert span is NOOP_SPAN
+        assert idle.traces() == []
+
+        sampled = Tracer(sample_rate=1.0, parent_based=False)
+        with sampled.span("GET /", parent=incoming) as span:
+            assert (span.trace_id, span.parent_id) == (trace_id, parent_id)
+
+
+async def test_query_trace_reaches_orca(tracer):
+    """Test an agent query is traced stage by stage and Orca receives the context."""
+    seen: dict[str, str] = {}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen[request.url.path] = request.headers.get("traceparent", "")
+        if request.url.path == "/video/search":
+            return httpx.Response(200, json={"results": [
+                {"video_id": "v1", "title": "T", "text": "hello", "start_time": 0, "score": 0.9},
+            ]})
+        return httpx.Response(200, json={"answer": "An answer."})
+
+    url = "http://tracing.test"
+    settings = Settings(orca_url=url, orca_cache_enabled=False)
+    agent = JessAgent(settings, CONFIG)
+    agent.client._client = orca_pool.build_client(settings, transport=httpx.MockTransport(handler))
+
+    response = await agent.query("what about inflation?")
+    assert response.success
+
+    trace_id = tracer.traces()[0]["trace_id"]
+    spans = {s.name: s for s in tracer.get_trace(trace_id)}
+    assert {
+        "agent.query", "agent.clean_query", "agent.route",
+        "agent.search", "orca.search", "agent.synthesize", "orca.synthesize",
+    } <= set(spans)
+    assert spans["orca.search"].parent_id == spans["agent.search"].span_id
+    assert spans["orca.search"].attributes["http.status_code"] == 200
+    assert seen["/video/search"] == spans["orca.search"].context.traceparent
+
+
+def test_otlp_export_to_collector():
+    """Test spans arrive at an OTLP/HTTP JSON collector."""
+    collector = TraceCollector().start()
+    try:
+        exporter = OtlpHttpExporter(collector.endpoint, interval=0.05)
+        tracer = Tracer(sample_rate=1.0, exporters=[exporter])
+        with tracer.span("agent.query", intent="search"):
+            with tracer.span("orca.search"):
+                pass
+        assert exporter.flush(timeout=5)
+        exporter.shutdown()
+    finally:
+        collector.stop()
+
+    names = {s["name"]: s for s in collector.spans}
+    assert set(names) == {"agent.query", "orca.search"}
+    assert names["agent.query"]["attributes"] == {"intent": "search"}
+    assert names["orca.search"]["parent_id"] == names["agent.query"]["span_id"]
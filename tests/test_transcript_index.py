@@ -0,0 +1,62 @@
+"""Tests for segment-level transcript storage."""
+
+from minerva_jess import codec
+from minerva_jess.transcript_index import TranscriptIndex
+
+SEGMENTS = [
+    {"text": "Welcome back.", "start_time": 0.0, "end_time": 4.0, "speaker": "Host"},
+    {"text": "Markets fell.", "start": 10.0, "duration": 5.0, "speaker": "Guest"},
+    {"text": "", "start_time": 15.0, "end_time": 16.0},
+    {"text": "Then they recovered.", "start_time": 16.0, "speaker": "Guest"},
+    {"text": "Bye.", "start_time": 195.0, "end_time": 197.5, "speaker": "Host"},
+]
+
+
+class TestTranscriptIndex:
+    """Test cases for TranscriptIndex."""
+
+    def test_columns_and_flat_text(self):
+        """Test the flat text matches the old join and segments slice it."""
+        index = TranscriptIndex.from_segments(reversed(SEGMENTS))
+
+        assert index.text == " ".join(seg["text"] for seg in SEGMENTS)
+        assert [index.segment_text(i) for i in range(len(index))] == [s["text"] for s in SEGMENTS]
+        assert list(index.ends) == [4.0, 15.0, 16.0, 195.0, 197.5]
+        assert index.speaker_names == ["Host", "Guest"]
+        speakers = [index.speaker(i) for i in range(len(index))]
+        assert speakers == ["Host", "Guest", None, "Guest", "Host"]
+
+    def test_record_round_trip(self):
+        """Test an index survives storage as record columns."""
+        index = TranscriptIndex.from_segments(SEGMENTS)
+        record = {"transcript": index.text, "segments": index.to_columns()}
+        record = codec.loads(codec.dumps(record))
+
+        restored = TranscriptIndex.from_record(record)
+        assert [restored.segment(i) for i in range(len(restored))] == [
+            index.segment(i) for i in range(len(index))
+        ]
+        assert TranscriptIndex.from_record({"transcript": "text only", "segments": None}) is None
+
+    def test_at(self):
+        """Test timestamp lookup, including pauses and out-of-range times."""
+        index = TranscriptIndex.from_segments(SEGMENTS)
+
+        assert index.segment(index.at(195.0))["text"] == "Bye."
+        assert index.segment(index.at(195.0))["timestamp"] == "3:15"
+        assert index.at(12.5) == 1
+        assert index.at(6.0) == 0  # Pause after the first segment
+        assert index.at(-1.0) is None
+        assert index.at(200.0) is None
+        assert TranscriptIndex().at(1.0) is None
+
+    def test_between(self):
+        """Test range lookup returns overlapping segments and their text."""
+        index = TranscriptIndex.from_segments(SEGMENTS)
+
+        rows = index.between(3.0, 16.0)
+        assert list(rows) == [0, 1, 2, 3]
+        assert index.span_text(rows) == "Welcome back. Markets fell.  Then they recovered."
+        assert list(index.between(5.0, 9.0)) == []
+        assert list(index.between(196.0, 500.0)) == [4]
+        assert list(index.between(20.0, 10.0)) == []
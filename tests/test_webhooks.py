@@ -0,0 +1,80 @@
+"""Tests for HeyGen webhook handling."""
+
+from benchmarks.heygen_callback import make_event
+from minerva_jess import codec
+from minerva_jess.webhooks import (
+    apply_translation_update,
+    parse_translation_event,
+    sign,
+    verify_signature,
+)
+
+
+def make_translations() -> dict:
+    return {
+        "vid1": {
+            "title": "Outlook",
+            "languages": {
+                "French": {"job_id": "job-fr", "status": "processing"},
+                "German": {"job_id": "job-de-new", "status": "processing"},
+            },
+        }
+    }
+
+
+class TestWebhooks:
+    """Test cases for HeyGen callbacks."""
+
+    def test_signature(self):
+        """Test only the exact body signed with the secret verifies."""
+        body = codec.dumps(make_event(job_id="job-fr", output_url="https://cdn/x.mp4"))
+        signature = sign("s3cret", body)
+
+        assert verify_signature("s3cret", body, signature)
+        assert verify_signature("s3cret", body, signature.upper())
+        assert not verify_signature("s3cret", body + b" ", signature)
+        assert not verify_signature("other", body, signature)
+        assert not verify_signature("", body, sign("", body))
+
+    def test_parse_events(self):
+        """Test success and failure events parse; other events are ignored."""
+        done = parse_translation_event(make_event(job_id="j", output_url="https://cdn/x.mp4"))
+        assert (done.job_id, done.status) == ("j", "completed")
+        assert done.output_url == "https://cdn/x.mp4"
+
+        failed = parse_translation_event(make_event(callback_id="vid1:French", error="Bad audio"))
+        assert (failed.callback_id, failed.status) == ("vid1:French", "failed")
+        assert failed.error == "Bad audio"
+
+        assert parse_translation_event({"event_type": "avatar_video.success"}) is None
+        assert parse_translation_event({"event_type": "video_translate.success"}) is None
+
+    def test_apply_is_idempotent(self):
+        """Test a redelivered callback changes nothing and can't flip the result."""
+        translations = make_translations()
+        done = parse_translation_event(make_event(job_id="job-fr", output_url="https://cdn/fr.mp4"))
+        late_failure = parse_translation_event(make_event(job_id="job-fr", error="timeout"))
+
+        assert apply_translation_update(translations, done) == "updated"
+        assert apply_translation_update(translations, done) == "duplicate"
+        assert apply_translation_update(translations, late_failure) == "duplicate"
+        assert translations["vid1"]["languages"]["French"] == {
+            "job_id": "job-fr", "status": "completed", "output_url": "https://cdn/fr.mp4",
+        }
+
+    def test_callback_id_fallback(self):
+        """Test the callback id matches a job, but never a newer resubmission."""
+        translations = make_translations()
+        stale = parse_translation_event(
+            make_event(
+                job_id="job-de-old", callback_id="vid1:German", output_url="https://cdn/de.mp4"
+            )
+        )
+        assert apply_translation_update(translations, stale) == "unknown_job"
+        assert translations["vid1"]["languages"]["German"]["status"] == "processing"
+
+        by_callback = parse_translation_event(
+            make_event(callback_id="vid1:German", error="No speech")
+        )
+        assert apply_translation_update(translations, by_callback) == "updated"
+        assert translations["vid1"]["languages"]["German"]["status"] == "failed"
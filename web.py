@@ -5,42 +5,69 @@ Browse Guinness GI videos for HeyGen translation.
 Run with: uvicorn web:app --reload --port 8000
 """
 
-import json
+import asyncio
 import logging
+import os
 import re
 import subprocess
 import sys
 import tempfile
+import time
+from contextlib import asynccontextmanager
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Any, Callable, Optional
 
 import requests
-import anthropic
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Query, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse, HTMLResponse
+from fastapi.responses import (
+    FileResponse,
+    HTMLResponse,
+    JSONResponse,
+    PlainTextResponse,
+    Response,
+)
 from fastapi.staticfiles import StaticFiles
 from pydantic import BaseModel
+from starlette.routing import Match
 
 # Auth client for API keys
 from auth_client import get_api_key
 
+# Shared instrumentation (also recorded into by the minerva_jess SDK)
+from minerva_jess import codec, metrics, tracing
+from minerva_jess.admission import LLM_ADMISSION, AdmissionRejectedError
+from minerva_jess.cache import TTLCache
+from minerva_jess.jobs import JobScheduler, Outcome
+from minerva_jess.profiling import PROFILER
+from minerva_jess.state import JsonStore
+from minerva_jess.tracing import TRACER, traced
+from minerva_jess.transcript_index import TranscriptIndex
+from minerva_jess.webhooks import (
+    apply_translation_update,
+    parse_translation_event,
+    verify_signature,
+)
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 # Paths and config
 BASE_DIR = Path(__file__).parent
-CACHE_FILE = BASE_DIR / "data" / "videos_cache.json"
-TRANSLATIONS_FILE = BASE_DIR / "data" / "translations.json"
-TRANSCRIPTS_FILE = BASE_DIR / "data" / "transcripts.json"
+DATA_DIR = Path(os.environ.get("JESS_DATA_DIR", BASE_DIR / "data"))
+CACHE_FILE = DATA_DIR / "videos_cache.json"
+TRANSLATIONS_FILE = DATA_DIR / "translations.json"
+TRANSCRIPTS_FILE = DATA_DIR / "transcripts.json"
+TRANSLATION_JOBS_FILE = DATA_DIR / "translation_jobs.json"
+HEYGEN_SWEEP_FILE = DATA_DIR / "heygen_sweep.json"
 STATIC_DIR = BASE_DIR / "static"
 ASSETS_DIR = BASE_DIR / "assets"
 CHANNEL_URL = "https://www.youtube.com/@GuinnessGI"
 
 # Ensure data directory exists
-(BASE_DIR / "data").mkdir(parents=True, exist_ok=True)
+DATA_DIR.mkdir(parents=True, exist_ok=True)
 
 logger.info(f"Starting Jess - BASE_DIR: {BASE_DIR}")
 logger.info(f"STATIC_DIR exists: {STATIC_DIR.exists()}, ASSETS_DIR exists: {ASSETS_DIR.exists()}")
@@ -51,10 +78,61 @@ AVAILABLE_LANGUAGES = [
 ]
 
 # Video MCP for transcripts (TODO: route through Orca long-term)
-VIDEO_MCP_URL = "https://video-mcp.urbancanary.workers.dev"
+VIDEO_MCP_URL = os.environ.get("VIDEO_MCP_URL", "https://video-mcp.urbancanary.workers.dev")
+
+# HeyGen translation API
+HEYGEN_API_URL = os.environ.get("HEYGEN_API_URL", "https://api.heygen.com")
+
+# Bulk translation scheduler: HeyGen jobs processing at once, submissions
+# per day (0 = no quota), attempts per job, seconds between ticks and
+# seconds finished jobs stay listed
+HEYGEN_MAX_IN_FLIGHT = int(os.environ.get("HEYGEN_MAX_IN_FLIGHT", "3"))
+HEYGEN_DAILY_QUOTA = int(os.environ.get("HEYGEN_DAILY_QUOTA", "0"))
+HEYGEN_MAX_ATTEMPTS = int(os.environ.get("HEYGEN_MAX_ATTEMPTS", "5"))
+HEYGEN_SCHEDULER_INTERVAL = float(os.environ.get("HEYGEN_SCHEDULER_INTERVAL", "5"))
+HEYGEN_JOB_RETENTION = float(os.environ.get("HEYGEN_JOB_RETENTION", str(7 * 86400)))
+
+# HeyGen completion callbacks (see /api/webhooks/heygen). Status polling is
+# only a safety net: every HEYGEN_SWEEP_INTERVAL seconds, jobs processing for
+# longer than HEYGEN_SWEEP_MIN_AGE seconds are checked (0 disables the sweep)
+HEYGEN_WEBHOOK_SECRET = os.environ.get("HEYGEN_WEBHOOK_SECRET", "")
+HEYGEN_SWEEP_INTERVAL = float(os.environ.get("HEYGEN_SWEEP_INTERVAL", "900"))
+HEYGEN_SWEEP_MIN_AGE = float(os.environ.get("HEYGEN_SWEEP_MIN_AGE", "1800"))
+
+# Admin endpoints (/admin/*) are disabled unless a token is configured
+ADMIN_TOKEN = os.environ.get("JESS_ADMIN_TOKEN", "")
+
+# Reverse proxies in front of the app that append to X-Forwarded-For (0 = none;
+# the header is then ignored, since clients can set it to anything)
+TRUSTED_PROXY_HOPS = int(os.environ.get("JESS_TRUSTED_PROXY_HOPS", "1"))
+
+
+class CodecJSONResponse(JSONResponse):
+    """JSON response rendered by minerva_jess.codec (orjson when installed)."""
+
+    def render(self, content) -> bytes:
+        return codec.dumps(content)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Run the bulk translation scheduler and status sweep alongside the app (in every worker)."""
+    tasks = [asyncio.create_task(TRANSLATION_JOBS.run_forever(HEYGEN_SCHEDULER_INTERVAL))]
+    if HEYGEN_SWEEP_INTERVAL > 0:
+        tasks.append(asyncio.create_task(sweep_translations_forever()))
+    try:
+        yield
+    finally:
+        for task in tasks:
+            task.cancel()
+
 
 # FastAPI app
-app = FastAPI(title="Jess Video Gallery")
+app = FastAPI(
+    title="Jess Video Gallery",
+    default_response_class=CodecJSONResponse,
+    lifespan=lifespan,
+)
 
 app.add_middleware(
     CORSMiddleware,
@@ -69,6 +147,107 @@ if ASSETS_DIR.exists():
     app.mount("/assets", StaticFiles(directory=ASSETS_DIR), name="assets")
 
 
+def _route_label(request: Request) -> str:
+    """Route template for a request (keeps metric label cardinality bounded)."""
+    for route in request.app.router.routes:
+        match, _ = route.matches(request.scope)
+        if match == Match.FULL:
+            return getattr(route, "path", "unmatched")
+    return "unmatched"
+
+
+@app.middleware("http")
+async def record_request_metrics(request: Request, call_next):
+    """Record per-route request counts, latency and in-flight requests."""
+    route = _route_label(request)
+    metrics.HTTP_IN_FLIGHT.inc(route=route)
+    start = time.perf_counter()
+    status = 500
+    try:
+        response = await call_next(request)
+        status = response.status_code
+        return response
+    finally:
+        metrics.HTTP_LATENCY.observe(
+            time.perf_counter() - start, method=request.method, route=route
+        )
+        metrics.HTTP_REQUESTS.inc(method=request.method, route=route, status=str(status))
+        metrics.HTTP_IN_FLIGHT.dec(route=route)
+
+
+@app.exception_handler(AdmissionRejectedError)
+async def admission_rejected(request: Request, exc: AdmissionRejectedError):
+    """Overloaded: tell the client when to come back instead of queueing forever."""
+    return CodecJSONResponse(
+        {"detail": "Server busy, please retry shortly", "reason": exc.reason},
+        status_code=503,
+        headers={"Retry-After": str(exc.retry_after)},
+    )
+
+
+def client_id(request: Request) -> str:
+    """
+    Caller identity for per-client limits.
+
+    Uses the X-Forwarded-For hop added by the outermost trusted proxy
+    (JESS_TRUSTED_PROXY_HOPS from the right); hops to its left come from
+    the client and can't be trusted. Falls back to the peer IP.
+    """
+    forwarded = request.headers.get("X-Forwarded-For")
+    if forwarded and TRUSTED_PROXY_HOPS > 0:
+        hops = [hop.strip() for hop in forwarded.split(",")]
+        if len(hops) >= TRUSTED_PROXY_HOPS and hops[-TRUSTED_PROXY_HOPS]:
+            return hops[-TRUSTED_PROXY_HOPS]
+    return request.client.host if request.client else ""
+
+
+def is_admin(request: Request) -> bool:
+    """Check the request carries the admin bearer token."""
+    return bool(ADMIN_TOKEN) and request.headers.get("Authorization") == f"Bearer {ADMIN_TOKEN}"
+
+
+def require_admin(request: Request):
+    """Reject non-admin requests with 403."""
+    if not is_admin(request):
+        raise HTTPException(status_code=403, detail="Admin token required")
+
+
+@app.middleware("http")
+async def profile_requests(request: Request, call_next):
+    """Profile sampled requests, or any admin request sending X-Jess-Profile: 1."""
+    force = request.headers.get("X-Jess-Profile") == "1" and is_admin(request)
+    with PROFILER.profile(
+        request.url.path, force=force, tags={"method": request.method}
+    ) as profiler:
+        response = await call_next(request)
+    if profiler is not None:
+        response.headers["X-Jess-Profiled"] = "1"
+    return response
+
+
+@app.middleware("http")
+async def trace_requests(request: Request, call_next):
+    """
+    Root span for each request, continuing the caller's traceparent.
+
+    Sampled per JESS_TRACE_SAMPLE_RATE, or forced for an admin request
+    sending X-Jess-Trace: 1. Recorded requests get an X-Trace-Id header.
+    """
+    force = request.headers.get("X-Jess-Trace") == "1" and is_admin(request)
+    route = _route_label(request)
+    with TRACER.span(
+        f"{request.method} {route}",
+        parent=tracing.extract(request.headers),
+        force=force,
+        **{"http.method": request.method, "http.route": route},
+    ) as span:
+        response = await call_next(request)
+        span.set_attribute("http.status_code", response.status_code)
+    if span.context is not None:
+        response.headers["X-Trace-Id"] = span.context.trace_id
+    return response
+
+
 # =============================================================================
 # Pydantic Models
 # =============================================================================
@@ -80,93 +259,112 @@ class TranslateRequest(BaseModel):
     language: str
 
 
+class BulkTranslateItem(BaseModel):
+    video_id: str
+    language: str
+    title: Optional[str] = None
+    video_url: Optional[str] = None
+    priority: Optional[int] = None
+
+
+class BulkTranslateRequest(BaseModel):
+    items: list[BulkTranslateItem] = []
+    # Or every combination of these (all AVAILABLE_LANGUAGES if omitted)
+    video_ids: list[str] = []
+    languages: Optional[list[str]] = None
+    priority: int = 0
+
+
 class VideoQuestionRequest(BaseModel):
     video_id: str
     question: str
     title: Optional[str] = None
 
 
+class ProfilingConfigRequest(BaseModel):
+    sample_rate: Optional[float] = None
+    paths: Optional[list[str]] = None
+    max_profiles: Optional[int] = None
+
+
+class TracingConfigRequest(BaseModel):
+    sample_rate: Optional[float] = None
+    max_spans: Optional[int] = None
+
+
 # =============================================================================
 # Helper Functions (ported from app.py)
 # =============================================================================
 
+def _migrate_translations(data: dict) -> bool:
+    """Move old single-language entries under "languages"; True if any changed."""
+    migrated = False
+    for video_id, trans in data.items():
+        if "languages" not in trans:
+            lang = trans.get("language", "Unknown")
+            old_data = {
+                "job_id": trans.get("job_id"),
+                "status": trans.get("status", "unknown"),
+                "submitted_at": trans.get("submitted_at", ""),
+            }
+            if trans.get("output_url"):
+                old_data["output_url"] = trans["output_url"]
+            if trans.get("error"):
+                old_data["error"] = trans["error"]
+            data[video_id] = {
+                "title": trans.get("title", "Untitled"),
+                "original_url": trans.get(
+                    "original_url", f"https://www.youtube.com/watch?v={video_id}"
+                ),
+                "languages": {lang: old_data}
+            }
+            migrated = True
+    return migrated
+
+
+# State files are shared by all workers: writes are atomic and changes go
+# through update(), which locks the file across the read-modify-write
+VIDEOS_STORE = JsonStore(CACHE_FILE)
+TRANSLATIONS_STORE = JsonStore(TRANSLATIONS_FILE, migrate=_migrate_translations)
+TRANSCRIPTS_STORE = JsonStore(TRANSCRIPTS_FILE)
+
+
+@traced("file.load_videos_cache")
 def load_cached_videos() -> tuple[list, str]:
-    if CACHE_FILE.exists():
-        try:
-            with open(CACHE_FILE) as f:
-                data = json.load(f)
-                return data.get("videos", []), data.get("cached_at", "")
-        except Exception:
-            pass
-    return [], ""
+    data = VIDEOS_STORE.read()
+    return data.get("videos", []), data.get("cached_at", "")
 
 
+@traced("file.save_videos_cache")
 def save_videos_cache(videos: list):
-    CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
-    with open(CACHE_FILE, "w") as f:
-        json.dump({
-            "videos": videos,
-            "cached_at": datetime.now().isoformat(),
-            "channel_url": CHANNEL_URL
-        }, f, indent=2)
+    VIDEOS_STORE.write({
+        "videos": videos,
+        "cached_at": datetime.now().isoformat(),
+        "channel_url": CHANNEL_URL
+    })
 
 
+@traced("file.load_translations")
 def load_translations() -> dict:
-    if TRANSLATIONS_FILE.exists():
-        try:
-            with open(TRANSLATIONS_FILE) as f:
-                data = json.load(f)
-            # Migrate old format entries
-            migrated = False
-            for video_id, trans in data.items():
-                if "languages" not in trans:
-                    lang = trans.get("language", "Unknown")
-                    old_data = {
-                        "job_id": trans.get("job_id"),
-                        "status": trans.get("status", "unknown"),
-                        "submitted_at": trans.get("submitted_at", ""),
-                    }
-                    if trans.get("output_url"):
-                        old_data["output_url"] = trans["output_url"]
-                    if trans.get("error"):
-                        old_data["error"] = trans["error"]
-                    data[video_id] = {
-                        "title": trans.get("title", "Untitled"),
-                        "original_url": trans.get("original_url", f"https://www.youtube.com/watch?v={video_id}"),
-                        "languages": {lang: old_data}
-                    }
-                    migrated = True
-            if migrated:
-                with open(TRANSLATIONS_FILE, "w") as f:
-                    json.dump(data, f, indent=2)
-            return data
-        except Exception:
-            pass
-    return {}
-
-
-def save_translations(translations: dict):
-    TRANSLATIONS_FILE.parent.mkdir(parents=True, exist_ok=True)
-    with open(TRANSLATIONS_FILE, "w") as f:
-        json.dump(translations, f, indent=2)
+    return TRANSLATIONS_STORE.read()
 
 
+@traced("file.update_translations")
+def update_translations(mutate: Callable[[dict], Any]) -> Any:
+    """Change translations in place under the file lock (see JsonStore.update)."""
+    return TRANSLATIONS_STORE.update(mutate)
+
+
+@traced("file.load_transcripts")
 def load_transcripts() -> dict:
     """Load stored transcripts from JSON file."""
-    if TRANSCRIPTS_FILE.exists():
-        try:
-            with open(TRANSCRIPTS_FILE) as f:
-                return json.load(f)
-        except Exception:
-            pass
-    return {}
+    return TRANSCRIPTS_STORE.read()
 
 
-def save_transcripts(transcripts: dict):
-    """Save transcripts to JSON file."""
-    TRANSCRIPTS_FILE.parent.mkdir(parents=True, exist_ok=True)
-    with open(TRANSCRIPTS_FILE, "w") as f:
-        json.dump(transcripts, f, indent=2)
+@traced("file.update_transcripts")
+def update_transcripts(mutate: Callable[[dict], Any]) -> Any:
+    """Change stored transcripts in place under the file lock."""
+    return TRANSCRIPTS_STORE.update(mutate)
 
 
 def fetch_youtube_videos(max_results: int = 50) -> list:
@@ -175,15 +373,17 @@ def fetch_youtube_videos(max_results: int = 50) -> list:
             "yt-dlp", "--flat-playlist", "--dump-json",
             f"{CHANNEL_URL}/videos", "--playlist-end", str(max_results)
         ]
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=60)
+        with metrics.track_upstream("yt_dlp", "list_channel"):
+            result = subprocess.run(cmd, capture_output=True, text=True, timeout=60)
         if result.returncode != 0:
+            metrics.record_upstream_error("yt_dlp", "list_channel", f"exit_{result.returncode}")
             return []
         videos = []
         for line in result.stdout.strip().split("\n"):
             if not line:
                 continue
             try:
-                data = json.loads(line)
+                data = codec.loads(line)
                 videos.append({
                     "video_id": data.get("id", ""),
                     "title": data.get("title", "Untitled"),
@@ -199,19 +399,105 @@ def fetch_youtube_videos(max_results: int = 50) -> list:
         return []
 
 
+def call_video_mcp_transcript(video_id: str) -> requests.Response:
+    """Call the Video MCP transcript tool for a video."""
+    with metrics.track_upstream("video_mcp", "get_transcript") as span:
+        resp = requests.post(
+            f"{VIDEO_MCP_URL}/mcp/tools/call",
+            json={"name": "video_get_transcript", "arguments": {"video_id": video_id}},
+            headers=tracing.inject(),
+            timeout=30
+        )
+        span.set_attribute("http.status_code", resp.status_code)
+    if resp.status_code >= 400:
+        metrics.record_upstream_error("video_mcp", "get_transcript", f"http_{resp.status_code}")
+    return resp
+
+
+def transcript_record(video_id: str, title: str, data: dict) -> Optional[dict]:
+    """
+    Stored transcript record for a Video MCP response (None if it has no text).
+
+    Segment timings and speakers are kept as columns alongside the flat
+    text (see minerva_jess.transcript_index).
+    """
+    segments = data.get("segments", [])
+    index = TranscriptIndex.from_segments(segments) if segments else None
+    transcript_text = index.text if index else data.get("transcript", data.get("text", ""))
+    if not transcript_text:
+        return None
+    record = {
+        "video_id": video_id,
+        "title": title,
+        "source": "video_mcp",
+        "language": "en",
+        "transcript": transcript_text,
+        "fetched_at": datetime.now().isoformat(),
+        "word_count": len(transcript_text.split())
+    }
+    # None marks a text-only transcript, so it isn't refetched for segments
+    record["segments"] = index.to_columns() if index is not None else None
+    return record
+
+
+def fetch_transcript_record(video_id: str) -> dict:
+    """
+    Fetch a transcript from Video MCP, store it and return its record.
+
+    Raises:
+        HTTPException: If the transcript can't be fetched or has no text
+    """
+    try:
+        resp = call_video_mcp_transcript(video_id)
+        if resp.status_code == 404:
+            raise HTTPException(status_code=404, detail="Transcript not available for this video")
+        resp.raise_for_status()
+        data = codec.loads(resp.content)
+    except requests.exceptions.ConnectionError:
+        raise HTTPException(status_code=503, detail="Cannot connect to Video MCP")
+    except requests.exceptions.Timeout:
+        raise HTTPException(status_code=504, detail="Timeout fetching transcript")
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+    if "error" in data:
+        raise HTTPException(status_code=404, detail=data.get("error", "Transcript not found"))
+
+    videos, _ = load_cached_videos()
+    video_title = "Unknown"
+    for v in videos:
+        if v.get("video_id") == video_id:
+            video_title = v.get("title", "Unknown")
+            break
+
+    record = transcript_record(video_id, video_title, data)
+    if record is None:
+        raise HTTPException(status_code=404, detail="No transcript content available")
+    update_transcripts(lambda stored: stored.update({video_id: record}))
+    return record
+
+
 def submit_translation_job(video_url: str, video_id: str, title: str, language: str) -> dict:
     api_key = get_api_key("HEYGEN_API_KEY", requester="jess")
     if not api_key:
         return {"error": "HEYGEN_API_KEY not available"}
     try:
-        resp = requests.post(
-            "https://api.heygen.com/v2/video_translate",
-            headers={"X-Api-Key": api_key, "Content-Type": "application/json"},
-            json={"video_url": video_url, "output_language": language},
-            timeout=30
-        )
+        with metrics.track_upstream("heygen", "submit_translation"):
+            resp = requests.post(
+                f"{HEYGEN_API_URL}/v2/video_translate",
+                headers={"X-Api-Key": api_key, "Content-Type": "application/json"},
+                json={
+                    "video_url": video_url,
+                    "output_language": language,
+                    # Echoed back in the completion webhook
+                    "callback_id": f"{video_id}:{language}",
+                },
+                timeout=30
+            )
         if resp.status_code in [200, 202]:
-            data = resp.json()
+            data = codec.loads(resp.content)
             return {
                 "job_id": data.get("data", {}).get("video_translate_id"),
                 "status": "processing",
@@ -222,23 +508,96 @@ def submit_translation_job(video_url: str, video_id: str, title: str, language:
                 "submitted_at": datetime.now().isoformat()
             }
         else:
-            return {"error": f"API error {resp.status_code}: {resp.text[:200]}"}
+            metrics.record_upstream_error(
+                "heygen", "submit_translation", f"http_{resp.status_code}"
+            )
+            error = {
+                "error": f"API error {resp.status_code}: {resp.text[:200]}",
+                "status_code": resp.status_code,
+            }
+            if resp.headers.get("Retry-After", "").isdigit():
+                error["retry_after"] = int(resp.headers["Retry-After"])
+            return error
+    except requests.exceptions.RequestException as e:
+        return {"error": str(e), "status_code": None}
     except Exception as e:
         return {"error": str(e)}
 
 
+def record_translation_job(video_id: str, title: str, video_url: str, language: str, job: dict):
+    """Store a submitted HeyGen job as the video's current translation for `language`."""
+    def add_job(translations: dict):
+        if video_id not in translations:
+            translations[video_id] = {
+                "title": title,
+                "original_url": video_url,
+                "languages": {}
+            }
+        translations[video_id]["languages"][language] = {
+            "job_id": job["job_id"],
+            "status": "processing",
+            "submitted_at": job["submitted_at"]
+        }
+
+    update_translations(add_job)
+
+
+def run_translation_job(payload: dict) -> Outcome:
+    """Submit one scheduled (video, language) pair to HeyGen."""
+    result = submit_translation_job(
+        payload["video_url"], payload["video_id"], payload["title"], payload["language"]
+    )
+    if "error" in result:
+        # Rate limits, HeyGen outages and network errors are worth retrying
+        status = result.get("status_code", 0)
+        retryable = status is None or status == 429 or status >= 500
+        return Outcome(
+            ok=False,
+            error=result["error"],
+            retryable=retryable,
+            retry_after=result.get("retry_after"),
+        )
+    record_translation_job(
+        payload["video_id"], payload["title"], payload["video_url"], payload["language"], result
+    )
+    return Outcome(ok=True, result={"job_id": result["job_id"]})
+
+
+def count_processing_translations() -> int:
+    """HeyGen jobs submitted and not yet finished."""
+    return sum(
+        1
+        for trans in load_translations().values()
+        for data in trans.get("languages", {}).values()
+        if data.get("status") == "processing"
+    )
+
+
+TRANSLATION_JOBS = JobScheduler(
+    JsonStore(TRANSLATION_JOBS_FILE),
+    run=run_translation_job,
+    name="heygen",
+    max_in_flight=HEYGEN_MAX_IN_FLIGHT,
+    in_flight=count_processing_translations,
+    quota=HEYGEN_DAILY_QUOTA,
+    max_attempts=HEYGEN_MAX_ATTEMPTS,
+    retention=HEYGEN_JOB_RETENTION,
+)
+
+
 def check_translation_status(job_id: str) -> dict:
     api_key = get_api_key("HEYGEN_API_KEY", requester="jess")
     if not api_key:
         return {"status": "error", "error": "HEYGEN_API_KEY not available"}
     try:
-        resp = requests.get(
-            f"https://api.heygen.com/v2/video_translate/{job_id}",
-            headers={"X-Api-Key": api_key},
-            timeout=30
-        )
+        with metrics.track_upstream("heygen", "translation_status"):
+            resp = requests.get(
+                f"{HEYGEN_API_URL}/v2/video_translate/{job_id}",
+                headers={"X-Api-Key": api_key},
+                timeout=30
+            )
         if resp.status_code == 200:
-            data = resp.json().get("data", {})
+            data = codec.loads(resp.content).get("data", {})
             status = data.get("status", "unknown")
             result = {"status": status}
             if status == "completed":
@@ -247,6 +606,9 @@ def check_translation_status(job_id: str) -> dict:
                 result["error"] = data.get("message", "Unknown error")
             return result
         else:
+            metrics.record_upstream_error(
+                "heygen", "translation_status", f"http_{resp.status_code}"
+            )
             return {"status": "error", "error": f"API error {resp.status_code}"}
     except Exception as e:
         return {"status": "error", "error": str(e)}
@@ -262,6 +624,74 @@ async def health():
     return {"status": "healthy", "service": "jess"}
 
 
+@app.get("/metrics")
+async def get_metrics():
+    """Prometheus metrics for this process."""
+    return Response(content=metrics.render(), media_type=metrics.CONTENT_TYPE)
+
+
+@app.get("/admin/profiles")
+async def list_profiles(request: Request):
+    """List captured request profiles (newest first)."""
+    require_admin(request)
+    return {
+        "sample_rate": PROFILER.sample_rate,
+        "paths": PROFILER.paths,
+        "profiles": [record.to_dict() for record in PROFILER.list()],
+    }
+
+
+@app.get("/admin/profiles/{profile_id}")
+async def download_profile(request: Request, profile_id: str, format: str = "text"):
+    """Download a profile as a pstats report (text) or raw .prof file (pstats)."""
+    require_admin(request)
+    record = PROFILER.get(profile_id)
+    if record is None:
+        raise HTTPException(status_code=404, detail="Profile not found")
+    if format == "pstats":
+        return Response(
+            content=record.stats,
+            media_type="application/octet-stream",
+            headers={"Content-Disposition": f'attachment; filename="{record.id}.prof"'},
+        )
+    return PlainTextResponse(record.summary())
+
+
+@app.post("/admin/profiling")
+async def configure_profiling(request: Request, req: ProfilingConfigRequest):
+    """Change profiling sample rate / eligible paths without a redeploy."""
+    require_admin(request)
+    PROFILER.configure(
+        sample_rate=req.sample_rate, max_profiles=req.max_profiles, paths=req.paths
+    )
+    return {"sample_rate": PROFILER.sample_rate, "paths": PROFILER.paths}
+
+
+@app.get("/admin/traces")
+async def list_traces(request: Request, limit: int = 50):
+    """List recently recorded traces (newest first)."""
+    require_admin(request)
+    return {"sample_rate": TRACER.sample_rate, "traces": TRACER.traces(limit)}
+
+
+@app.get("/admin/traces/{trace_id}")
+async def get_trace(request: Request, trace_id: str):
+    """Spans of one recorded trace, in start order."""
+    require_admin(request)
+    spans = TRACER.get_trace(trace_id)
+    if not spans:
+        raise HTTPException(status_code=404, detail="Trace not found")
+    return {"trace_id": trace_id, "spans": [s.to_dict() for s in spans]}
+
+
+@app.post("/admin/tracing")
+async def configure_tracing(request: Request, req: TracingConfigRequest):
+    """Change the trace sample rate without a redeploy."""
+    require_admin(request)
+    TRACER.configure(sample_rate=req.sample_rate, max_spans=req.max_spans)
+    return {"sample_rate": TRACER.sample_rate}
+
+
 @app.get("/", response_class=HTMLResponse)
 async def index():
     """Serve the main HTML page."""
@@ -275,6 +705,7 @@ async def index():
 async def get_videos():
     """Get list of videos (from cache or fetch from YouTube)."""
     videos, cached_at = load_cached_videos()
+    metrics.record_cache("videos", hit=bool(videos))
     if not videos:
         videos = fetch_youtube_videos()
         if videos:
@@ -334,51 +765,204 @@ async def translate_video(req: TranslateRequest):
         raise HTTPException(status_code=400, detail=result["error"])
 
     # Save to translations
-    translations = load_translations()
-    if req.video_id not in translations:
-        translations[req.video_id] = {
-            "title": req.title,
-            "original_url": req.video_url,
-            "languages": {}
-        }
-    translations[req.video_id]["languages"][req.language] = {
-        "job_id": result["job_id"],
-        "status": "processing",
-        "submitted_at": result["submitted_at"]
-    }
-    save_translations(translations)
+    record_translation_job(req.video_id, req.title, req.video_url, req.language, result)
 
     return {"success": True, "job_id": result["job_id"]}
 
 
-@app.post("/api/translations/check")
-async def check_translations():
-    """Check status of all processing translations."""
+@app.post("/api/translate/bulk")
+async def translate_bulk(req: BulkTranslateRequest):
+    """
+    Queue many (video, language) pairs for translation.
+
+    Pairs are submitted to HeyGen by the background scheduler, highest
+    priority first, within HEYGEN_MAX_IN_FLIGHT / HEYGEN_DAILY_QUOTA and
+    with retries on 429/5xx. Pairs already translated, processing at
+    HeyGen or queued are skipped.
+
+    Returns:
+        batch_id (for /api/translate/bulk/{batch_id}), queued keys and
+        skipped pairs with reasons
+    """
+    pairs = [item.model_dump() for item in req.items]
+    for video_id in req.video_ids:
+        for language in req.languages or AVAILABLE_LANGUAGES:
+            pairs.append({"video_id": video_id, "language": language})
+    if not pairs:
+        raise HTTPException(status_code=400, detail="No (video, language) pairs given")
+    unknown = sorted({p["language"] for p in pairs} - set(AVAILABLE_LANGUAGES))
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Unsupported languages: {', '.join(unknown)}")
+
+    videos, _ = load_cached_videos()
+    titles = {v.get("video_id"): v.get("title", "Untitled") for v in videos}
+    items = []
+    for pair in pairs:
+        video_id = pair["video_id"]
+        item = {
+            "key": f"{video_id}:{pair['language']}",
+            "video_id": video_id,
+            "language": pair["language"],
+            "title": pair.get("title") or titles.get(video_id, "Untitled"),
+            "video_url": pair.get("video_url") or f"https://www.youtube.com/watch?v={video_id}",
+        }
+        if pair.get("priority") is not None:
+            item["priority"] = pair["priority"]
+        items.append(item)
+
+    translations = load_translations()
+
+    def already_done(item: dict) -> Optional[str]:
+        languages = translations.get(item["video_id"], {}).get("languages", {})
+        lang_data = languages.get(item["language"])
+        status = (lang_data or {}).get("status")
+        if status == "completed":
+            return "completed"
+        if status == "processing":
+            return "in_flight"
+        return None
+
+    # The enqueue holds the jobs file lock; keep it off the event loop
+    return await asyncio.to_thread(
+        TRANSLATION_JOBS.enqueue, items, priority=req.priority, skip=already_done
+    )
+
+
+@app.get("/api/translate/bulk")
+async def translate_bulk_status():
+    """Job counts across all bulk translation batches."""
+    return TRANSLATION_JOBS.progress()
+
+
+@app.get("/api/translate/bulk/{batch_id}")
+async def translate_bulk_progress(batch_id: str):
+    """Progress of one bulk translation batch, job by job."""
+    progress = TRANSLATION_JOBS.progress(batch_id)
+    if progress is None:
+        raise HTTPException(status_code=404, detail="Batch not found")
+    return progress
+
+
+def poll_translations(min_age: float = 0) -> list[dict]:
+    """
+    Ask HeyGen for the status of processing translations and store the results.
+
+    Args:
+        min_age: Only check jobs submitted at least this many seconds ago
+
+    Returns:
+        The translations that finished ({"video_id", "language", "status"})
+    """
     translations = load_translations()
-    updated = False
     updates = []
+    results = {}
+    now = datetime.now()
 
+    # Poll HeyGen without holding the lock, then apply the results
     for video_id, trans in translations.items():
         for lang, data in trans.get("languages", {}).items():
             if data.get("status") == "processing" and data.get("job_id"):
+                if min_age and _age_seconds(data.get("submitted_at"), now) < min_age:
+                    continue
                 result = check_translation_status(data["job_id"])
                 if result.get("status") != "processing":
-                    translations[video_id]["languages"][lang]["status"] = result.get("status")
-                    if result.get("output_url"):
-                        translations[video_id]["languages"][lang]["output_url"] = result["output_url"]
-                    if result.get("error"):
-                        translations[video_id]["languages"][lang]["error"] = result["error"]
-                    updated = True
+                    results[(video_id, lang)] = (data["job_id"], result)
                     updates.append({
                         "video_id": video_id,
                         "language": lang,
                         "status": result.get("status")
                     })
 
-    if updated:
-        save_translations(translations)
+    def apply_results(current: dict):
+        for (video_id, lang), (job_id, result) in results.items():
+            entry = current.get(video_id, {}).get("languages", {}).get(lang)
+            # Skip jobs resubmitted or already updated by another worker
+            if not entry or entry.get("job_id") != job_id or entry.get("status") != "processing":
+                continue
+            entry["status"] = result.get("status")
+            if result.get("output_url"):
+                entry["output_url"] = result["output_url"]
+            if result.get("error"):
+                entry["error"] = result["error"]
+
+    if results:
+        update_translations(apply_results)
+    return updates
 
-    return {"updated": updated, "updates": updates}
+
+def _age_seconds(timestamp: Optional[str], now: datetime) -> float:
+    try:
+        return (now - datetime.fromisoformat(timestamp)).total_seconds()
+    except (TypeError, ValueError):
+        return float("inf")  # Unknown submission time: treat as overdue
+
+
+SWEEP_STORE = JsonStore(HEYGEN_SWEEP_FILE)
+
+
+def _claim_sweep(state: dict) -> bool:
+    """Let one worker per interval run the sweep."""
+    now = time.time()
+    if now - state.get("last_sweep_at", 0) < HEYGEN_SWEEP_INTERVAL:
+        return False
+    state["last_sweep_at"] = now
+    return True
+
+
+async def sweep_translations_forever():
+    """Safety net for lost webhooks: periodically poll long-running jobs."""
+    while True:
+        await asyncio.sleep(HEYGEN_SWEEP_INTERVAL)
+        try:
+            if await asyncio.to_thread(SWEEP_STORE.update, _claim_sweep):
+                updates = await asyncio.to_thread(poll_translations, HEYGEN_SWEEP_MIN_AGE)
+                if updates:
+                    logger.warning(
+                        f"Status sweep found {len(updates)} translations without a webhook"
+                    )
+        except Exception as e:
+            logger.error(f"Translation status sweep failed: {e}")
+
+
+@app.post("/api/translations/check")
+async def check_translations():
+    """Check status of all processing translations with HeyGen."""
+    updates = await asyncio.to_thread(poll_translations)
+    return {"updated": bool(updates), "updates": updates}
+
+
+@app.post("/api/webhooks/heygen")
+async def heygen_webhook(request: Request):
+    """
+    Receive HeyGen translation callbacks.
+
+    The Signature header must be the HMAC-SHA256 of the body under
+    HEYGEN_WEBHOOK_SECRET. Redelivered callbacks are acknowledged without
+    changing anything.
+
+    Returns:
+        {"outcome": "updated" | "duplicate" | "unknown_job" | "ignored"}
+    """
+    body = await request.body()
+    if not verify_signature(HEYGEN_WEBHOOK_SECRET, body, request.headers.get("Signature", "")):
+        raise HTTPException(status_code=401, detail="Invalid signature")
+    try:
+        event = codec.loads(body)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid JSON")
+
+    update = parse_translation_event(event) if isinstance(event, dict) else None
+    if update is None:
+        return {"outcome": "ignored"}
+    # update_translations takes the cross-process file lock; keep it off the event loop
+    outcome = await asyncio.to_thread(
+        update_translations, lambda translations: apply_translation_update(translations, update)
+    )
+    if outcome == "unknown_job":
+        logger.warning(f"HeyGen callback for unknown job {update.job_id} ({update.callback_id})")
+    else:
+        logger.info(f"HeyGen callback for job {update.job_id}: {update.status} ({outcome})")
+    return {"outcome": outcome}
 
 
 @app.get("/api/languages")
@@ -404,6 +988,7 @@ async def get_transcript(video_id: str, lang: Optional[str] = None, refresh: boo
     # Check stored transcripts first (unless refresh requested)
     if not refresh:
         stored = load_transcripts()
+        metrics.record_cache("transcripts", hit=video_id in stored)
         if video_id in stored:
             return stored[video_id]
 
@@ -421,83 +1006,121 @@ async def get_transcript(video_id: str, lang: Optional[str] = None, refresh: boo
                 "message": "Translated video available - transcript embedded in video"
             }
 
-    # Get video title from cache
-    videos, _ = load_cached_videos()
-    video_title = "Unknown"
-    for v in videos:
-        if v.get("video_id") == video_id:
-            video_title = v.get("title", "Unknown")
-            break
-
-    # Fetch from Video MCP
+    # Fetch from Video MCP and store (blocking HTTP and the file lock, so off the event loop)
     try:
-        resp = requests.post(
-            f"{VIDEO_MCP_URL}/mcp/tools/call",
-            json={"name": "video_get_transcript", "arguments": {"video_id": video_id}},
-            timeout=30
-        )
+        return await asyncio.to_thread(fetch_transcript_record, video_id)
+    except HTTPException as e:
+        if e.status_code != 404:
+            raise
+        return {
+            "video_id": video_id,
+            "source": "video_mcp",
+            "language": "en",
+            "transcript": None,
+            "error": e.detail
+        }
 
-        if resp.status_code == 404:
-            return {
-                "video_id": video_id,
-                "source": "video_mcp",
-                "language": "en",
-                "transcript": None,
-                "error": "Transcript not available"
-            }
 
-        resp.raise_for_status()
-        data = resp.json()
+# Parsed segment index per video, tagged with the transcripts file version it
+# was checked against, so a warm lookup only stats the file and bisects
+TRANSCRIPT_INDEXES: TTLCache = TTLCache("transcript_index", maxsize=256, ttl=3600)
+# Recent failed fetches, so lookups for a video without a transcript don't
+# call Video MCP every time
+TRANSCRIPT_FETCH_FAILURES: TTLCache = TTLCache("transcript_fetch_failures", maxsize=1024, ttl=300)
 
-        if "error" in data:
-            return {
-                "video_id": video_id,
-                "source": "video_mcp",
-                "language": "en",
-                "transcript": None,
-                "error": data.get("error", "Unknown error")
-            }
 
-        # Extract transcript text - MCP returns segments with text
-        segments = data.get("segments", [])
-        if segments:
-            transcript_text = " ".join(seg.get("text", "") for seg in segments)
+async def load_transcript_index(video_id: str) -> tuple[str, TranscriptIndex]:
+    """
+    Title and segment index of a video's transcript.
+
+    The stored transcript is only re-read when transcripts.json has
+    changed, and fetched if it was stored without segments.
+
+    Raises:
+        HTTPException: 404 if the transcript has no timed segments
+    """
+    current = TRANSCRIPTS_STORE.version()
+    cached = TRANSCRIPT_INDEXES.get(video_id)
+    if cached is None or cached[0] != current:
+        # A recent failed fetch stands until someone stores a transcript
+        failure = TRANSCRIPT_FETCH_FAILURES.get(video_id)
+        if failure is not None and failure[0] == current:
+            raise HTTPException(status_code=failure[1], detail=failure[2])
+
+        stored, version = await asyncio.to_thread(TRANSCRIPTS_STORE.read_versioned)
+        record = stored.get(video_id)
+        if not record or "segments" not in record:
+            # Never fetched, or stored before segments were kept
+            try:
+                record = await asyncio.to_thread(fetch_transcript_record, video_id)
+            except HTTPException as e:
+                TRANSCRIPT_FETCH_FAILURES.set(video_id, (version, e.status_code, e.detail))
+                raise
+            version = TRANSCRIPTS_STORE.version()
+
+        fetched_at = record.get("fetched_at")
+        if cached is not None and cached[1] == fetched_at:
+            index = cached[3]  # Another transcript changed; this one is as parsed
         else:
-            transcript_text = data.get("transcript", data.get("text", ""))
+            index = TranscriptIndex.from_record(record)
+        cached = (version, fetched_at, record.get("title", "Unknown"), index)
+        TRANSCRIPT_INDEXES.set(video_id, cached)
 
-        if not transcript_text:
-            return {
-                "video_id": video_id,
-                "source": "video_mcp",
-                "language": "en",
-                "transcript": None,
-                "error": "No transcript content in response"
-            }
+    _, _, title, index = cached
+    if index is None or not len(index):
+        raise HTTPException(status_code=404, detail="No timed transcript segments for this video")
+    return title, index
 
-        # Build result and save to storage
-        result = {
-            "video_id": video_id,
-            "title": video_title,
-            "source": "video_mcp",
-            "language": "en",
-            "transcript": transcript_text,
-            "fetched_at": datetime.now().isoformat(),
-            "word_count": len(transcript_text.split())
-        }
 
-        # Save to storage
-        stored = load_transcripts()
-        stored[video_id] = result
-        save_transcripts(stored)
+@app.get("/api/transcript/{video_id}/at")
+async def get_transcript_at(video_id: str, t: float = Query(..., ge=0)):
+    """
+    What was said at `t` seconds into a video.
 
-        return result
+    Returns:
+        The segment being spoken at t (in a pause, the one that just
+        ended) and a deep link to its start
+    """
+    title, index = await load_transcript_index(video_id)
+    row = index.at(t)
+    if row is None:
+        raise HTTPException(status_code=404, detail=f"No transcript segment at {t:g}s")
+    segment = index.segment(row)
+    return {
+        "video_id": video_id,
+        "title": title,
+        "t": t,
+        "segment": segment,
+        "url": f"https://www.youtube.com/watch?v={video_id}&t={int(segment['start'])}s"
+    }
 
-    except requests.exceptions.ConnectionError:
-        raise HTTPException(status_code=503, detail="Cannot connect to Video MCP")
-    except requests.exceptions.Timeout:
-        raise HTTPException(status_code=504, detail="Timeout fetching transcript")
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+
+@app.get("/api/transcript/{video_id}/range")
+async def get_transcript_range(
+    video_id: str,
+    start: float = Query(..., alias="from", ge=0),
+    end: float = Query(..., alias="to", ge=0),
+):
+    """
+    Transcript segments overlapping [from, to] seconds.
+
+    Returns:
+        The segments in time order and their combined text
+    """
+    if end < start:
+        raise HTTPException(status_code=400, detail="'to' must not be before 'from'")
+    title, index = await load_transcript_index(video_id)
+    rows = index.between(start, end)
+    return {
+        "video_id": video_id,
+        "title": title,
+        "from": start,
+        "to": end,
+        "count": len(rows),
+        "segments": [index.segment(row) for row in rows],
+        "text": index.span_text(rows),
+        "url": f"https://www.youtube.com/watch?v={video_id}&t={int(start)}s"
+    }
 
 
 @app.post("/api/transcripts/fetch-all")
@@ -506,7 +1129,7 @@ async def fetch_all_transcripts():
     videos, _ = load_cached_videos()
     stored = load_transcripts()
 
-    fetched = []
+    fetched = {}
     failed = []
     skipped = 0
 
@@ -519,41 +1142,22 @@ async def fetch_all_transcripts():
             continue
 
         try:
-            resp = requests.post(
-                f"{VIDEO_MCP_URL}/mcp/tools/call",
-                json={"name": "video_get_transcript", "arguments": {"video_id": video_id}},
-                timeout=30
-            )
+            resp = call_video_mcp_transcript(video_id)
 
             if resp.status_code == 404:
                 failed.append({"video_id": video_id, "error": "Not found"})
                 continue
 
             resp.raise_for_status()
-            data = resp.json()
+            data = codec.loads(resp.content)
 
             if "error" in data:
                 failed.append({"video_id": video_id, "error": data.get("error", "Unknown")})
                 continue
 
-            # Extract transcript text
-            segments = data.get("segments", [])
-            if segments:
-                transcript_text = " ".join(seg.get("text", "") for seg in segments)
-            else:
-                transcript_text = data.get("transcript", data.get("text", ""))
-
-            if transcript_text:
-                stored[video_id] = {
-                    "video_id": video_id,
-                    "title": video.get("title", "Unknown"),
-                    "source": "video_mcp",
-                    "language": "en",
-                    "transcript": transcript_text,
-                    "fetched_at": datetime.now().isoformat(),
-                    "word_count": len(transcript_text.split())
-                }
-                fetched.append(video_id)
+            record = transcript_record(video_id, video.get("title", "Unknown"), data)
+            if record is not None:
+                fetched[video_id] = record
             else:
                 failed.append({"video_id": video_id, "error": "Empty transcript"})
 
@@ -563,14 +1167,19 @@ async def fetch_all_transcripts():
             failed.append({"video_id": video_id, "error": str(e)})
 
     # Save all fetched transcripts
+    total_stored = len(stored)
     if fetched:
-        save_transcripts(stored)
+        def add_fetched(current: dict) -> int:
+            current.update(fetched)
+            return len(current)
+
+        total_stored = update_transcripts(add_fetched)
 
     return {
         "fetched": len(fetched),
         "failed": len(failed),
         "already_stored": skipped,
-        "total_stored": len(stored),
+        "total_stored": total_stored,
         "failures": failed[:5]
     }
 
@@ -585,6 +1194,8 @@ def generate_video_summary(transcript: str, title: str, style: str = "brief") ->
     if not api_key:
         raise HTTPException(status_code=500, detail="ANTHROPIC_API_KEY not available")
 
+    import anthropic  # Imported on first use; it dominates web.py startup time
+
     client = anthropic.Anthropic(api_key=api_key)
 
     # Truncate transcript if too long (keep first ~8000 words)
@@ -630,11 +1241,12 @@ Transcript:
 {transcript}"""
 
     try:
-        response = client.messages.create(
-            model="claude-sonnet-4-20250514",
-            max_tokens=1024,
-            messages=[{"role": "user", "content": prompt}]
-        )
+        with metrics.track_upstream("anthropic", "summary"):
+            response = client.messages.create(
+                model="claude-sonnet-4-20250514",
+                max_tokens=1024,
+                messages=[{"role": "user", "content": prompt}]
+            )
         return response.content[0].text
     except Exception as e:
         logger.error(f"Claude API error: {e}")
@@ -642,7 +1254,7 @@ Transcript:
 
 
 @app.get("/api/video/summary/{video_id}")
-async def get_video_summary(video_id: str, style: str = "brief"):
+async def get_video_summary(request: Request, video_id: str, style: str = "brief"):
     """
     Generate a summary of a video.
 
@@ -652,69 +1264,27 @@ async def get_video_summary(video_id: str, style: str = "brief"):
                or "bullets" (bullet points)
 
     Returns:
-        Video summary with metadata
+        Video summary with metadata (503 with Retry-After when too many
+        Claude calls are already running or queued, see admission.py)
     """
     # First get the transcript
     stored = load_transcripts()
 
-    if video_id in stored and stored[video_id].get("transcript"):
+    cached = video_id in stored and bool(stored[video_id].get("transcript"))
+    metrics.record_cache("transcripts", hit=cached)
+    if cached:
         transcript_data = stored[video_id]
     else:
-        # Fetch transcript from Video MCP
-        try:
-            resp = requests.post(
-                f"{VIDEO_MCP_URL}/mcp/tools/call",
-                json={"name": "video_get_transcript", "arguments": {"video_id": video_id}},
-                timeout=30
-            )
-
-            if resp.status_code == 404:
-                raise HTTPException(status_code=404, detail="Transcript not available for this video")
-
-            resp.raise_for_status()
-            data = resp.json()
-
-            if "error" in data:
-                raise HTTPException(status_code=404, detail=data.get("error", "Transcript not found"))
-
-            # Extract transcript text
-            segments = data.get("segments", [])
-            if segments:
-                transcript_text = " ".join(seg.get("text", "") for seg in segments)
-            else:
-                transcript_text = data.get("transcript", data.get("text", ""))
-
-            if not transcript_text:
-                raise HTTPException(status_code=404, detail="No transcript content available")
-
-            # Get video title
-            videos, _ = load_cached_videos()
-            video_title = "Unknown"
-            for v in videos:
-                if v.get("video_id") == video_id:
-                    video_title = v.get("title", "Unknown")
-                    break
-
-            transcript_data = {
-                "video_id": video_id,
-                "title": video_title,
-                "transcript": transcript_text
-            }
-
-        except requests.exceptions.ConnectionError:
-            raise HTTPException(status_code=503, detail="Cannot connect to Video MCP")
-        except requests.exceptions.Timeout:
-            raise HTTPException(status_code=504, detail="Timeout fetching transcript")
-        except HTTPException:
-            raise
-        except Exception as e:
-            raise HTTPException(status_code=500, detail=str(e))
+        # Fetch from Video MCP; the stored record keeps the segment timings
+        transcript_data = await asyncio.to_thread(fetch_transcript_record, video_id)
 
     # Generate summary
     title = transcript_data.get("title", "Unknown")
     transcript = transcript_data.get("transcript", "")
 
-    summary = generate_video_summary(transcript, title, style)
+    # Admission-controlled; the blocking Claude call runs off the event loop
+    async with LLM_ADMISSION.admit(client_id(request)):
+        summary = await asyncio.to_thread(generate_video_summary, transcript, title, style)
 
     return {
         "video_id": video_id,
@@ -736,6 +1306,8 @@ def answer_video_question(transcript: str, title: str, question: str) -> str:
     if not api_key:
         raise HTTPException(status_code=500, detail="ANTHROPIC_API_KEY not available")
 
+    import anthropic
+
     client = anthropic.Anthropic(api_key=api_key)
 
     # Truncate transcript if too long
@@ -755,11 +1327,12 @@ User Question: {question}
 Provide a clear, helpful answer based on the video content. If the answer isn't in the transcript, say so politely. Keep your response concise but informative."""
 
     try:
-        response = client.messages.create(
-            model="claude-sonnet-4-20250514",
-            max_tokens=1024,
-            messages=[{"role": "user", "content": prompt}]
-        )
+        with metrics.track_upstream("anthropic", "ask"):
+            response = client.messages.create(
+                model="claude-sonnet-4-20250514",
+                max_tokens=1024,
+                messages=[{"role": "user", "content": prompt}]
+            )
         return response.content[0].text
     except Exception as e:
         logger.error(f"Claude API error: {e}")
@@ -767,7 +1340,7 @@ Provide a clear, helpful answer based on the video content. If the answer isn't
 
 
 @app.post("/api/video/ask")
-async def ask_video_question(req: VideoQuestionRequest):
+async def ask_video_question(request: Request, req: VideoQuestionRequest):
     """
     Ask a question about a specific video.
 
@@ -775,7 +1348,7 @@ async def ask_video_question(req: VideoQuestionRequest):
         req: VideoQuestionRequest with video_id, question, and optional title
 
     Returns:
-        Answer based on video transcript
+        Answer based on video transcript (503 with Retry-After under overload)
     """
     video_id = req.video_id
     question = req.question
@@ -786,67 +1359,20 @@ async def ask_video_question(req: VideoQuestionRequest):
     # Get transcript
     stored = load_transcripts()
 
-    if video_id in stored and stored[video_id].get("transcript"):
+    cached = video_id in stored and bool(stored[video_id].get("transcript"))
+    metrics.record_cache("transcripts", hit=cached)
+    if cached:
         transcript_data = stored[video_id]
     else:
-        # Fetch transcript from Video MCP
-        try:
-            resp = requests.post(
-                f"{VIDEO_MCP_URL}/mcp/tools/call",
-                json={"name": "video_get_transcript", "arguments": {"video_id": video_id}},
-                timeout=30
-            )
-
-            if resp.status_code == 404:
-                raise HTTPException(status_code=404, detail="Transcript not available for this video")
-
-            resp.raise_for_status()
-            data = resp.json()
-
-            if "error" in data:
-                raise HTTPException(status_code=404, detail=data.get("error", "Transcript not found"))
-
-            # Extract transcript text
-            segments = data.get("segments", [])
-            if segments:
-                transcript_text = " ".join(seg.get("text", "") for seg in segments)
-            else:
-                transcript_text = data.get("transcript", data.get("text", ""))
-
-            if not transcript_text:
-                raise HTTPException(status_code=404, detail="No transcript content available")
-
-            # Get video title if not provided
-            title = req.title
-            if not title:
-                videos, _ = load_cached_videos()
-                for v in videos:
-                    if v.get("video_id") == video_id:
-                        title = v.get("title", "Unknown")
-                        break
-                if not title:
-                    title = "Unknown"
-
-            transcript_data = {
-                "video_id": video_id,
-                "title": title,
-                "transcript": transcript_text
-            }
-
-        except requests.exceptions.ConnectionError:
-            raise HTTPException(status_code=503, detail="Cannot connect to Video MCP")
-        except requests.exceptions.Timeout:
-            raise HTTPException(status_code=504, detail="Timeout fetching transcript")
-        except HTTPException:
-            raise
-        except Exception as e:
-            raise HTTPException(status_code=500, detail=str(e))
+        # Fetch from Video MCP; the stored record keeps the segment timings
+        transcript_data = await asyncio.to_thread(fetch_transcript_record, video_id)
 
     # Get answer
     title = req.title or transcript_data.get("title", "Unknown")
     transcript = transcript_data.get("transcript", "")
 
-    answer = answer_video_question(transcript, title, question)
+    async with LLM_ADMISSION.admit(client_id(request)):
+        answer = await asyncio.to_thread(answer_video_question, transcript, title, question)
 
     return {
         "video_id": video_id,